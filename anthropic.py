@@ -1,8 +1,41 @@
 import os
 import re
 import asyncio
+import time
 from playwright.async_api import async_playwright
 
+from common.answer_bank import bank_answers, hold_answers, typed_answers
+from common.applied_jobs import FILLED, already_applied, mark_applied
+from common.job_urls import same_posting
+from common.option_sets import harvest_greenhouse_options, validate_answers
+from common.deadline import bounded, enforce_deadline
+from common.lifecycle import browser_page
+from common.failure_capture import capture_failures
+from common.motion import suppress_motion, wait_until_settled
+from common.pacing import paced
+from common.profile import env_profile
+from common.run_trace import traced
+
+ANTHROPIC_JOB_URL = "https://job-boards.greenhouse.io/anthropic/jobs/4020350008"
+ESSAY_QUESTIONS = {
+    "why_anthropic": "Why Anthropic?",
+    "impressive_achievement": "What is the most impressive low-level performance work you have done?",
+    "additional_info": "Additional Information",
+}
+# Dropdown parameters and their question labels, for harvesting option sets
+DROPDOWN_QUESTIONS = {
+    "in_person_work": "in-person",
+    "ai_policy": "AI Policy",
+    "relocation_open": "open to relocation",
+    "previous_interview": "interviewed at Anthropic",
+    "visa_sponsorship": "visa sponsorship",
+    "gender": "Gender",
+    "hispanic_latino": "Hispanic/Latino",
+    "race": "identify your race",
+    "veteran_status": "Veteran Status",
+    "disability_status": "Disability Status",
+}
+
 
 async def fill_anthropic_job_application(
     page,
@@ -67,9 +100,10 @@ async def fill_anthropic_job_application(
             No, I do not have a disability and have not had one in the past, I do not want to answer
     """
 
-    # Navigate to the job application page
-    await page.goto("https://job-boards.greenhouse.io/anthropic/jobs/4020350008", wait_until="load")
-    await page.wait_for_timeout(1500)
+    # Navigate to the job application page, unless a runner already opened it
+    if not same_posting(page.url, ANTHROPIC_JOB_URL):
+        await page.goto(ANTHROPIC_JOB_URL, wait_until="load")
+        await page.wait_for_timeout(1500)
 
     # ==================== SECTION 1: BASIC INFORMATION ====================
 
@@ -94,7 +128,7 @@ async def fill_anthropic_job_application(
     # Select Country Code for Phone
     country_dropdown = page.get_by_role("combobox", name=re.compile(r"^Country\*?$"))
     await country_dropdown.click()
-    await page.wait_for_timeout(500)
+    await wait_until_settled(page)
     await page.get_by_role("option", name=re.compile(f"^{re.escape(country_phone)}$")).click()
     await page.wait_for_timeout(300)
 
@@ -143,7 +177,7 @@ async def fill_anthropic_job_application(
     # Select In-Person Work Preference
     in_person_dropdown = page.get_by_role("combobox", name=re.compile(r".*in-person.*25%.*", flags=re.IGNORECASE | re.DOTALL))
     await in_person_dropdown.click()
-    await page.wait_for_timeout(500)
+    await wait_until_settled(page)
     await page.get_by_role("option", name=in_person_work).click()
     await page.wait_for_timeout(300)
 
@@ -166,7 +200,7 @@ async def fill_anthropic_job_application(
     # Select AI Policy
     ai_policy_dropdown = page.get_by_role("combobox", name=re.compile(r".*AI Policy.*", flags=re.IGNORECASE))
     await ai_policy_dropdown.click()
-    await page.wait_for_timeout(500)
+    await wait_until_settled(page)
     await page.get_by_role("option", name=ai_policy).click()
     await page.wait_for_timeout(300)
 
@@ -193,7 +227,7 @@ async def fill_anthropic_job_application(
     # Fill relocation dropdown
     relocation_combo = page.get_by_role("combobox", name="Are you open to relocation for this role?")
     await relocation_combo.click()
-    await page.wait_for_timeout(500)
+    await wait_until_settled(page)
     await page.get_by_role("option", name=relocation_open).click()
     await page.wait_for_timeout(500)
 
@@ -204,14 +238,14 @@ async def fill_anthropic_job_application(
     # Fill previous interview dropdown
     interview_combo = page.get_by_role("combobox", name="Have you ever interviewed at Anthropic before?")
     await interview_combo.click()
-    await page.wait_for_timeout(500)
+    await wait_until_settled(page)
     await page.get_by_role("option", name=previous_interview).click()
     await page.wait_for_timeout(500)
 
     # Fill visa sponsorship dropdown
     visa_combo = page.get_by_role("combobox", name="Do you require visa sponsorship?")
     await visa_combo.click()
-    await page.wait_for_timeout(500)
+    await wait_until_settled(page)
     await page.get_by_role("option", name=visa_sponsorship).click()
     await page.wait_for_timeout(500)
 
@@ -222,28 +256,28 @@ async def fill_anthropic_job_application(
     # Fill gender dropdown
     gender_combo = page.get_by_role("combobox", name="Gender")
     await gender_combo.click()
-    await page.wait_for_timeout(500)
+    await wait_until_settled(page)
     await page.get_by_role("option", name=gender).click()
     await page.wait_for_timeout(500)
 
     # Fill Hispanic/Latino dropdown
     hispanic_combo = page.get_by_role("combobox", name="Are you Hispanic/Latino?")
     await hispanic_combo.click()
-    await page.wait_for_timeout(500)
+    await wait_until_settled(page)
     await page.get_by_role("option", name=hispanic_latino).click()
     await page.wait_for_timeout(500)
 
     # Fill race dropdown
     race_combo = page.get_by_role("combobox", name="Please identify your race")
     await race_combo.click()
-    await page.wait_for_timeout(500)
+    await wait_until_settled(page)
     await page.get_by_role("option", name=race).click()
     await page.wait_for_timeout(500)
 
     # Fill veteran status dropdown
     veteran_combo = page.get_by_role("combobox", name="Veteran Status")
     await veteran_combo.click()
-    await page.wait_for_timeout(500)
+    await wait_until_settled(page)
     await page.get_by_role("option", name=veteran_status).click()
     await page.wait_for_timeout(500)
 
@@ -254,7 +288,7 @@ async def fill_anthropic_job_application(
     # Fill disability status dropdown
     disability_combo = page.get_by_role("combobox", name="Disability Status")
     await disability_combo.click()
-    await page.wait_for_timeout(500)
+    await wait_until_settled(page)
     await page.get_by_role("option", name=disability_status).click()
     await page.wait_for_timeout(500)
 
@@ -262,29 +296,48 @@ async def fill_anthropic_job_application(
     print("Job application form filled successfully!")
 
 
+async def prepare_answers() -> dict:
+    """
+    Answers for fill_anthropic_job_application, checked before a browser is started.
+
+    Approved essay answers come from the answer bank and a profile named by
+    JOB_APPLY_PROFILE overrides them; answers that match no option fail here.
+    """
+    await harvest_greenhouse_options(ANTHROPIC_JOB_URL, DROPDOWN_QUESTIONS)  # Unknown option sets only
+    profile = env_profile()
+    answers = {
+        **bank_answers("Anthropic", ESSAY_QUESTIONS),
+        **(profile.arguments(fill_anthropic_job_application, "greenhouse") if profile else {}),
+    }
+    return validate_answers(ANTHROPIC_JOB_URL, fill_anthropic_job_application, **answers)
+
+
+def finish_application(answers: dict) -> None:
+    """Record the filled application; it was not submitted, so its essays wait for approval."""
+    mark_applied(ANTHROPIC_JOB_URL, status=FILLED)  # Stops before submitting
+    hold_answers(ANTHROPIC_JOB_URL, "Anthropic", ESSAY_QUESTIONS, typed_answers(fill_anthropic_job_application, ESSAY_QUESTIONS, answers))
+
+
 if __name__ == "__main__":
     CDP_URL = "http://localhost:9222"  # Set to None for new browser
 
     async def main():
-        async with async_playwright() as p:
-            if CDP_URL:
-                # Connect to existing browser via CDP
-                browser = await p.chromium.connect_over_cdp(CDP_URL)
-                ctx = browser.contexts[0]
-                page = await ctx.new_page()
-            else:
-                # Launch new headless browser
-                browser = await p.chromium.launch(headless=False)
-                page = await browser.new_page()
-
-            try:
-                # Call the function with custom parameters or defaults
-                await fill_anthropic_job_application(page)
-
-                # Optional: Wait before closing to see results
-                await page.wait_for_timeout(2000)
-
-            finally:
-                await browser.close()
+        if already_applied(ANTHROPIC_JOB_URL):
+            return
+        answers = await prepare_answers()
+
+        async with async_playwright() as p, browser_page(p, CDP_URL, headless=False) as page:
+            page = traced(paced(bounded(page, "greenhouse"), "greenhouse"), "greenhouse", ANTHROPIC_JOB_URL)
+            started = time.perf_counter()
+            await suppress_motion(page)  # react-select menus open without animating
+            # Call the function with custom parameters or defaults
+            async with capture_failures(page, "anthropic"), enforce_deadline(page):
+                await fill_anthropic_job_application(page, **answers)
+            print(page.pacer.summary(time.perf_counter() - started))
+            page.trace.write()
+            finish_application(answers)
+
+            # Optional: Wait before closing to see results
+            await page.wait_for_timeout(2000)
 
     asyncio.run(main())
@@ -0,0 +1,241 @@
+"""
+Local bank of approved free-text answers, looked up by question similarity.
+
+Essay questions repeat across postings with small wording changes ("Why
+Anthropic?", "Why do you want to join Figma?"). Approved answers are stored
+with the company name replaced by a {company} placeholder, indexed by their
+normalized question text, and matched with TF-IDF cosine similarity
+(common.similarity), so a lookup is one matrix-vector product and only
+true misses need a human.
+
+Only answers that went out are learned. A workflow that submits approves the
+values it typed once the submit succeeded; one that stops before submitting
+holds them for its job URL until they are approved by hand:
+
+    python common/answer_bank.py approve https://job-boards.greenhouse.io/anthropic/jobs/4020350008
+"""
+
+import inspect
+import re
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.similarity import TfidfIndex
+from common.storage import connect
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    normalized TEXT PRIMARY KEY,
+    question TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    updated_at REAL NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS held_answers (
+    job_url TEXT NOT NULL,
+    question TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    company TEXT NOT NULL,
+    PRIMARY KEY (job_url, question)
+) WITHOUT ROWID;
+"""
+
+PLACEHOLDER = "{company}"
+MIN_SIMILARITY = 0.45
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+# Function words and form boilerplate ("tell us", "please describe", "want to join")
+STOPWORDS = frozenset(
+    "a an and are at be by describe do does for from have has i in is it join like me my of "
+    "on or our please so tell that the this to us want we what would you your".split()
+)
+
+
+@dataclass(frozen=True, slots=True)
+class AnswerMatch:
+    """A stored answer rendered for the asking company."""
+
+    answer: str
+    question: str  # Normalized stored question that matched
+    score: float  # Cosine similarity in [0, 1]
+
+
+def normalize_question(question: str, company: str = "") -> str:
+    """Lower-case a question, replace the company name with "company" and drop punctuation."""
+    text = question.casefold()
+    if company:
+        text = re.sub(rf"\b{re.escape(company.casefold())}\b", " company ", text)
+    return " ".join(TOKEN_PATTERN.findall(text))
+
+
+def _terms(normalized: str) -> list[str]:
+    return [word for word in normalized.split() if word not in STOPWORDS]
+
+
+def _template(answer: str, company: str) -> str:
+    if not company:
+        return answer
+    return re.sub(rf"\b{re.escape(company)}\b", PLACEHOLDER, answer)
+
+
+class AnswerBank:
+    """Approved answers in SQLite plus a lazily built TF-IDF index."""
+
+    def __init__(self, db_name: str = "answers.sqlite3"):
+        self.conn = connect(db_name, SCHEMA)
+        self._rows: list[tuple[str, str]] | None = None  # (normalized question, answer template)
+        self._index: TfidfIndex | None = None
+
+    def _build(self) -> None:
+        rows = self.conn.execute("SELECT normalized, answer FROM answers ORDER BY normalized").fetchall()
+        self._rows = [(row["normalized"], row["answer"]) for row in rows]
+        self._index = TfidfIndex([_terms(normalized) for normalized, _ in self._rows])
+
+    def lookup(self, question: str, company: str = "", min_similarity: float = MIN_SIMILARITY) -> AnswerMatch | None:
+        """
+        Find the stored answer whose question is most similar.
+
+        Args:
+            question: Question text as shown on the form
+            company: Company the application is for; fills the {company} placeholder
+            min_similarity: Lowest cosine similarity accepted as a hit
+
+        Returns:
+            The best match rendered for `company`, or None on a miss
+        """
+        if self._rows is None:
+            self._build()
+        if not self._rows:
+            return None
+
+        best, score = self._index.best(_terms(normalize_question(question, company)))
+        if score < min_similarity:
+            return None
+
+        stored_question, template = self._rows[best]
+        return AnswerMatch(template.replace(PLACEHOLDER, company or "your company"), stored_question, score)
+
+    def add(self, question: str, answer: str, company: str = "") -> None:
+        """
+        Store an approved answer, templating the company name.
+
+        Args:
+            question: Question text as shown on the form
+            answer: Approved answer text
+            company: Company the answer was written for (replaced by {company})
+        """
+        normalized = normalize_question(question, company)
+        if not normalized or not answer.strip():
+            return
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO answers (normalized, question, answer, updated_at) VALUES (?, ?, ?, ?)",
+                (normalized, question, _template(answer, company), time.time()),
+            )
+        self._rows = None  # Rebuild the index on next lookup
+
+    def hold(self, job_url: str, question: str, answer: str, company: str = "") -> None:
+        """Keep an answer typed into an unsubmitted form until it is approved for `job_url`."""
+        if not answer.strip():
+            return
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO held_answers (job_url, question, answer, company) VALUES (?, ?, ?, ?)",
+                (job_url, question, answer, company),
+            )
+
+    def approve_held(self, job_url: str) -> int:
+        """Store the answers held for `job_url` as approved; returns how many there were."""
+        rows = self.conn.execute(
+            "SELECT question, answer, company FROM held_answers WHERE job_url = ?", (job_url,)
+        ).fetchall()
+        for row in rows:
+            self.add(row["question"], row["answer"], row["company"])
+        with self.conn:
+            self.conn.execute("DELETE FROM held_answers WHERE job_url = ?", (job_url,))
+        return len(rows)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "AnswerBank":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+_bank: AnswerBank | None = None
+
+
+def _default() -> AnswerBank:
+    global _bank
+    if _bank is None:
+        _bank = AnswerBank()
+    return _bank
+
+
+def bank_answers(company: str, questions: dict[str, str]) -> dict[str, str]:
+    """
+    Look up stored answers for a form's free-text questions.
+
+    Args:
+        company: Company the application is for (e.g., "Figma")
+        questions: Map of fill-function parameter to question text,
+                   e.g. {"why_join": "Why do you want to join Figma?"}
+
+    Returns:
+        Map of parameter to answer for the hits; misses are printed and left
+        out so the fill function's own value applies
+    """
+    answers = {}
+    for parameter, question in questions.items():
+        try:
+            match = _default().lookup(question, company)
+        except RuntimeError as e:  # numpy missing
+            print(f"Answer bank unavailable: {e}")
+            return answers
+        if match is None:
+            print(f"No stored answer for {question!r}; needs a human")
+        else:
+            print(f"Answer bank hit for {question!r} ({match.score:.2f}, from {match.question!r})")
+            answers[parameter] = match.answer
+    return answers
+
+
+def typed_answers(func, questions: dict[str, str], answers: dict) -> dict[str, str]:
+    """
+    Return the free-text values `func(page, **answers)` types for the questions.
+
+    Answers not passed fall back to the fill function's defaults, exactly as
+    in the call, so these are the values that ended up on the form.
+    """
+    bound = inspect.signature(func).bind_partial(**answers)
+    bound.apply_defaults()
+    return {parameter: bound.arguments[parameter] for parameter in questions if bound.arguments.get(parameter)}
+
+
+def approve_answers(company: str, questions: dict[str, str], answers: dict) -> None:
+    """Store the answers of a confirmed submission, keyed by their question text."""
+    bank = _default()
+    for parameter, question in questions.items():
+        if answers.get(parameter):
+            bank.add(question, answers[parameter], company)
+
+
+def hold_answers(job_url: str, company: str, questions: dict[str, str], answers: dict) -> None:
+    """Hold the answers typed into a form that was not submitted until they are approved."""
+    bank = _default()
+    for parameter, question in questions.items():
+        if answers.get(parameter):
+            bank.hold(job_url, question, answers[parameter], company)
+    print(f"Answers held; after submitting, run: python common/answer_bank.py approve {job_url}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3 or sys.argv[1] != "approve":
+        sys.exit("Usage: python common/answer_bank.py approve <job_url>")
+    print(f"Approved {_default().approve_held(sys.argv[2])} answers for {sys.argv[2]}")
@@ -0,0 +1,198 @@
+"""
+Persistent set of jobs we have already applied to, keyed on canonical job id.
+
+Lookups go through an in-memory Bloom filter first; only possible hits reach
+SQLite. A negative answer (the common case when scanning new postings) never
+touches disk, which keeps lookups cheap at millions of entries.
+
+The filter is persisted every BLOOM_SAVE_EVERY new entries and on close (the
+shared set closes at exit). A filter left behind by a crash no longer matches
+the row count and is rebuilt from SQLite on the next open.
+
+Workflows that stop before submitting record the job as FILLED. That keeps a
+record of the run without deduping the job, so a later run still applies.
+"""
+
+import atexit
+import hashlib
+import math
+import time
+
+from common.job_urls import canonical_job_id, platform_of
+from common.storage import connect
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS applied_jobs (
+    job_id TEXT PRIMARY KEY,
+    platform TEXT NOT NULL,
+    url TEXT,
+    status TEXT NOT NULL,
+    applied_at REAL NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS bloom (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    capacity INTEGER NOT NULL,
+    entries INTEGER NOT NULL,
+    bits BLOB NOT NULL
+);
+"""
+
+FALSE_POSITIVE_RATE = 0.01
+MIN_CAPACITY = 100_000
+BLOOM_SAVE_EVERY = 1000  # New entries between filter writes
+
+FILLED = "filled"  # Form filled but not submitted; not a dedupe hit
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings using double hashing."""
+
+    def __init__(self, capacity: int, error_rate: float = FALSE_POSITIVE_RATE, bits: bytes | None = None):
+        self.capacity = capacity
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray(bits) if bits is not None else bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class AppliedJobs:
+    """Applied-job set backed by SQLite with a Bloom filter in front."""
+
+    def __init__(self, db_name: str = "applied_jobs.sqlite3"):
+        self.conn = connect(db_name, SCHEMA)
+        self.entries = self.conn.execute("SELECT COUNT(*) FROM applied_jobs").fetchone()[0]
+        self._bloom_dirty = False
+        self._unsaved = 0  # Entries added since the filter was last written
+        self._load_bloom()
+
+    def _load_bloom(self) -> None:
+        row = self.conn.execute("SELECT capacity, entries, bits FROM bloom WHERE id = 1").fetchone()
+        if row and row["entries"] == self.entries and self.entries <= row["capacity"]:
+            self.bloom = BloomFilter(row["capacity"], bits=row["bits"])
+            return
+        self._rebuild_bloom(max(MIN_CAPACITY, self.entries * 2))
+
+    def _rebuild_bloom(self, capacity: int) -> None:
+        self.bloom = BloomFilter(capacity)
+        for (job_id,) in self.conn.execute("SELECT job_id FROM applied_jobs"):
+            self.bloom.add(job_id)
+        self._bloom_dirty = True
+
+    def _save_bloom(self) -> None:
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO bloom (id, capacity, entries, bits) VALUES (1, ?, ?, ?)",
+                (self.bloom.capacity, self.entries, bytes(self.bloom.bits)),
+            )
+        self._bloom_dirty = False
+        self._unsaved = 0
+
+    def close(self) -> None:
+        if self._bloom_dirty:
+            self._save_bloom()
+        self.conn.close()
+
+    def __enter__(self) -> "AppliedJobs":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __contains__(self, job_url: str) -> bool:
+        job_id = canonical_job_id(job_url)
+        if job_id is None or job_id not in self.bloom:
+            return False
+        row = self.conn.execute("SELECT status FROM applied_jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return row is not None and row["status"] != FILLED
+
+    def add(self, job_url: str, status: str = "applied") -> str | None:
+        """
+        Record a job as applied.
+
+        Args:
+            job_url: Any URL variant of the job
+            status: Outcome to record (e.g., "applied", "submitted", or FILLED);
+                    a FILLED record is upgraded by a later status
+
+        Returns:
+            The canonical job id that was stored, or None if the URL does not identify a job
+        """
+        job_id = canonical_job_id(job_url)
+        if job_id is None:
+            return None
+        with self.conn:
+            inserted = self.conn.execute(
+                "INSERT OR IGNORE INTO applied_jobs (job_id, platform, url, status, applied_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (job_id, platform_of(job_url), job_url, status, time.time()),
+            ).rowcount
+            if not inserted and status != FILLED:
+                self.conn.execute(
+                    "UPDATE applied_jobs SET status = ?, url = ?, applied_at = ? WHERE job_id = ? AND status = ?",
+                    (status, job_url, time.time(), job_id, FILLED),
+                )
+        if inserted:
+            self.entries += 1
+            if self.entries > self.bloom.capacity:
+                self._rebuild_bloom(self.bloom.capacity * 2)
+            else:
+                self.bloom.add(job_id)
+            self._bloom_dirty = True
+            self._unsaved += 1
+            if self._unsaved >= BLOOM_SAVE_EVERY:
+                self._save_bloom()
+        return job_id
+
+
+_applied_jobs: AppliedJobs | None = None
+
+
+def _default() -> AppliedJobs:
+    global _applied_jobs
+    if _applied_jobs is None:
+        _applied_jobs = AppliedJobs()
+        atexit.register(_close_default)
+    return _applied_jobs
+
+
+def _close_default() -> None:
+    if _applied_jobs is not None:
+        _applied_jobs.close()
+
+
+def already_applied(job_url: str) -> bool:
+    """
+    Check the shared applied-set before spending a browser session on a job.
+
+    Args:
+        job_url: Any URL variant of the job
+
+    Returns:
+        True (and prints a skip notice) if the job was already applied to
+    """
+    if job_url in _default():
+        print(f"Skipping {job_url}: already applied ({canonical_job_id(job_url)})")
+        return True
+    return False
+
+
+def mark_applied(job_url: str, status: str = "applied") -> None:
+    """Record a finished application in the shared applied-set; status FILLED when it was not submitted."""
+    job_id = _default().add(job_url, status=status)
+    if job_id is None:
+        print(f"Not recorded: {job_url} does not identify a job")
+        return
+    print(f"Recorded application: {job_id} ({status})")
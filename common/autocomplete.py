@@ -0,0 +1,129 @@
+"""
+Learned autocomplete selection for job title, company and location fields.
+
+For each platform/field/value the cache stores the exact suggestion label the
+server returned and the shortest query prefix known to produce it. A cached
+fill types that prefix, waits only for that exact suggestion and clicks it.
+The prefix is shortened across runs by binary search: each hit probes a
+shorter prefix with a short timeout and keeps it if the label still appears.
+"""
+
+import re
+
+from playwright.async_api import Locator, Page, TimeoutError as PlaywrightTimeoutError
+
+from common.cache import KeyValueCache
+
+MIN_QUERY_LENGTH = 2
+PROBE_TIMEOUT = 1500
+
+_cache: KeyValueCache | None = None
+
+
+def _default_cache() -> KeyValueCache:
+    global _cache
+    if _cache is None:
+        _cache = KeyValueCache("autocomplete")
+    return _cache
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def best_label(value: str, labels: list[str]) -> str | None:
+    """
+    Pick the suggestion that best matches a typed value.
+
+    Args:
+        value: Value the applicant wants (e.g., "warner bros")
+        labels: Suggestion labels shown by the field
+
+    Returns:
+        Exact match (case/space-insensitive), else the first label starting
+        with the value, else the first containing it, else the first label in
+        which every word of the value starts a word ("San Jose, CA" matches
+        "San Jose, California, United States"); None if no label matches, as
+        an unrelated suggestion must never be picked (or learned)
+    """
+    wanted = _normalize(value)
+    words = re.findall(r"\w+", wanted)
+    normalized = [(_normalize(label), label.strip()) for label in labels if label.strip()]
+    for match in (
+        lambda n: n == wanted,
+        lambda n: n.startswith(wanted),
+        lambda n: wanted in n,
+        lambda n: bool(words) and all(re.search(rf"\b{re.escape(word)}", n) for word in words),
+    ):
+        for candidate, label in normalized:
+            if match(candidate):
+                return label
+    return None
+
+
+def _option(options: Locator, label: str) -> Locator:
+    return options.filter(has_text=re.compile(rf"^\s*{re.escape(label)}\s*$")).first
+
+
+async def _type_and_pick(input_field: Locator, options: Locator, query: str, label: str, timeout: int) -> None:
+    await input_field.fill(query)
+    await _option(options, label).click(timeout=timeout)
+
+
+async def select_autocomplete(
+    page: Page,
+    platform: str,
+    field: str,
+    input_field: Locator,
+    value: str,
+    options: Locator | None = None,
+    timeout: int = 5000,
+) -> str:
+    """
+    Fill an autocomplete input and select the matching suggestion.
+
+    Args:
+        page: Playwright Page object
+        platform: Platform name used in the cache key (e.g., "indeed")
+        field: Field name used in the cache key (e.g., "job-title")
+        input_field: Locator of the autocomplete input
+        value: Value to select (e.g., "security officer")
+        options: Locator of the suggestion elements (defaults to role="option")
+        timeout: Max time in ms to wait for suggestions
+
+    Returns:
+        The exact suggestion label that was selected
+    """
+    cache = _default_cache()
+    options = options if options is not None else page.get_by_role("option")
+    key = f"{platform}/{field}/{_normalize(value)}"
+    learned = cache.get(key)
+
+    if learned:
+        query, floor, label = learned["query"], learned["floor"], learned["label"]
+        probe_length = (floor + len(query)) // 2
+        if probe_length > floor and probe_length < len(query):
+            # Try a shorter prefix; remember the result either way
+            try:
+                await _type_and_pick(input_field, options, query[:probe_length], label, PROBE_TIMEOUT)
+                cache.set(key, {"query": query[:probe_length], "floor": floor, "label": label})
+                return label
+            except PlaywrightTimeoutError:
+                floor = probe_length
+                cache.set(key, {"query": query, "floor": floor, "label": label})
+        try:
+            await _type_and_pick(input_field, options, query, label, timeout)
+            return label
+        except PlaywrightTimeoutError:
+            # Suggestions changed; relearn from the full value
+            cache.delete(key)
+
+    await input_field.fill(value)
+    await options.first.wait_for(state="visible", timeout=timeout)
+    label = best_label(value, await options.all_inner_texts())
+    if label is None:
+        raise LookupError(f"No autocomplete suggestion for {field}={value!r}")
+    await _option(options, label).click(timeout=timeout)
+    cache.set(key, {"query": value, "floor": MIN_QUERY_LENGTH - 1, "label": label})
+    print(f"Learned autocomplete {key} -> {label!r}")
+    return label
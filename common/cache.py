@@ -0,0 +1,69 @@
+"""
+Small persistent key-value cache shared by the learned-behaviour caches.
+
+Values are JSON-encoded and grouped by namespace (e.g. "selectors",
+"autocomplete"). Each namespace is read into memory once on first use, so
+lookups during a run never touch disk; writes go straight through to SQLite.
+"""
+
+import json
+import time
+
+from common.storage import connect
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+"""
+
+
+class KeyValueCache:
+    """JSON values keyed by string within one namespace."""
+
+    def __init__(self, namespace: str, db_name: str = "cache.sqlite3"):
+        self.namespace = namespace
+        self.conn = connect(db_name, SCHEMA)
+        self._values: dict | None = None
+
+    def _load(self) -> dict:
+        if self._values is None:
+            rows = self.conn.execute(
+                "SELECT key, value FROM cache WHERE namespace = ?", (self.namespace,)
+            )
+            self._values = {row["key"]: json.loads(row["value"]) for row in rows}
+        return self._values
+
+    def get(self, key: str, default=None):
+        return self._load().get(key, default)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._load()
+
+    def set(self, key: str, value) -> None:
+        values = self._load()
+        if values.get(key) == value:
+            return
+        values[key] = value
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO cache (namespace, key, value, updated_at) VALUES (?, ?, ?, ?)",
+                (self.namespace, key, json.dumps(value, ensure_ascii=False), time.time()),
+            )
+
+    def delete(self, key: str) -> None:
+        self._load().pop(key, None)
+        with self.conn:
+            self.conn.execute(
+                "DELETE FROM cache WHERE namespace = ? AND key = ?", (self.namespace, key)
+            )
+
+    def items(self):
+        return self._load().items()
+
+    def close(self) -> None:
+        self.conn.close()
@@ -0,0 +1,255 @@
+"""
+Incremental job posting crawler for Greenhouse, Ashby and Workday boards.
+
+Each refresh sends conditional requests (If-None-Match / If-Modified-Since)
+using validators stored in the local posting index and returns only postings
+that are new or whose content changed since the previous crawl. Re-crawling an
+unchanged board therefore costs one 304 (Greenhouse, Ashby) or the listing
+pages only (Workday, which does not send validators on its listing API).
+"""
+
+import asyncio
+import json
+import time
+import urllib.error
+import urllib.request
+from dataclasses import dataclass, field
+
+from common.posting_index import PostingIndex, content_hash
+
+USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+WORKDAY_PAGE_SIZE = 20
+MAX_CONCURRENT_REQUESTS = 8
+
+
+@dataclass(frozen=True)
+class Board:
+    """A job board to crawl."""
+
+    platform: str  # "greenhouse", "ashby" or "workday"
+    name: str  # Greenhouse board token, Ashby org or Workday tenant
+    host: str = ""  # Workday only, e.g. "nvidia.wd5.myworkdayjobs.com"
+    site: str = ""  # Workday only, e.g. "NVIDIAExternalCareerSite"
+
+    @property
+    def key(self) -> str:
+        return f"{self.platform}:{self.name}" + (f"/{self.site}" if self.site else "")
+
+    @classmethod
+    def greenhouse(cls, board: str) -> "Board":
+        return cls("greenhouse", board)
+
+    @classmethod
+    def ashby(cls, org: str) -> "Board":
+        return cls("ashby", org)
+
+    @classmethod
+    def workday(cls, host: str, site: str) -> "Board":
+        return cls("workday", host.split(".")[0], host=host, site=site)
+
+
+@dataclass
+class Posting:
+    """A new or changed posting emitted by a crawl."""
+
+    board: str
+    posting_id: str
+    url: str
+    title: str
+    data: dict = field(repr=False)
+
+
+@dataclass
+class HttpResponse:
+    status: int
+    headers: dict
+    body: bytes
+
+    def json(self):
+        return json.loads(self.body)
+
+
+def _request(method: str, url: str, body: dict | None = None, headers: dict | None = None) -> HttpResponse:
+    """Blocking HTTP request; 304 Not Modified is returned, not raised."""
+    data = json.dumps(body).encode("utf-8") if body is not None else None
+    request = urllib.request.Request(url, data=data, method=method)
+    request.add_header("User-Agent", USER_AGENT)
+    request.add_header("Accept", "application/json")
+    if data is not None:
+        request.add_header("Content-Type", "application/json")
+    for name, value in (headers or {}).items():
+        if value:
+            request.add_header(name, value)
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return HttpResponse(response.status, dict(response.headers), response.read())
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return HttpResponse(304, dict(e.headers), b"")
+        raise
+
+
+async def fetch(method: str, url: str, body: dict | None = None, headers: dict | None = None) -> HttpResponse:
+    """Run a blocking HTTP request off the event loop."""
+    return await asyncio.to_thread(_request, method, url, body, headers)
+
+
+def _conditional_headers(etag: str | None, last_modified: str | None) -> dict:
+    return {"If-None-Match": etag, "If-Modified-Since": last_modified}
+
+
+async def _crawl_listing_document(index: PostingIndex, board: Board, url: str, parse) -> list[Posting]:
+    """Crawl boards whose listing is a single JSON document with full content."""
+    etag, last_modified = index.board_validators(board.key)
+    response = await fetch("GET", url, headers=_conditional_headers(etag, last_modified))
+    if response.status == 304:
+        index.touch_board(board.key)
+        return []
+
+    known = index.hashes(board.key)
+    changed, unchanged = [], []
+    for posting in parse(response.json()):
+        digest = content_hash(posting.data)
+        if known.get(posting.posting_id) == digest:
+            unchanged.append(posting.posting_id)
+            continue
+        index.upsert(board.key, posting.posting_id, posting.url, digest)
+        changed.append(posting)
+    index.touch(board.key, unchanged)
+    index.set_board_validators(board.key, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+    return changed
+
+
+def _parse_greenhouse(board: Board, payload: dict) -> list[Posting]:
+    return [
+        Posting(board.key, str(job["id"]), job["absolute_url"], job["title"], job)
+        for job in payload.get("jobs", [])
+    ]
+
+
+def _parse_ashby(board: Board, payload: dict) -> list[Posting]:
+    return [
+        Posting(board.key, job["id"], job.get("jobUrl", ""), job["title"], job)
+        for job in payload.get("jobs", [])
+    ]
+
+
+async def _crawl_workday(index: PostingIndex, board: Board) -> list[Posting]:
+    """
+    Crawl a Workday tenant through its CXS listing API.
+
+    Listing pages are fetched concurrently. Only listing items whose hash
+    changed get a (conditional) detail request, so an unchanged tenant costs
+    total/20 listing requests and nothing else.
+    """
+    api = f"https://{board.host}/wday/cxs/{board.name}/{board.site}"
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def listing_page(offset: int) -> dict:
+        async with semaphore:
+            body = {"appliedFacets": {}, "limit": WORKDAY_PAGE_SIZE, "offset": offset, "searchText": ""}
+            return (await fetch("POST", f"{api}/jobs", body=body)).json()
+
+    first = await listing_page(0)
+    total = first.get("total", 0)
+    pages = [first] + await asyncio.gather(
+        *(listing_page(offset) for offset in range(WORKDAY_PAGE_SIZE, total, WORKDAY_PAGE_SIZE))
+    )
+
+    known = index.hashes(board.key)
+    candidates, unchanged = [], []
+    for page in pages:
+        for item in page.get("jobPostings", []):
+            path = item["externalPath"]
+            # "postedOn" is relative ("Posted 3 Days Ago") and changes daily, so it is not hashed
+            digest = content_hash({k: v for k, v in item.items() if k != "postedOn"})
+            posting_id = path.rsplit("_", 1)[-1]
+            if known.get(posting_id) == digest:
+                unchanged.append(posting_id)
+            else:
+                candidates.append((posting_id, path, digest, item))
+    index.touch(board.key, unchanged)
+
+    async def detail(posting_id: str, path: str, digest: str, item: dict) -> Posting:
+        previous = index.get(board.key, posting_id)
+        headers = _conditional_headers(previous.etag, previous.last_modified) if previous else {}
+        async with semaphore:
+            response = await fetch("GET", f"{api}{path}", headers=headers)
+        url = f"https://{board.host}/en-US/{board.site}{path}"
+        if response.status == 304:
+            # The detail is unchanged but the listing item is not (its hash differed): still a change
+            index.upsert(board.key, posting_id, url, digest)
+            return Posting(board.key, posting_id, url, item["title"], item)
+        index.upsert(
+            board.key,
+            posting_id,
+            url,
+            digest,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        data = response.json().get("jobPostingInfo", item)
+        return Posting(board.key, posting_id, url, item["title"], data)
+
+    # One failing detail request must not abort the crawl; the posting is not
+    # upserted, so the next crawl retries it
+    results = await asyncio.gather(*(detail(*candidate) for candidate in candidates), return_exceptions=True)
+    postings = []
+    for (posting_id, *_), result in zip(candidates, results):
+        if isinstance(result, BaseException):
+            if not isinstance(result, Exception):
+                raise result
+            print(f"{board.key}: could not fetch posting {posting_id}: {result}")
+        else:
+            postings.append(result)
+    return postings
+
+
+async def crawl(board: Board, index: PostingIndex | None = None) -> list[Posting]:
+    """
+    Refresh one board and return only its new or changed postings.
+
+    Args:
+        board: Board to crawl
+        index: Posting index to use (defaults to the shared on-disk index)
+
+    Returns:
+        Postings that are new or whose content changed since the last crawl
+    """
+    own_index = index is None
+    index = index or PostingIndex()
+    try:
+        if board.platform == "greenhouse":
+            url = f"https://boards-api.greenhouse.io/v1/boards/{board.name}/jobs?content=true"
+            return await _crawl_listing_document(index, board, url, lambda p: _parse_greenhouse(board, p))
+        if board.platform == "ashby":
+            url = f"https://api.ashbyhq.com/posting-api/job-board/{board.name}"
+            return await _crawl_listing_document(index, board, url, lambda p: _parse_ashby(board, p))
+        if board.platform == "workday":
+            return await _crawl_workday(index, board)
+        raise ValueError(f"Unsupported platform: {board.platform}")
+    finally:
+        if own_index:
+            index.close()
+
+
+if __name__ == "__main__":
+    BOARDS = [
+        Board.greenhouse("anthropic"),
+        Board.ashby("openai"),
+        Board.workday("nvidia.wd5.myworkdayjobs.com", "NVIDIAExternalCareerSite"),
+    ]
+
+    async def main():
+        index = PostingIndex()
+        try:
+            for board in BOARDS:
+                started = time.perf_counter()
+                postings = await crawl(board, index)
+                print(f"{board.key}: {len(postings)} new/changed in {time.perf_counter() - started:.1f}s")
+                for posting in postings[:5]:
+                    print(f"  - {posting.title} ({posting.url})")
+        finally:
+            index.close()
+
+    asyncio.run(main())
@@ -0,0 +1,207 @@
+"""
+Per-application deadline carried through every page operation.
+
+A single stuck locator should not hold a browser slot for minutes: every
+Playwright call defaults to a 30 s timeout, and the fill functions add
+their own (`wait_for(state="visible", timeout=10000)`, ...). A workflow
+wraps its page with `bounded(page, "workday")`. Every operation that takes a
+timeout then gets the smaller of its own timeout and what is left of the
+application's budget. Once the budget is spent, the next operation raises
+DeadlineExceeded instead of starting.
+
+`enforce_deadline(page)` covers what the page cannot time out itself (an
+evaluate on a busy page, Python-side waits): it cancels the block when the
+deadline passes. Either way the application ends with DeadlineExceeded, whose
+message names the operation and step it was in. The reason is also written
+to the run trace (common/run_trace.py) as a failed record.
+
+Wrap the page innermost, under pacing and tracing:
+
+    page = traced(paced(bounded(page, "workday"), "workday"), "workday", job_url)
+    async with enforce_deadline(page):
+        ...
+
+Override every platform's budget with the JOB_APPLY_DEADLINE environment
+variable (seconds).
+"""
+
+import asyncio
+import inspect
+import os
+import time
+from contextlib import asynccontextmanager
+
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+
+from common.page_proxy import Proxy
+
+PLAYWRIGHT_DEFAULT_TIMEOUT = 30000  # ms; what an operation waits when it is given no timeout
+
+# Seconds per application; anything not listed uses DEFAULT_DEADLINE
+PLATFORM_DEADLINES = {
+    "greenhouse": 180,
+    "ashby": 180,
+    "workday": 480,
+    "indeed": 300,
+}
+DEFAULT_DEADLINE = 300
+
+
+def deadline_for(platform: str) -> float:
+    """The platform's budget in seconds with the environment override applied."""
+    if seconds := os.environ.get("JOB_APPLY_DEADLINE"):
+        return float(seconds)
+    return PLATFORM_DEADLINES.get(platform, DEFAULT_DEADLINE)
+
+
+class DeadlineExceeded(Exception):
+    """The application ran out of its time budget; the message is the reason."""
+
+
+class Deadline:
+    """Time budget of one application."""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.expires = time.monotonic() + seconds
+        self.reason = ""
+
+    def remaining(self) -> float:
+        """Seconds left; negative once the deadline has passed."""
+        return self.expires - time.monotonic()
+
+    def expire(self, what: str) -> DeadlineExceeded:
+        """Record why the application was stopped and return the exception to raise."""
+        self.reason = self.reason or f"{self.seconds:g}s deadline passed: {what}"
+        return DeadlineExceeded(self.reason)
+
+    def timeout_ms(self, requested: float | None, op: str) -> float:
+        """
+        Timeout for one operation: its own (or Playwright's default) capped by the remaining budget.
+
+        Raises:
+            DeadlineExceeded: If nothing is left of the budget
+        """
+        left = self.remaining() * 1000
+        if left < 1:
+            raise self.expire(f"no time left for {op}")
+        own = requested if requested else PLAYWRIGHT_DEFAULT_TIMEOUT  # 0 means "no timeout" to Playwright
+        return min(own, left)
+
+
+_takes_timeout: dict[tuple[type, str], bool] = {}
+
+
+def _has_timeout(target, name: str, method) -> bool:
+    key = (type(target), name)
+    if key not in _takes_timeout:
+        try:
+            _takes_timeout[key] = "timeout" in inspect.signature(method).parameters
+        except (TypeError, ValueError):
+            _takes_timeout[key] = False
+    return _takes_timeout[key]
+
+
+class _Bounded(Proxy):
+    def __init__(self, target, deadline: Deadline):
+        super().__init__(target)
+        self.deadline = deadline
+
+    def _child(self, value):
+        return _Bounded(value, self.deadline)
+
+    def _call(self, name: str, method):
+        takes_timeout = _has_timeout(self._target, name, method)
+
+        async def bounded_call(*args, **kwargs):
+            clamped = False
+            if takes_timeout:
+                requested = kwargs.get("timeout")
+                kwargs["timeout"] = self.deadline.timeout_ms(requested, name)
+                clamped = kwargs["timeout"] < (requested or PLAYWRIGHT_DEFAULT_TIMEOUT)
+            elif self.deadline.remaining() <= 0:
+                raise self.deadline.expire(f"no time left for {name}")
+            try:
+                return await method(*args, **kwargs)
+            except PlaywrightTimeoutError as error:
+                if clamped or self.deadline.remaining() <= 0:
+                    raise self.deadline.expire(f"{name} timed out") from error
+                raise
+
+        return bounded_call
+
+    def __getattr__(self, name):
+        value = super().__getattr__(name)
+        if name.startswith("expect_"):  # expect_response, ...: sync calls returning an async context manager
+
+            def bounded_expect(*args, **kwargs):
+                return value(*args, **{**kwargs, "timeout": self.deadline.timeout_ms(kwargs.get("timeout"), name)})
+
+            return bounded_expect
+        return value
+
+
+class BoundedPage(_Bounded):
+    """A Page whose operation timeouts are capped by the application's deadline."""
+
+    async def wait_for_timeout(self, timeout: float) -> None:
+        left = self.deadline.remaining() * 1000
+        await self._target.wait_for_timeout(max(0, min(timeout, left)))
+        if timeout > left:
+            raise self.deadline.expire("wait_for_timeout ran past it")
+
+
+def bounded(page: Page, platform: str = "", seconds: float | None = None) -> BoundedPage:
+    """
+    Wrap a page so every operation's timeout comes out of one application budget.
+
+    Args:
+        page: Playwright page for one application; the deadline starts now
+        platform: Key into PLATFORM_DEADLINES (e.g., "workday")
+        seconds: Budget to use instead of the platform's
+
+    Returns:
+        BoundedPage; its `deadline` tells the time left and, once stopped, the reason
+    """
+    return BoundedPage(page, Deadline(seconds if seconds is not None else deadline_for(platform)))
+
+
+def _record(page, exceeded: DeadlineExceeded) -> DeadlineExceeded:
+    """Add the step to the reason and write it to the run trace when the page is traced."""
+    trace = getattr(page, "trace", None)
+    if trace is None:
+        return exceeded
+    if trace.recent:
+        last = trace.recent[-1]
+        exceeded = DeadlineExceeded(f"{exceeded} (step {last['step']}, last operation {last['op']})")
+    trace.write(ok=False, error=str(exceeded))
+    return exceeded
+
+
+@asynccontextmanager
+async def enforce_deadline(page):
+    """
+    Cancel the block when the page's deadline passes.
+
+    A no-op for pages that are not bounded.
+
+    Raises:
+        DeadlineExceeded: With the reason, which is also written to the run trace
+    """
+    deadline: Deadline | None = getattr(page, "deadline", None)
+    if deadline is None:
+        yield
+        return
+    scope = asyncio.timeout(deadline.remaining())
+    try:
+        async with scope:
+            yield
+    except TimeoutError as error:
+        if not scope.expired():
+            raise
+        raise _record(page, deadline.expire("the application was cancelled")) from error
+    except DeadlineExceeded as exceeded:
+        recorded = _record(page, exceeded)
+        if recorded is exceeded:
+            raise
+        raise recorded from exceeded
@@ -0,0 +1,95 @@
+"""
+Failure-only debugging artifacts.
+
+Recording a Playwright trace for every application is too expensive at
+scale, so nothing is written on the happy path. A traced page already keeps
+the last actions and a few lightweight DOM snapshots in memory (see
+common/run_trace.py). When an application fails, `capture_failure` adds a
+screenshot and the page HTML, and writes everything as one compressed zip in
+failures/ in the state directory. Compression and the disk write run in a
+worker thread, off the event loop.
+"""
+
+import asyncio
+import json
+import time
+import traceback
+import zipfile
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from playwright.async_api import Page
+
+from common.page_proxy import unwrap
+from common.storage import STATE_DIR
+
+FAILURE_DIR = STATE_DIR / "failures"
+
+CAPTURE_TIMEOUT = 5000  # ms; a hung page must not hang the failure path too
+
+
+def _write_zip(path: Path, files: dict[str, bytes | str]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=6) as archive:
+        for name, data in files.items():
+            archive.writestr(name, data)
+
+
+async def capture_failure(page: Page, label: str, error: BaseException) -> Path:
+    """
+    Write the failure report for a page: error, recent actions, snapshots,
+    screenshot and HTML.
+
+    Args:
+        page: The failing page (traced or not; without a trace there are no recent actions)
+        label: Short name for the report file (e.g., "figma" or "workday")
+        error: The exception that ended the application
+
+    Returns:
+        Path of the written zip
+    """
+    trace = getattr(page, "trace", None)
+    raw = unwrap(page)  # Captures are not part of the application's trace
+    report = {
+        "label": label,
+        "url": getattr(raw, "url", ""),
+        "captured_at": time.time(),
+        "error": f"{type(error).__name__}: {error}",
+        "traceback": "".join(traceback.format_exception(error)),
+        "step": trace.recent[-1]["step"] if trace and trace.recent else None,
+        "recent": list(trace.recent) if trace else [],
+        "snapshots": list(trace.snapshots) if trace else [],
+    }
+    files: dict[str, bytes | str] = {}
+    try:
+        files["screenshot.png"] = await raw.screenshot(full_page=True, timeout=CAPTURE_TIMEOUT)
+    except Exception as capture_error:
+        report["screenshot_error"] = str(capture_error)[:200]
+    try:
+        files["page.html"] = await asyncio.wait_for(raw.content(), CAPTURE_TIMEOUT / 1000)
+    except Exception as capture_error:
+        report["html_error"] = str(capture_error)[:200]
+    files["report.json"] = json.dumps(report, indent=2, ensure_ascii=False, default=str)
+
+    path = FAILURE_DIR / f"{label}-{time.strftime('%Y%m%d-%H%M%S')}-{int(time.time() * 1000) % 1000:03d}.zip"
+    await asyncio.to_thread(_write_zip, path, files)
+    print(f"Failure report: {path}")
+    return path
+
+
+@asynccontextmanager
+async def capture_failures(page: Page, label: str):
+    """
+    Write a failure report if the block raises; the exception still propagates.
+
+    A traced page also gets its failed record in the run trace, unless one was
+    already written (an expired deadline writes its own).
+    """
+    try:
+        yield
+    except Exception as error:
+        trace = getattr(page, "trace", None)
+        if trace is not None and not trace.written:
+            trace.write(ok=False, error=repr(error))
+        await capture_failure(page, label, error)
+        raise
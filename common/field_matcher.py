@@ -0,0 +1,263 @@
+"""
+Classify discovered form labels to applicant profile attributes.
+
+Each script hard-codes which value goes into which label, so a new question
+used to need a code change. The matcher maps a label such as "LinkedIn
+Profile URL" or "Will you now or in the future require sponsorship?" to a
+profile attribute ("links.linkedin", "answers.visa_sponsorship") with a
+confidence score: precompiled regex rules first, then TF-IDF similarity of
+character n-grams against example labels. Results are cached per platform
+and label hash, so repeat postings skip classification entirely.
+"""
+
+import hashlib
+import re
+import sys
+from dataclasses import dataclass
+
+from common.cache import KeyValueCache
+from common.profile import Profile
+from common.similarity import TfidfIndex
+
+# Bump when RULES or EXAMPLES change so cached classifications are recomputed
+RULES_VERSION = 3
+
+REGEX_CONFIDENCE = 0.95
+MIN_CONFIDENCE = 0.75  # Character n-grams of a shared word ("current ...") alone score up to ~0.65
+
+# (attribute, pattern) checked in order; more specific patterns come first. Question
+# rules precede the bare contact nouns, so "Are you authorized to work in the
+# country ...?" is a work-authorization question, not the country field.
+RULES = [
+    ("contact.full_legal_name", r"\blegal\s+name\b"),
+    ("contact.first_name", r"\b(first|given|preferred)\s+name\b"),
+    ("contact.last_name", r"\b(last|family)\s+name\b|\bsurname\b"),
+    ("contact.email", r"\be-?mail\b"),
+    ("answers.visa_sponsorship", r"\bsponsor(ship)?\b|\bvisa\b"),
+    ("answers.authorized_to_work", r"\b(legally\s+)?authori[sz]ed\s+to\s+work\b|\bwork\s+authori[sz]ation\b"),
+    ("answers.relocation_open", r"\brelocat(e|ion)\b"),
+    ("answers.in_person_work", r"\bin[\s-]person\b|\bon[\s-]?site\b|\b(in|at|from|to|into)\s+(the\s+|our\s+|an?\s+)?(\w+\s+)?office\b"),
+    ("answers.previous_interview", r"\binterview(ed|s)?\b"),
+    ("answers.start_date", r"\bstart\s+date\b|\bearliest\b.*\bstart\b|\bavailable\s+to\s+start\b"),
+    ("answers.how_did_you_hear_about_us", r"\bhow\s+did\s+you\s+hear\b|\bhear\s+about\b|\b(referral|job|application|candidate)\s+source\b|^source$"),
+    ("contact.phone_country_code", r"\b(country\s+(phone\s+)?code|phone\s+country)\b"),
+    ("answers.phone_device_type", r"\bphone\s+(device\s+)?type\b"),
+    ("contact.phone", r"\b(phone|mobile|cell)\b"),
+    ("contact.address_line_1", r"\baddress(\s+line)?\s*1?\b|\bstreet\b"),
+    ("contact.postal_code", r"\b(postal|zip)(\s+code)?\b"),
+    ("contact.city", r"\bcity\b"),
+    # Not a bare "state": "Please state your salary expectations" is a question
+    ("contact.state", r"^(home\s+)?state$|\bstate\s+(or\s+)?(province|region)\b|\bprovince\b|\bstate\s+of\s+residence\b"),
+    ("contact.country", r"\bcountry\b"),
+    ("experience.company", r"\b(current|present|most\s+recent)\s+(company|employer)\b|\b(company|employer)\s+name\b|^(company|employer)$"),
+    ("experience.job_title", r"\b(current|present|most\s+recent)\s+(job\s+)?title\b|\bjob\s+title\b|^title$"),
+    ("links.linkedin", r"\blinked\s*in\b"),
+    ("links.github", r"\bgit\s*hub\b"),
+    ("links.x_profile", r"\b(twitter|x\s+profile)\b"),
+    ("links.publications", r"\b(publications?|google\s+scholar)\b"),
+    ("links.website", r"\b(website|portfolio|personal\s+site)\b"),
+    ("eeo.hispanic_latino", r"\bhispanic\b|\blatin[oax]\b"),
+    ("eeo.race", r"\brace\b|\bethnicity\b"),
+    ("eeo.gender", r"\bgender\b|\bsex\b"),
+    ("eeo.veteran_status", r"\bveteran\b"),
+    ("eeo.disability_status", r"\bdisabilit(y|ies)\b"),
+    ("resume_path", r"\b(resume|cv|curriculum\s+vitae)\b"),
+]
+COMPILED_RULES = [(attribute, re.compile(pattern, re.IGNORECASE)) for attribute, pattern in RULES]
+
+# Paraphrases the regex rules miss; the similarity fallback compares against these
+EXAMPLES = {
+    "contact.first_name": ["forename", "name (first)"],
+    "contact.last_name": ["name (last)"],
+    "contact.phone": ["telephone number", "contact number"],
+    "contact.city": ["town", "location", "city of residence", "where are you based"],
+    "experience.company": ["current employer", "where do you work"],
+    "experience.job_title": ["current role", "position held"],
+    "links.linkedin": ["linkedin url", "linkedin profile link"],
+    "links.github": ["github profile", "code repository url"],
+    "links.website": ["personal homepage", "blog url"],
+    "answers.visa_sponsorship": ["require immigration support", "need an h-1b"],
+    "answers.authorized_to_work": ["eligible to work in the united states", "right to work"],
+    "answers.relocation_open": ["willing to move", "open to moving"],
+    "answers.start_date": ["when can you start", "availability date", "notice period"],
+    "answers.how_did_you_hear_about_us": ["referral source", "where did you find this job"],
+    "eeo.gender": ["gender identity"],
+    "eeo.veteran_status": ["military service", "protected veteran status"],
+    "eeo.disability_status": ["voluntary self-identification of disability"],
+}
+
+# Labels once misclassified, with the attribute they must get (None: must not be
+# confidently classified); `python -m common.field_matcher` checks them
+REGRESSION_LABELS = {
+    "Current Company": "experience.company",
+    "Current Employer": "experience.company",
+    "Current Title": "experience.job_title",
+    "Job Title": "experience.job_title",
+    "Location": "contact.city",
+    "Current salary": None,
+    "Are you authorized to work in the country for which you applied?": "answers.authorized_to_work",
+    "Please state your salary expectations": None,
+    "Open source contributions": None,
+    "Pronouns": None,
+    "State/Province": "contact.state",
+    "Can you work from our SF office 3 days a week?": "answers.in_person_work",
+    "How did you hear about this job?": "answers.how_did_you_hear_about_us",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class FieldMatch:
+    """Classification of one label."""
+
+    attribute: str | None  # Dotted profile path (e.g., "links.linkedin"), None if unknown
+    confidence: float
+    method: str  # "regex", "similarity" or "none"
+
+    @property
+    def confident(self) -> bool:
+        return self.attribute is not None and self.confidence >= MIN_CONFIDENCE
+
+
+def normalize_label(label: str) -> str:
+    """Lower-case a label and drop required markers, punctuation and extra spaces."""
+    return " ".join(re.sub(r"[^\w\s-]", " ", label.casefold().replace("*", " ")).split())
+
+
+def _ngrams(normalized: str) -> list[str]:
+    padded = f" {normalized} "
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+def label_hash(label: str) -> str:
+    return hashlib.sha1(normalize_label(label).encode()).hexdigest()[:16]
+
+
+_cache: KeyValueCache | None = None
+_index: tuple[TfidfIndex, list[str]] | None = None
+
+
+def _default_cache() -> KeyValueCache:
+    global _cache
+    if _cache is None:
+        _cache = KeyValueCache("field_matcher")
+    return _cache
+
+
+def _default_index() -> tuple[TfidfIndex, list[str]]:
+    """Similarity index over every rule attribute's name plus its example labels."""
+    global _index
+    if _index is None:
+        documents, attributes = [], []
+        for attribute, _ in RULES:
+            for example in [attribute.split(".")[-1].replace("_", " "), *EXAMPLES.get(attribute, [])]:
+                documents.append(_ngrams(normalize_label(example)))
+                attributes.append(attribute)
+        _index = (TfidfIndex(documents), attributes)
+    return _index
+
+
+def _classify_by_rules(normalized: str) -> FieldMatch | None:
+    for attribute, pattern in COMPILED_RULES:
+        if pattern.search(normalized):
+            return FieldMatch(attribute, REGEX_CONFIDENCE, "regex")
+    return None
+
+
+def classify_labels(platform: str, labels: list[str]) -> dict[str, FieldMatch]:
+    """
+    Classify form labels to profile attributes.
+
+    Cached labels are returned without work; the rest go through the regex
+    rules, and whatever the rules miss is scored against the examples in one
+    matrix product.
+
+    Args:
+        platform: Platform name used in the cache key (e.g., "greenhouse")
+        labels: Label texts as shown on the form
+
+    Returns:
+        Map of each label to its FieldMatch
+    """
+    cache = _default_cache()
+    results: dict[str, FieldMatch] = {}
+    unmatched: list[tuple[str, str, str]] = []  # (label, normalized, cache key)
+
+    for label in dict.fromkeys(labels):
+        key = f"v{RULES_VERSION}/{platform}/{label_hash(label)}"
+        cached = cache.get(key)
+        if cached is not None:
+            results[label] = FieldMatch(**cached)
+            continue
+        normalized = normalize_label(label)
+        match = _classify_by_rules(normalized)
+        if match is None:
+            unmatched.append((label, normalized, key))
+        else:
+            results[label] = match
+            cache.set(key, {"attribute": match.attribute, "confidence": match.confidence, "method": match.method})
+
+    if unmatched:
+        try:
+            index, attributes = _default_index()
+        except RuntimeError as e:  # numpy missing: regex matches only, nothing cached
+            print(f"Skipping similarity matching for {len(unmatched)} labels: {e}")
+            return {**results, **{label: FieldMatch(None, 0.0, "none") for label, _, _ in unmatched}}
+        scores = index.scores([_ngrams(normalized) for _, normalized, _ in unmatched])
+        for (label, _, key), row in zip(unmatched, scores):
+            best = int(row.argmax())
+            confidence = round(float(row[best]), 3)
+            match = FieldMatch(attributes[best], confidence, "similarity") if confidence > 0 else FieldMatch(None, 0.0, "none")
+            results[label] = match
+            cache.set(key, {"attribute": match.attribute, "confidence": match.confidence, "method": match.method})
+
+    return results
+
+
+def classify_label(platform: str, label: str) -> FieldMatch:
+    """Classify a single label; see `classify_labels`."""
+    return classify_labels(platform, [label])[label]
+
+
+def profile_value(profile: Profile, attribute: str):
+    """
+    Read a dotted attribute path from a profile.
+
+    Args:
+        profile: Applicant profile
+        attribute: Path such as "contact.email", "eeo.race" or "answers.start_date";
+                   "experience.<field>" reads the most recent experience
+
+    Returns:
+        The value, or None if the profile has none
+    """
+    section, _, name = attribute.partition(".")
+    if not name:
+        return getattr(profile, section, None)
+    if section in ("answers", "essays"):
+        return getattr(profile, section).get(name)
+    if section == "experience":
+        return getattr(profile.experience[0], name) if profile.experience else None
+    return getattr(getattr(profile, section), name, None)
+
+
+def suggest_values(platform: str, labels: list[str], profile: Profile) -> dict[str, object]:
+    """Return label -> profile value for every confidently classified label with a value."""
+    suggestions = {}
+    for label, match in classify_labels(platform, labels).items():
+        if match.confident:
+            value = profile_value(profile, match.attribute)
+            if value not in ("", None):
+                suggestions[label] = value
+    return suggestions
+
+
+if __name__ == "__main__":
+    matches = classify_labels("regression", list(REGRESSION_LABELS))
+    failures = [
+        f"{label!r}: expected {expected}, got {match.attribute} ({match.confidence}, {match.method})"
+        for label, expected in REGRESSION_LABELS.items()
+        if (match := matches[label]).confident != (expected is not None)
+        or (expected is not None and match.attribute != expected)
+    ]
+    print("\n".join(failures) or f"All {len(REGRESSION_LABELS)} regression labels classified as expected")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,204 @@
+"""
+Adaptive per-host concurrency (AIMD) with a circuit breaker.
+
+Too many parallel applications against one ATS host trigger throttling and
+bot checks; too few waste capacity. The controller keeps one state per
+platform host (greenhouse.io, ashbyhq.com, myworkdayjobs.com,
+smartapply.indeed.com, or the raw host otherwise). It tracks latency, error
+rate and challenge pages, raises the host's concurrency limit additively
+while healthy, and halves it on an error or a slow response. Latency is kept
+per kind of operation (a page load, a whole application), so a response is
+only ever compared with operations like it. Cancellations and expired
+deadlines are ours, not the host's, and are not recorded. After repeated
+failures the host's circuit opens for a cooldown. Then a single trial request
+decides whether it closes again.
+
+The only caller is the PrefetchingRunner (common/runner.py), which applies
+one job at a time. There the limit gates its page loads (at most
+`max_prefetch` at once) and its one application; it does not fan out
+concurrent applications.
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
+
+from common.deadline import DeadlineExceeded
+
+PLATFORM_DOMAINS = ("greenhouse.io", "ashbyhq.com", "myworkdayjobs.com", "smartapply.indeed.com")
+
+# Text seen on bot-check and rate-limit interstitials
+CHALLENGE_MARKERS = ("just a moment", "verify you are human", "access denied", "captcha", "too many requests", "unusual traffic")
+
+
+def host_key(url: str) -> str:
+    """Group a URL under its platform domain (e.g., "myworkdayjobs.com") or its host."""
+    host = urlparse(url).netloc.lower()
+    return next((domain for domain in PLATFORM_DOMAINS if host == domain or host.endswith("." + domain)), host)
+
+
+def is_challenge(snapshot: dict) -> bool:
+    """Whether a page snapshot (title and headings) looks like a bot check or rate limit page."""
+    text = " ".join([snapshot.get("title", ""), *snapshot.get("headings", [])]).casefold()
+    return any(marker in text for marker in CHALLENGE_MARKERS)
+
+
+@dataclass
+class Outcome:
+    """Lets the caller flag a challenge page seen inside an otherwise successful slot."""
+
+    challenge: bool = False
+
+
+@dataclass
+class HostState:
+    """AIMD and circuit breaker state for one host."""
+
+    limit: float
+    in_flight: int = 0
+    latency: dict[str, float] = field(default_factory=dict)  # Exponentially weighted mean per kind, seconds
+    outcomes: deque = field(default_factory=lambda: deque(maxlen=20))  # True for success
+    consecutive_failures: int = 0
+    open_until: float = 0.0
+    cooldown: float = 0.0
+    half_open: bool = False
+
+    @property
+    def error_rate(self) -> float:
+        return 1 - sum(self.outcomes) / len(self.outcomes) if self.outcomes else 0.0
+
+
+class HostController:
+    """Per-host concurrency limits adjusted by additive increase / multiplicative decrease."""
+
+    def __init__(
+        self,
+        initial_limit: float = 2,
+        min_limit: float = 1,
+        max_limit: float = 8,
+        decrease_factor: float = 0.5,
+        slow_factor: float = 3.0,
+        failure_threshold: int = 3,
+        cooldown: float = 60.0,
+        max_cooldown: float = 600.0,
+    ):
+        """
+        Args:
+            initial_limit: Concurrency a new host starts with
+            min_limit, max_limit: Bounds for a host's limit
+            decrease_factor: Multiplier applied to the limit on errors
+            slow_factor: A response this many times slower than the host's mean counts as congestion
+            failure_threshold: Consecutive failures that open the circuit
+            cooldown: First pause in seconds; doubles on each re-open up to max_cooldown
+        """
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.slow_factor = slow_factor
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.hosts: dict[str, HostState] = {}
+        self._condition = asyncio.Condition()
+
+    def _state(self, url: str) -> HostState:
+        return self.hosts.setdefault(host_key(url), HostState(self.initial_limit))
+
+    def is_open(self, url: str) -> bool:
+        """Whether the host's circuit is open (paused) right now."""
+        return self._state(url).open_until > time.monotonic()
+
+    def reopens_in(self, url: str) -> float:
+        return max(0.0, self._state(url).open_until - time.monotonic())
+
+    def _admits(self, state: HostState) -> bool:
+        if state.open_until > time.monotonic():
+            return False
+        if state.open_until:  # Cooldown over: allow a single trial request
+            state.half_open, state.open_until = True, 0.0
+        if state.half_open:
+            return state.in_flight == 0
+        return state.in_flight < int(state.limit)
+
+    def _record(self, state: HostState, kind: str, seconds: float, ok: bool, challenge: bool) -> None:
+        success = ok and not challenge
+        mean = state.latency.get(kind)
+        slow = mean is not None and seconds > self.slow_factor * mean
+        if success:  # A failure's latency (often a timeout) would inflate the mean that "slow" is judged against
+            state.latency[kind] = seconds if mean is None else 0.8 * mean + 0.2 * seconds
+        state.outcomes.append(success)
+
+        if success and not slow:
+            state.limit = min(self.max_limit, state.limit + 1 / state.limit)
+        else:
+            state.limit = max(self.min_limit, state.limit * self.decrease_factor)
+
+        if success:
+            state.consecutive_failures = 0
+            state.half_open = False
+            state.cooldown = 0.0
+            return
+
+        # A challenge page is a strong signal: count it twice
+        state.consecutive_failures += 2 if challenge else 1
+        if state.half_open or state.consecutive_failures >= self.failure_threshold:
+            state.cooldown = min(self.max_cooldown, state.cooldown * 2 or self.base_cooldown)
+            state.open_until = time.monotonic() + state.cooldown
+            state.half_open = False
+            state.consecutive_failures = 0
+
+    @asynccontextmanager
+    async def slot(self, url: str, kind: str = "load"):
+        """
+        Hold one concurrency slot for the URL's host; waits while the host is
+        at its limit or paused. An exception inside the block counts as a
+        failure, except a cancellation or an expired deadline, which records
+        nothing; set `outcome.challenge = True` to report a challenge page.
+
+        Args:
+            url: URL whose host the slot is for
+            kind: Operation kind whose latency the block is compared with (e.g., "load", "apply")
+        """
+        state = self._state(url)
+        async with self._condition:
+            while not self._admits(state):
+                timeout = state.open_until - time.monotonic() if state.open_until else None
+                try:
+                    await asyncio.wait_for(self._condition.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+            state.in_flight += 1
+
+        outcome, ok, started = Outcome(), False, time.monotonic()
+        record = True
+        try:
+            yield outcome
+            ok = True
+        except (asyncio.CancelledError, DeadlineExceeded):
+            record = False
+            raise
+        finally:
+            async with self._condition:
+                state.in_flight -= 1
+                if record:
+                    self._record(state, kind, time.monotonic() - started, ok, outcome.challenge)
+                self._condition.notify_all()
+
+    def limits(self) -> dict[str, dict]:
+        """Current limit, load and health per host."""
+        now = time.monotonic()
+        return {
+            host: {
+                "limit": int(state.limit),
+                "in_flight": state.in_flight,
+                "latency_ms": {kind: round(seconds * 1000) for kind, seconds in state.latency.items()},
+                "error_rate": round(state.error_rate, 2),
+                "state": "open" if state.open_until > now else "half-open" if state.half_open else "closed",
+                "reopens_in": round(max(0.0, state.open_until - now), 1),
+            }
+            for host, state in self.hosts.items()
+        }
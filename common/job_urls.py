@@ -0,0 +1,130 @@
+"""
+Canonical job identifiers for the platforms we apply through.
+
+The same job reaches us through many URLs (tracking parameters such as
+`?source=Eightfold`, `?gh_jid=...`, `/apply/autofillWithResume` suffixes).
+`canonical_job_id` reduces each of them to one stable key per job:
+
+- Workday:    workday:<tenant>:<requisition id>
+- Greenhouse: greenhouse:<board>:<job id>
+- Ashby:      ashby:<org>:<posting uuid>
+- Indeed:     indeed:<job key>
+"""
+
+import re
+from urllib.parse import parse_qs, urlsplit
+
+ASHBY_UUID = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE)
+GREENHOUSE_HOSTS = ("greenhouse.io",)
+
+
+def _first(query: dict, *names: str) -> str | None:
+    for name in names:
+        values = [value for value in query.get(name, []) if value]
+        if values:
+            return values[0]
+    return None
+
+
+def _workday_id(host: str, segments: list[str]) -> str | None:
+    if host.endswith("myworkdaysite.com"):
+        # Shared host; the tenant is in the path: /[<locale>/]recruiting/<tenant>/<site>/...
+        if "recruiting" not in segments[:-1]:
+            return None
+        tenant = segments[segments.index("recruiting") + 1].lower()
+    else:
+        tenant = host.split(".")[0]
+    # Only job pages identify a job: .../job/[<location>/]<title slug>_<requisition id>[/apply/...];
+    # a careers site such as /External_Careers has an underscore too
+    if "job" not in segments:
+        return None
+    segments = segments[segments.index("job") + 1:]
+    if "apply" in segments:
+        segments = segments[: segments.index("apply")]
+    # Requisition id is the suffix of the title slug: ".../Senior-ASIC-Test-Timing-Engineer_JR2005476"
+    for segment in reversed(segments):
+        if "_" in segment:
+            return f"workday:{tenant}:{segment.rsplit('_', 1)[1].upper()}"
+    return None
+
+
+def _greenhouse_id(host: str, segments: list[str], query: dict) -> str | None:
+    if "jobs" in segments:
+        position = segments.index("jobs")
+        if position > 0 and position + 1 < len(segments) and segments[position + 1].isdigit():
+            return f"greenhouse:{segments[position - 1].lower()}:{segments[position + 1]}"
+    job_id = _first(query, "gh_jid", "token")
+    if job_id and job_id.isdigit():
+        # Company-hosted boards embed the job as ?gh_jid=...; name the board after the domain
+        on_greenhouse = any(host.endswith(suffix) for suffix in GREENHOUSE_HOSTS)
+        board = _first(query, "for") or (segments[0] if on_greenhouse and segments else host.split(".")[-2])
+        return f"greenhouse:{board.lower()}:{job_id}"
+    return None
+
+
+def _ashby_id(segments: list[str]) -> str | None:
+    if len(segments) >= 2 and ASHBY_UUID.match(segments[1]):
+        return f"ashby:{segments[0].lower()}:{segments[1].lower()}"
+    return None
+
+
+def _indeed_id(query: dict) -> str | None:
+    job_key = _first(query, "jk", "vjk", "jobKey")
+    return f"indeed:{job_key.lower()}" if job_key else None
+
+
+def indeed_job_url(job_key: str) -> str:
+    """The Indeed posting URL for a job key, e.g. one read from a SmartApply page."""
+    return f"https://www.indeed.com/viewjob?jk={job_key}"
+
+
+def normalize_url(url: str) -> str:
+    """Lower-case scheme/host, drop query, fragment and trailing slash."""
+    parts = urlsplit(url.strip())
+    path = parts.path.rstrip("/") or "/"
+    return f"{(parts.scheme or 'https').lower()}://{parts.netloc.lower()}{path}"
+
+
+def canonical_job_id(url: str) -> str | None:
+    """
+    Reduce a job URL to a stable identifier that is the same for every URL variant.
+
+    Args:
+        url: Any job posting or application URL
+
+    Returns:
+        Canonical id such as "workday:nvidia:JR2005476". URLs on unknown
+        platforms fall back to "url:" plus the normalized URL. Returns None
+        for URLs on a known platform that do not identify a job (e.g. a
+        SmartApply form URL without a job key).
+
+    Example:
+        canonical_job_id("https://job-boards.greenhouse.io/figma/jobs/5660873004?gh_jid=5660873004")
+        # -> "greenhouse:figma:5660873004"
+    """
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower().split(":")[0]
+    segments = [segment for segment in parts.path.split("/") if segment]
+    query = parse_qs(parts.query)
+
+    if host.endswith("myworkdayjobs.com") or host.endswith("myworkdaysite.com"):
+        return _workday_id(host, segments)
+    if any(host.endswith(suffix) for suffix in GREENHOUSE_HOSTS) or "gh_jid" in query:
+        return _greenhouse_id(host, segments, query)
+    if host.endswith("ashbyhq.com"):
+        return _ashby_id(segments)
+    if "indeed." in host:
+        return _indeed_id(query)
+    return f"url:{normalize_url(url)}"
+
+
+def same_posting(url: str, other: str) -> bool:
+    """Whether two URLs identify the same posting, e.g. a page a runner already opened and a fill function's job URL."""
+    job_id = canonical_job_id(url)
+    return job_id is not None and canonical_job_id(other) == job_id
+
+
+def platform_of(url: str) -> str:
+    """Return the platform name of a job URL ("workday", "greenhouse", ...) or "unknown"."""
+    canonical = canonical_job_id(url)
+    return "unknown" if not canonical or canonical.startswith("url:") else canonical.split(":", 1)[0]
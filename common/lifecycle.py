@@ -0,0 +1,215 @@
+"""
+Page and browser context lifecycle with guaranteed cleanup.
+
+Every workflow gets its page from here, so a page never outlives its
+application:
+
+- `browser_page(p, cdp_url)` yields a page on the CDP-attached browser's
+  default context (the user's own, which is never closed) or on a freshly
+  launched browser. On exit the page is closed and the browser is
+  disconnected or closed.
+- `BrowserSession` hands out pages for a run of applications. It opens its
+  own contexts and replaces the context after `recycle_after` applications,
+  which bounds the renderer and network-cache growth of a long run. A
+  retired context is closed when its last page is released.
+
+Closing a page cancels its pending route handlers (`unroute_all` with
+"ignoreErrors"), detaches the listeners registered through it, then closes
+it. Cleanup never raises over the exception that ended the application.
+
+Override the recycle interval with the JOB_APPLY_RECYCLE_AFTER environment
+variable.
+"""
+
+import asyncio
+import os
+from contextlib import asynccontextmanager, suppress
+
+from playwright.async_api import Browser, BrowserContext, Page, Playwright
+from playwright.async_api import Error as PlaywrightError
+
+from common.page_proxy import Proxy, unwrap
+
+RECYCLE_AFTER = 20  # Applications per owned context
+
+CLOSE_TIMEOUT = 10  # s; a hung renderer must not hang cleanup too
+
+
+class ManagedPage(Proxy):
+    """A page that remembers the listeners registered on it so they can be detached."""
+
+    def __init__(self, target: Page, context: BrowserContext):
+        super().__init__(target)
+        self.context = context
+        self.listeners: list[tuple[str, object]] = []
+
+    def _child(self, value):
+        return value
+
+    def on(self, event: str, handler) -> None:
+        self.listeners.append((event, handler))
+        self._target.on(event, handler)
+
+    def once(self, event: str, handler) -> None:
+        self.listeners.append((event, handler))
+        self._target.once(event, handler)
+
+    def detach_listeners(self) -> None:
+        while self.listeners:
+            event, handler = self.listeners.pop()
+            with suppress(KeyError, ValueError):  # A `once` listener that already fired
+                self._target.remove_listener(event, handler)
+
+
+def _managed(page) -> ManagedPage | None:
+    """The ManagedPage under any number of proxies, if there is one."""
+    while isinstance(page, Proxy):
+        if isinstance(page, ManagedPage):
+            return page
+        page = page._target
+    return None
+
+
+async def close_page(page) -> None:
+    """
+    Cancel a page's route handlers, detach its listeners and close it.
+
+    Safe to call on a closed page, a proxied page, or when the browser is gone.
+    """
+    if (managed := _managed(page)) is not None:
+        managed.detach_listeners()
+    raw = unwrap(page)
+    if raw.is_closed():
+        return
+    try:
+        await asyncio.wait_for(raw.unroute_all(behavior="ignoreErrors"), CLOSE_TIMEOUT)
+        await asyncio.wait_for(raw.close(), CLOSE_TIMEOUT)
+    except (PlaywrightError, asyncio.TimeoutError) as error:
+        print(f"Could not close page cleanly: {error}")
+
+
+class BrowserSession:
+    """Pages for a run of applications; usable as an async context manager."""
+
+    def __init__(
+        self,
+        browser: Browser | None = None,
+        context: BrowserContext | None = None,
+        recycle_after: int | None = None,
+        **context_options,
+    ):
+        """
+        Args:
+            browser: Browser the session opens (and recycles) its own contexts in
+            context: Shared context to open pages in instead, e.g. the default
+                     context of a CDP-attached browser; it is never closed or recycled
+            recycle_after: Applications per owned context (default RECYCLE_AFTER,
+                           or JOB_APPLY_RECYCLE_AFTER); 0 gives every application a new one
+            **context_options: Passed to `browser.new_context` (viewport, ...)
+        """
+        if browser is None and context is None:
+            raise ValueError("BrowserSession needs a browser or a context")
+        self.browser = browser
+        self.shared = context
+        self.recycle_after = recycle_after if recycle_after is not None else int(os.environ.get("JOB_APPLY_RECYCLE_AFTER", RECYCLE_AFTER))
+        self.context_options = context_options
+        self.applications = 0
+        self.recycled = 0
+        self._context: BrowserContext | None = None
+        self._uses = 0  # Pages opened in the current owned context
+        self._open: dict[BrowserContext, int] = {}  # Open pages per owned context
+        self._pages: set[ManagedPage] = set()
+
+    async def _current(self) -> BrowserContext:
+        if self.shared is not None:
+            return self.shared
+        if self._context is not None and self._uses >= self.recycle_after:
+            retired, self._context = self._context, None
+            self.recycled += 1
+            if not self._open.get(retired):
+                await self._close_context(retired)
+        if self._context is None:
+            self._context = await self.browser.new_context(**self.context_options)
+            self._open[self._context], self._uses = 0, 0
+        return self._context
+
+    async def _close_context(self, context: BrowserContext) -> None:
+        self._open.pop(context, None)
+        try:
+            await asyncio.wait_for(context.close(), CLOSE_TIMEOUT)
+        except (PlaywrightError, asyncio.TimeoutError) as error:
+            print(f"Could not close context cleanly: {error}")
+
+    async def new_page(self) -> ManagedPage:
+        """Open a page for one application; hand it back with `release`."""
+        context = await self._current()
+        page = ManagedPage(await context.new_page(), context)
+        self.applications += 1
+        if context is not self.shared:
+            self._uses += 1
+            self._open[context] += 1
+        self._pages.add(page)
+        return page
+
+    async def release(self, page) -> None:
+        """Close a page from `new_page`, and its context if that was retired and this was its last page."""
+        managed = _managed(page)
+        if managed not in self._pages:
+            return await close_page(page)
+        self._pages.discard(managed)
+        await close_page(managed)
+        context = managed.context
+        if context in self._open:
+            self._open[context] -= 1
+            if context is not self._context and not self._open[context]:
+                await self._close_context(context)
+
+    @asynccontextmanager
+    async def page(self):
+        """A page for one application, closed when the block exits."""
+        page = await self.new_page()
+        try:
+            yield page
+        finally:
+            await self.release(page)
+
+    async def close(self) -> None:
+        """Close every page still open and every owned context."""
+        for page in list(self._pages):
+            await self.release(page)
+        for context in list(self._open):
+            await self._close_context(context)
+        self._context = None
+
+    async def __aenter__(self) -> "BrowserSession":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+
+@asynccontextmanager
+async def browser_page(playwright: Playwright, cdp_url: str | None = None, headless: bool = True, **context_options):
+    """
+    A managed page for one application, on an attached or a launched browser.
+
+    Args:
+        playwright: The running `async_playwright()` instance
+        cdp_url: Attach to this browser and use its default context; None launches Chromium
+        headless: Headless mode for a launched browser
+        **context_options: Context options for a launched browser (viewport, ...)
+
+    Yields:
+        ManagedPage; closed on exit, then the browser is disconnected (CDP) or closed
+    """
+    if cdp_url:
+        browser = await playwright.chromium.connect_over_cdp(cdp_url)
+        session = BrowserSession(context=browser.contexts[0])
+    else:
+        browser = await playwright.chromium.launch(headless=headless)
+        session = BrowserSession(browser, **context_options)
+    try:
+        async with session, session.page() as page:
+            yield page
+    finally:
+        await browser.close()  # For a CDP browser this only disconnects; the user's other tabs stay open
@@ -0,0 +1,654 @@
+"""
+Local mock ATS server with latency and fault injection.
+
+Serves simplified Greenhouse, Ashby, Workday and Indeed SmartApply
+application flows that use the same labels, test ids, element ids and
+data-automation-id markers the fill functions rely on
+(`name--legalName--firstName`, `phoneNumber--countryPhoneCode`,
+`location-fields-postal-code-input`, `_systemfield_resume`, ...). It is
+enough to drive the workflows, benchmarks and soak runs without touching a
+live job board.
+
+Paths mirror the live URLs with the host as the first segment, e.g.
+http://127.0.0.1:8765/job-boards.greenhouse.io/anthropic/jobs/4020350008.
+`route_to_mock(page_or_context, server)` sends the live URLs hard-coded in
+the scripts to the server instead.
+
+Every response is classified as one endpoint kind ("page", "save", "submit",
+"suggest" or "upload"). A Fault per kind, optionally per platform
+("workday.save"), sets latency, jitter, an error rate and a throttled upload
+speed:
+
+    server = MockATS({"save": Fault(latency_ms=800, jitter_ms=400, error_rate=0.05),
+                      "upload": Fault(upload_kbps=64)})
+    with server:
+        await route_to_mock(context, server)
+        ...
+
+    python common/mock_ats.py [port]
+"""
+
+import html
+import json
+import random
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.host_controller import host_key
+
+LIVE_URL = re.compile(r"https://([\w-]+\.)*(greenhouse\.io|ashbyhq\.com|myworkdayjobs\.com|smartapply\.indeed\.com)/.*")
+
+
+@dataclass(frozen=True, slots=True)
+class Fault:
+    """Latency and failure behaviour of one endpoint kind."""
+
+    latency_ms: float = 0
+    jitter_ms: float = 0  # Uniform +/- around the latency
+    error_rate: float = 0.0  # Share of requests answered with HTTP 503
+    upload_kbps: float | None = None  # Throttle for request bodies (slow uploads)
+
+
+# ==================== Shared client widgets ====================
+
+# Event delegation only, so Workday steps swapped in with innerHTML keep working.
+# - [data-options]: click/type opens role="option" items; picking one sets the
+#   value (inputs) or label (buttons), or adds a chip (data-chips)
+# - [data-suggest]: like data-options, with items from ?action=suggest
+# - input[type=file][data-upload]: posts the file to ?action=upload
+WIDGETS_JS = r"""
+const endpoint = (action, params = {}) => location.pathname + '?' + new URLSearchParams({action, ...params});
+const closeMenus = () => document.querySelectorAll('.css-menu').forEach(menu => menu.remove());
+
+function openMenu(field, labels) {
+  closeMenus();
+  const menu = document.createElement('div');
+  menu.className = 'css-menu';
+  menu.setAttribute('role', 'listbox');
+  menu.innerHTML = labels.map((label, i) =>
+    `<div class="css-opt" role="option" id="${field.id ? 'react-select-' + field.id + '-option-' + i : ''}"><div>${label}</div></div>`).join('');
+  field.insertAdjacentElement('afterend', menu);
+  menu.addEventListener('click', event => {
+    const option = event.target.closest('[role="option"]');
+    if (option) pick(field, option.innerText.trim());
+  });
+}
+
+function pick(field, label) {
+  const next = field.dataset.next && JSON.parse(field.dataset.next)[label];
+  if (next) return openMenu(field, next);  // Nested prompt (e.g. Event/Conference > GTC 2025)
+  if (field.dataset.chips !== undefined) {
+    const chips = field.closest('[data-automation-id^="formField-"]').querySelector('.chips');
+    chips.innerHTML = `<div data-automation-id="selectedItem">${label}<svg class="wd-icon-x" width="8" height="8"></svg></div>`;
+    field.value = '';
+  } else if (field.tagName === 'BUTTON') {
+    field.innerText = label;
+  } else {
+    field.value = label;
+  }
+  field.dataset.value = label;
+  closeMenus();
+}
+
+document.addEventListener('click', event => {
+  if (!event.target.isConnected) return;  // An option that was just picked
+  const chip = event.target.closest('.wd-icon-x');
+  if (chip) return chip.closest('[data-automation-id="selectedItem"]').remove();
+  const field = event.target.closest('[data-options]');
+  if (field) return openMenu(field, JSON.parse(field.dataset.options));
+  if (!event.target.closest('.css-menu, [data-suggest]')) closeMenus();
+});
+
+document.addEventListener('input', async event => {
+  const field = event.target;
+  if (field.dataset.options) {
+    const query = field.value.toLowerCase();
+    openMenu(field, JSON.parse(field.dataset.options).filter(label => label.toLowerCase().includes(query)));
+  } else if (field.dataset.suggest && field.value.length >= 2) {
+    const response = await fetch(endpoint('suggest', {field: field.dataset.suggest, q: field.value}));
+    if (response.ok) openMenu(field, await response.json());
+  }
+});
+
+document.addEventListener('change', async event => {
+  const input = event.target;
+  if (input.type !== 'file' || input.dataset.upload === undefined || !input.files.length) return;
+  const status = document.getElementById(input.id + '-status');
+  status.innerText = 'Uploading...';
+  const response = await fetch(endpoint('upload'), {method: 'POST', body: input.files[0]});
+  status.innerText = response.ok ? input.files[0].name : 'Upload failed';
+  status.setAttribute('data-automation-id', response.ok ? 'file-upload-successful' : 'errorMessage');
+});
+"""
+
+
+def _page(title: str, body: str, script: str = "") -> str:
+    return f"""<!doctype html>
+<html><head><meta charset="utf-8"><title>{html.escape(title)}</title>
+<style>.css-menu {{ border: 1px solid #ccc; }} .css-opt {{ padding: 4px; cursor: pointer; }}</style>
+</head><body>{body}<script>{WIDGETS_JS}{script}</script></body></html>"""
+
+
+def _options(labels) -> str:
+    return html.escape(json.dumps(list(labels)))
+
+
+# ==================== Greenhouse ====================
+
+YES_NO = ("Yes", "No")
+COUNTRIES = ("Canada +1", "Germany +49", "Japan +81", "United Kingdom +44", "United States +1")
+
+# (kind, label, options); kind is "text", "textarea" or "select"
+GREENHOUSE_BASIC = (
+    ("text", "First Name*", ()),
+    ("text", "Last Name*", ()),
+    ("text", "Email*", ()),
+    ("select", "Country*", COUNTRIES),
+    ("text", "Phone*", ()),
+)
+
+GREENHOUSE_QUESTIONS = {
+    "anthropic": (
+        ("text", "Personal Preferences", ()),
+        ("text", "Website", ()),
+        ("text", "Publications (e.g. Google Scholar) URL", ()),
+        ("text", "GitHub Profile", ()),
+        ("select", "Are you open to working in-person in one of our offices 25% of the time?", YES_NO),
+        ("text", "When is the earliest you would want to start working with us?", ()),
+        ("text", "Do you have any deadlines or timeline considerations we should be aware of?", ()),
+        ("select", "AI Policy for Application", YES_NO),
+        ("textarea", "Why Anthropic?", ()),
+        ("textarea", "What is the most impressive low-level performance work you have done?", ()),
+        ("textarea", "Additional Information", ()),
+        ("select", "Are you open to relocation for this role?", YES_NO),
+        ("select", "Have you ever interviewed at Anthropic before?", YES_NO),
+        ("select", "Do you require visa sponsorship?", YES_NO),
+        ("select", "Gender", ("Male", "Female", "Decline To Self Identify")),
+        ("select", "Are you Hispanic/Latino?", ("Yes", "No", "Decline To Self Identify")),
+        ("select", "Please identify your race", ("Asian", "White", "Two or More Races", "Decline To Self Identify")),
+        ("select", "Veteran Status", ("I am a veteran", "I am not a protected veteran", "I don't wish to answer")),
+        ("select", "Disability Status", (
+            "Yes, I have a disability, or have had one in the past",
+            "No, I do not have a disability and have not had one in the past",
+            "I do not want to answer",
+        )),
+    ),
+}
+
+GREENHOUSE_DEFAULT_QUESTIONS = (
+    ("text", "Website", ()),
+    ("text", "LinkedIn Profile", ()),
+    ("textarea", "Why do you want to join us?", ()),
+)
+
+
+def _greenhouse_field(index: int, kind: str, label: str, options) -> str:
+    field_id = "country" if label == "Country*" else f"question_{index}"
+    text = html.escape(label.rstrip("*")) + ("<span>*</span>" if label.endswith("*") else "")
+    if kind == "select":
+        control = (f'<input id="{field_id}" role="combobox" aria-labelledby="{field_id}-label" '
+                   f'class="select__control" autocomplete="off" data-options="{_options(options)}">')
+    elif kind == "textarea":
+        control = f'<textarea id="{field_id}"></textarea>'
+    else:
+        control = f'<input id="{field_id}" type="text">'
+    return f'<div class="field"><label id="{field_id}-label" for="{field_id}">{text}</label>{control}</div>'
+
+
+def greenhouse_page(company: str, job_id: str) -> str:
+    questions = GREENHOUSE_BASIC + GREENHOUSE_QUESTIONS.get(company, GREENHOUSE_DEFAULT_QUESTIONS)
+    fields = "\n".join(_greenhouse_field(i, *question) for i, question in enumerate(questions))
+    body = f"""<main><h1>{html.escape(company.title())} application (job {html.escape(job_id)})</h1>
+<form id="application-form" onsubmit="return false">
+{fields}
+<div class="field" aria-label="Resume/CV*" role="group"><label for="resume">Resume/CV*</label>
+  <button type="button" onclick="document.getElementById('resume').click()">Attach</button>
+  <input id="resume" type="file" data-upload style="display:none"><span id="resume-status"></span></div>
+<button type="submit" id="submit_app">Submit application</button>
+</form></main>"""
+    script = """
+document.getElementById('application-form').addEventListener('submit', async () => {
+  const response = await fetch(endpoint('submit'), {method: 'POST'});
+  document.querySelector('main').innerHTML = response.ok
+    ? '<h1>Thank you for applying.</h1>' : '<div class="error" role="alert">Something went wrong. Please try again.</div>';
+});"""
+    return _page(f"Job Application for {company.title()}", body, script)
+
+
+# ==================== Ashby ====================
+
+ASHBY_FIELDS = (
+    ("_systemfield_name", "Name"),
+    ("_systemfield_email", "Email"),
+    ("44d2e6b6-9bdf-44ab-b068-3d70459b2b61", "GitHub Link"),
+    ("dfc4cc4e-8ea1-41af-8fad-2c436934bdd9", "LinkedIn Profile"),
+)
+
+
+def ashby_page(org: str) -> str:
+    text = "".join(
+        f'<div class="field"><label for="{field_id}">{label}</label><input id="{field_id}" type="text"></div>'
+        for field_id, label in ASHBY_FIELDS
+    )
+    days = "".join(f'<div role="option" class="css-opt">{day}</div>' for day in range(1, 32))
+    body = f"""<main><h1>{html.escape(org.title())} application</h1><div id="form">
+<div><h2>Application</h2></div><div></div>
+<div><div>
+{text}
+<div class="field"><label for="_systemfield_resume">Resume</label><input id="_systemfield_resume" type="file" data-upload><span id="_systemfield_resume-status"></span></div>
+<div class="field"><label for="d5fd375a-e8e3-420a-b915-d70085f610b2">Phone number</label><input id="d5fd375a-e8e3-420a-b915-d70085f610b2" type="tel"></div>
+<div class="field"><label for="location">Location</label><div><input id="location" role="combobox" data-suggest="location"></div></div>
+<div class="field"><div><div><input id="start-date" placeholder="MM/DD/YYYY" onclick="document.getElementById('picker').hidden = false"></div></div>
+  <div id="picker" hidden><div><div><div></div><div><div><div><div><button type="button">Previous</button><button type="button">Next</button></div></div></div><div role="listbox">{days}</div></div></div></div></div></div>
+<div class="field"><div><label>Do you require visa sponsorship?</label></div><div><button type="button" aria-pressed="false">Yes</button><button type="button" aria-pressed="false">No</button></div></div>
+<div class="field"><div><button type="button" aria-pressed="false">Yes</button><button type="button" aria-pressed="false">No</button></div></div>
+</div></div>
+<button type="button" id="submit">Submit Application</button>
+</div></main>"""
+    script = """
+document.getElementById('picker').addEventListener('click', event => {
+  const day = event.target.closest('[role="option"]');
+  if (day) { document.getElementById('start-date').value = `12/${day.innerText.padStart(2, '0')}/2025`; event.currentTarget.hidden = true; }
+});
+document.querySelectorAll('[aria-pressed]').forEach(button => button.addEventListener('click', () => {
+  button.parentElement.querySelectorAll('[aria-pressed]').forEach(other => other.setAttribute('aria-pressed', other === button));
+}));
+document.getElementById('submit').addEventListener('click', async () => {
+  const response = await fetch(endpoint('submit'), {method: 'POST'});
+  document.querySelector('main').innerHTML = response.ok ? '<h1>Application submitted</h1>' : '<div role="alert">Submission failed</div>';
+});"""
+    return _page(f"{org.title()} - Application", body, script)
+
+
+# ==================== Workday ====================
+
+WORKDAY_STEPS = (
+    ("my-information", "My Information", "applyFlowMyInfoPage"),
+    ("my-experience", "My Experience", "applyFlowMyExpPage"),
+    ("review", "Review", "applyFlowReviewPage"),
+)
+
+HOW_HEARD = {
+    "Event/Conference": ["GTC 2025", "SIGGRAPH", "NeurIPS 2025"],
+    "Job Board": ["Indeed", "LinkedIn", "Glassdoor"],
+    "Associations": ["IEEE", "ACM"],
+}
+PHONE_CODES = ("Canada (+1)", "Germany (+49)", "United Kingdom (+44)", "United States of America (+1)")
+DEGREES = ("High School Diploma", "Associate's Degree", "Bachelor's Degree", "Master's Degree", "Doctorate")
+FIELDS_OF_STUDY = ("Computer Engineering", "Computer Science", "Electrical Engineering", "Mathematics", "Physics")
+
+# Required fields per step, checked by the save endpoint like Workday's validation
+WORKDAY_REQUIRED = {
+    "my-information": {
+        "name--legalName--firstName": "First Name",
+        "name--legalName--lastName": "Last Name",
+        "phoneNumber--phoneNumber": "Phone Number",
+    },
+}
+
+
+def _wd_field(name: str, label: str, control: str) -> str:
+    return (f'<div data-automation-id="formField-{name}"><label for="{name}">{label}</label>'
+            f'<div class="css-1wrap"><div class="css-2inner">{control}</div></div><div class="chips"></div></div>')
+
+
+def _workday_my_information() -> str:
+    events = html.escape(json.dumps(HOW_HEARD))
+    return "\n".join((
+        _wd_field("source", "How Did You Hear About Us?",
+                  f'<input id="source--source" data-chips data-options="{_options(HOW_HEARD)}" data-next="{events}">'),
+        '<fieldset data-automation-id="formField-candidateIsPreviousWorker"><legend>Have you previously worked for NVIDIA?</legend>'
+        '<label><input type="radio" name="candidateIsPreviousWorker" value="true">Yes</label>'
+        '<label><input type="radio" name="candidateIsPreviousWorker" value="false">No</label></fieldset>',
+        _wd_field("country", "Country",
+                  f'<button type="button" id="country--country" data-options="{_options(["United States of America", "Canada"])}">United States of America</button>'),
+        _wd_field("legalName--firstName", "First Name", '<input id="name--legalName--firstName" type="text">'),
+        _wd_field("legalName--lastName", "Last Name", '<input id="name--legalName--lastName" type="text">'),
+        _wd_field("phoneType", "Phone Device Type",
+                  '<button type="button" id="phoneNumber--phoneType" onclick="this.nextElementSibling.hidden = !this.nextElementSibling.hidden">Select One</button>'
+                  '<ul role="listbox" hidden onclick="const li = event.target.closest(\'li\'); if (li) { this.previousElementSibling.innerText = li.innerText; this.hidden = true; }">'
+                  + "".join(f"<li><div>{kind}</div></li>" for kind in ("Home", "Mobile", "Work")) + "</ul>"),
+        _wd_field("countryPhoneCode", "Country Phone Code",
+                  f'<input id="phoneNumber--countryPhoneCode" data-chips data-options="{_options(PHONE_CODES)}">'),
+        _wd_field("phoneNumber", "Phone Number", '<input id="phoneNumber--phoneNumber" type="tel">'),
+        _wd_field("phoneExtension", "Phone Extension", '<input id="phoneNumber--phoneExtension" type="text">'),
+    ))
+
+
+def _workday_my_experience() -> str:
+    sections = (("Work Experience", "work"), ("Education", "education"), ("Websites", "web"))
+    return "\n".join(
+        f'<div role="group" aria-labelledby="{key}-heading"><h3 id="{key}-heading">{title}</h3>'
+        f'<div class="entries"></div><button type="button" data-add="{key}">Add</button></div>'
+        for title, key in sections
+    ) + f"""
+<template id="work"><div class="entry">
+  <label>Job Title<input id="workExperience-N--jobTitle"></label>
+  <label>Company<input id="workExperience-N--companyName"></label>
+  <div id="workExperience-N--startDate-dateSectionMonth-display" tabindex="0">MM/YYYY</div><input id="workExperience-N--startDate-input" aria-label="From">
+  <label><input type="checkbox" id="workExperience-N--currentlyWorkHere">I currently work here</label>
+  <div class="end-date"><div id="workExperience-N--endDate-dateSectionMonth-display" tabindex="0">MM/YYYY</div><input id="workExperience-N--endDate-input" aria-label="To"></div>
+  <label>Role Description<textarea id="workExperience-N--roleDescription"></textarea></label>
+</div></template>
+<template id="education"><div class="entry">
+  <label>School or University<input id="education-N--schoolName"></label>
+  <button type="button" id="education-N--degree" aria-label="Degree Select One Required" data-options="{_options(DEGREES)}">Select One</button>
+  <div data-automation-id="formField-fieldOfStudy"><label>Field of Study<input id="education-N--fieldOfStudy" data-chips data-options="{_options(FIELDS_OF_STUDY)}"></label><div class="chips"></div></div>
+  <label>Overall Result (GPA)<input id="education-N--gradeAverage"></label>
+  <input type="number" aria-label="Year" id="education-N--firstYearAttended-dateSectionYear-input">
+  <input type="number" aria-label="To" id="education-N--lastYearAttended-dateSectionYear-input">
+</div></template>
+<template id="web"><div class="entry"><label>URL<input id="webAddress-N--url"></label></div></template>"""
+
+
+WORKDAY_SCRIPT = """
+document.addEventListener('click', event => {
+  const add = event.target.closest('[data-add]');
+  if (add) {
+    const entries = add.parentElement.querySelector('.entries');
+    const n = entries.children.length + 1;
+    entries.insertAdjacentHTML('beforeend', document.getElementById(add.dataset.add).innerHTML.replaceAll('-N--', `-${n}--`));
+    add.innerText = 'Add Another';
+    return;
+  }
+  const display = event.target.closest('[id$="-dateSectionMonth-display"]');
+  if (display) display.nextElementSibling.focus();
+  if (event.target.closest('[data-automation-id="bottom-navigation-next-button"]')) save();
+});
+
+document.addEventListener('change', event => {
+  if (!event.target.id.endsWith('--currentlyWorkHere')) return;
+  event.target.closest('.entry').querySelector('.end-date').hidden = event.target.checked;
+});
+
+async function save() {
+  const page = document.getElementById('wd-step');
+  const values = {};
+  page.querySelectorAll('input, textarea').forEach(input => {
+    if (input.type === 'radio') { if (input.checked) values[input.name] = input.value; }
+    else if (input.type === 'checkbox') values[input.id] = input.checked;
+    else if (input.id) values[input.id] = input.value;
+  });
+  page.querySelectorAll('[data-automation-id="selectedItem"]').forEach(chip => {
+    const field = chip.closest('[data-automation-id^="formField-"]');
+    values[field.getAttribute('data-automation-id').replace('formField-', '')] = chip.innerText.trim();
+  });
+  const response = await fetch(endpoint('save', {step: page.dataset.step}), {
+    method: 'POST', headers: {'Content-Type': 'application/json'}, body: JSON.stringify(values),
+  });
+  const result = await response.json().catch(() => ({}));
+  document.querySelectorAll('[data-automation-id="errorBanner"], [data-automation-id="errorMessage"]').forEach(e => e.remove());
+  if (!response.ok) {
+    page.insertAdjacentHTML('afterbegin', '<div data-automation-id="errorBanner">Errors Found</div>');
+    for (const error of result.errors || []) {
+      const field = document.querySelector(`[data-automation-id="formField-${error.field}"]`);
+      (field || page).insertAdjacentHTML('beforeend', `<div data-automation-id="errorMessage">${error.message}</div>`);
+    }
+    return;
+  }
+  const next = await fetch(location.pathname + '?' + new URLSearchParams({step: result.next, fragment: 1}));
+  document.getElementById('wd-app').innerHTML = await next.text();
+}"""
+
+
+def workday_fragment(step: str) -> str:
+    names = [name for name, _, _ in WORKDAY_STEPS]
+    index = names.index(step)
+    _, title, marker = WORKDAY_STEPS[index]
+    progress = "".join(
+        f'<li><div data-automation-id="{"progressBarActiveStep" if i == index else "progressBarStep"}">{label}</div></li>'
+        for i, (_, label, _) in enumerate(WORKDAY_STEPS)
+    )
+    content = {"my-information": _workday_my_information, "my-experience": _workday_my_experience}.get(step, lambda: "")()
+    buttons = "" if step == "review" else '<button type="button" data-automation-id="bottom-navigation-next-button">Save and Continue</button>'
+    return (f'<ol data-automation-id="progressBar">{progress}</ol>'
+            f'<div id="wd-step" data-step="{step}" data-automation-id="{marker}"><h2>{title}</h2>{content}</div>{buttons}')
+
+
+def workday_posting(tenant: str, job: str) -> str:
+    # The Apply link sits where nvidia.py's positional XPath looks for it
+    link = f'<a data-automation-id="adventureButton" href="{html.escape(job)}/apply">Apply</a>'
+    body = f'<main><div id="mainContent">{"<div>" * 9}{link}{"</div>" * 9}</div></main>'
+    return _page(f"{tenant} Careers", body)
+
+
+def workday_page(tenant: str, step: str) -> str:
+    body = f'<main><div id="mainContent"><div id="wd-app">{workday_fragment(step)}</div></div></main>'
+    return _page(f"{tenant} Careers - Apply", body, WORKDAY_SCRIPT)
+
+
+def workday_save(step: str, values: dict) -> tuple[int, dict]:
+    required = WORKDAY_REQUIRED.get(step, {})
+    errors = [
+        {"field": field_id.split("--", 1)[-1], "message": f"{label} is required"}
+        for field_id, label in required.items() if not str(values.get(field_id, "")).strip()
+    ]
+    if errors:
+        return 400, {"errors": errors}
+    names = [name for name, _, _ in WORKDAY_STEPS]
+    return 200, {"next": names[min(names.index(step) + 1, len(names) - 1)]}
+
+
+# ==================== Indeed SmartApply ====================
+
+INDEED_JOB_KEY = "0a1b2c3d4e5f6789"  # Job key the mock SmartApply pages expose, like the live ones
+
+# Module path -> (heading, fields as (test id, label)); contact info and location share a path
+INDEED_MODULES = {
+    "resume-selection-module": ("Add a resume for the employer", ()),
+    "contact-info-module": ("Add your contact information", (
+        ("name-fields-first-name-input", "First name"),
+        ("name-fields-last-name-input", "Last name"),
+        ("phone-number-input", "Type phone number"),
+    )),
+    "contact-info-module?part=location": ("Review your location details", (
+        ("location-fields-postal-code-input", "Postal code"),
+        ("location-fields-locality-input", "City, State"),
+        ("location-fields-address-input", "Street address"),
+    )),
+    "work-experience-module": ("Enter a past job that shows relevant experience", (
+        ("job-title-input", "Job title"),
+        ("company-name-input", "Company"),
+    )),
+    "questions-module": ("Answer these questions from the employer", ()),
+    "review-module": ("Please review your application", ()),
+}
+INDEED_ORDER = list(INDEED_MODULES)
+
+SUGGESTIONS = {
+    "job-title": ["Security Officer", "Security Guard", "Software Engineer", "Senior Software Engineer"],
+    "company": ["Warner Bros", "Warner Bros. Discovery", "Apple", "Google"],
+    "location": ["San Mateo, California, United States", "San Francisco, California, United States", "San Jose, California, United States"],
+}
+
+
+def indeed_page(module: str) -> str:
+    heading, fields = INDEED_MODULES[module]
+    inputs = "".join(
+        f'<div><label for="{test_id}">{label}</label><input id="{test_id}" name="{test_id}" data-testid="{test_id}"'
+        + (f' aria-label="{label}"' if test_id == "phone-number-input" else "")
+        + (f' role="combobox" data-suggest="{test_id.removesuffix("-input").removesuffix("-name")}"' if test_id in ("job-title-input", "company-name-input") else "")
+        + "></div>"
+        for test_id, label in fields
+    )
+    if module == "questions-module":
+        inputs = """<fieldset aria-required="true"><legend>Are you authorized to work in the United States? *</legend>
+<label><input type="radio" name="q_0" value="1">Yes</label><label><input type="radio" name="q_0" value="0">No</label></fieldset>
+<div><label for="q_1">How many years of security experience do you have? *</label><input id="q_1" name="q_1" required></div>
+<div><label for="q_2">Anything else you would like the employer to know?</label><textarea id="q_2" name="q_2"></textarea></div>"""
+    if module == "resume-selection-module":
+        inputs = """<div data-testid="resume-selection-file-resume-upload-button-header-subtitle" role="radio" tabindex="0">Upload a resume</div>
+<input type="file" data-testid="resume-selection-file-resume-upload-button-file-input" id="resume" data-upload><span id="resume-status"></span>"""
+    body = f"""<main data-jk="{INDEED_JOB_KEY}"><h1>{heading}</h1><form method="post" action="">{inputs}
+<button type="submit" data-testid="continue-button">Continue</button></form></main>"""
+    return _page("Indeed Apply", body)
+
+
+# ==================== Server ====================
+
+
+class MockATS:
+    """Threaded local HTTP server for the mock flows; usable as a context manager."""
+
+    def __init__(self, faults: dict[str, Fault] | None = None, port: int = 0, seed: int | None = None):
+        """
+        Args:
+            faults: Fault per endpoint kind ("page", "save", "submit", "suggest",
+                    "upload"), per platform and kind ("workday.save"), or "*"
+            port: Port to listen on; 0 picks a free one
+            seed: Seed for jitter and error injection, for reproducible runs
+        """
+        self.faults = faults or {}
+        self.random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.requests: dict[str, int] = {}
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self.server.daemon_threads = True
+        self.thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def url(self, live_url: str) -> str:
+        """Mock URL for a live job board URL."""
+        parsed = urlparse(live_url)
+        return f"{self.base_url}/{parsed.netloc}{parsed.path}" + (f"?{parsed.query}" if parsed.query else "")
+
+    def start(self) -> "MockATS":
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> "MockATS":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def fault(self, platform: str, kind: str) -> Fault:
+        return self.faults.get(f"{platform}.{kind}") or self.faults.get(kind) or self.faults.get("*") or Fault()
+
+    def inject(self, platform: str, kind: str, body_bytes: int = 0) -> bool:
+        """Sleep for the endpoint's latency; returns True if this request should fail."""
+        fault = self.fault(platform, kind)
+        with self._lock:
+            self.requests[f"{platform}.{kind}"] = self.requests.get(f"{platform}.{kind}", 0) + 1
+            jitter = self.random.uniform(-fault.jitter_ms, fault.jitter_ms)
+            failed = self.random.random() < fault.error_rate
+        delay = max(0.0, fault.latency_ms + jitter) / 1000
+        if fault.upload_kbps and body_bytes:
+            delay += body_bytes / 1024 / fault.upload_kbps
+        time.sleep(delay)
+        return failed
+
+    def respond(self, method: str, host: str, path: str, query: dict, body: bytes) -> tuple[int, str, str, dict]:
+        """Dispatch one request; returns (status, content type, body, extra headers)."""
+        platform = {"greenhouse.io": "greenhouse", "ashbyhq.com": "ashby", "myworkdayjobs.com": "workday",
+                    "smartapply.indeed.com": "indeed"}.get(host_key(f"https://{host}/"))
+        action = query.get("action", [""])[0]
+        kind = action or ("submit" if method == "POST" else "page")
+        if platform is None:
+            return 404, "text/plain", f"No mock for {host}", {}
+        if self.inject(platform, kind, len(body)):
+            if kind == "page":
+                return 503, "text/html", "<h1>Service Unavailable</h1>", {}
+            return 503, "application/json", json.dumps({"errors": [{"message": f"Injected {kind} failure"}]}), {}
+
+        segments = [segment for segment in path.split("/") if segment]
+        if action == "suggest":
+            field, q = query.get("field", [""])[0], query.get("q", [""])[0].lower()
+            labels = [label for label in SUGGESTIONS.get(field, []) if q in label.lower()]
+            return 200, "application/json", json.dumps(labels), {}
+        if action in ("upload", "submit"):
+            return 200, "application/json", json.dumps({"ok": True}), {}
+
+        if platform == "greenhouse":
+            company, job_id = (segments[0], segments[-1]) if segments else ("company", "")
+            return 200, "text/html", greenhouse_page(company, job_id), {}
+        if platform == "ashby":
+            return 200, "text/html", ashby_page(segments[0] if segments else "company"), {}
+        if platform == "workday":
+            if action == "save":
+                status, payload = workday_save(query.get("step", ["my-information"])[0], json.loads(body or b"{}"))
+                return status, "application/json", json.dumps(payload), {}
+            tenant = host.split(".")[0]
+            if "/job/" in path and segments[-1] != "apply" and "step" not in query:
+                return 200, "text/html", workday_posting(tenant, segments[-1]), {}
+            step = query.get("step", ["my-information"])[0]
+            if step not in [name for name, _, _ in WORKDAY_STEPS]:
+                return 404, "text/plain", f"Unknown step {step}", {}
+            if query.get("fragment"):
+                return 200, "text/html", workday_fragment(step), {}
+            return 200, "text/html", workday_page(tenant, step), {}
+
+        # Indeed: each Continue posts the module and redirects to the next one
+        module = segments[-1] if segments else ""
+        if "part" in query:
+            module += f"?part={query['part'][0]}"
+        if module not in INDEED_MODULES:
+            return 404, "text/plain", f"Unknown module {module}", {}
+        if method == "POST":
+            following = INDEED_ORDER[min(INDEED_ORDER.index(module) + 1, len(INDEED_ORDER) - 1)]
+            return 303, "text/plain", "", {"Location": following}
+        return 200, "text/html", indeed_page(module), {}
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _serve(self, method: str) -> None:
+                parsed = urlparse(self.path)
+                host, _, path = parsed.path.lstrip("/").partition("/")
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0)) if method == "POST" else b""
+                status, content_type, text, headers = server.respond(method, host, "/" + path, parse_qs(parsed.query), body)
+                data = text.encode()
+                self.send_response(status)
+                self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                self._serve("GET")
+
+            def do_POST(self):
+                self._serve("POST")
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+async def route_to_mock(target, server: MockATS) -> None:
+    """Serve the live job board URLs of a page or context from the mock server."""
+
+    async def handle(route):
+        response = await route.fetch(url=server.url(route.request.url), max_redirects=0)
+        await route.fulfill(response=response)
+
+    await target.route(LIVE_URL, handle)
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8765
+    with MockATS(port=port) as mock:
+        print(f"Mock ATS on {mock.base_url}, e.g. {mock.url('https://job-boards.greenhouse.io/anthropic/jobs/4020350008')}")
+        try:
+            mock.thread.join()
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,151 @@
+"""
+Animation and transition suppression for faster settling UIs.
+
+Workday popups, Greenhouse react-select menus and Ashby date pickers animate
+in. The fill functions wait for an opened menu to settle (wait_until_settled)
+instead of sleeping a fixed time. The init script below adds a reduced-motion
+stylesheet to every document before its own scripts run, zeroing animation
+and transition durations, so menus settle as soon as they mount. Pages also
+get `prefers-reduced-motion: reduce`, which component libraries honour on
+their own. Set JOB_APPLY_SUPPRESS_MOTION=0 to leave the pages animated.
+
+Run this module to benchmark settle time with and without suppression:
+
+    python common/motion.py
+"""
+
+import asyncio
+import json
+import os
+
+from playwright.async_api import BrowserContext, Page, async_playwright
+
+REDUCED_MOTION_CSS = """
+*, *::before, *::after {
+    animation-duration: 0s !important;
+    animation-delay: 0s !important;
+    animation-iteration-count: 1 !important;
+    transition-duration: 0s !important;
+    transition-delay: 0s !important;
+    scroll-behavior: auto !important;
+    caret-color: auto !important;
+}
+"""
+
+# Runs before the page's own scripts, so the first render is already static
+INIT_SCRIPT = """(() => {
+    const css = %s;
+    const install = () => {
+        if (document.getElementById('__reduced_motion')) return;
+        const style = document.createElement('style');
+        style.id = '__reduced_motion';
+        style.textContent = css;
+        (document.head || document.documentElement).appendChild(style);
+    };
+    if (document.documentElement) install();
+    document.addEventListener('DOMContentLoaded', install);
+})()""" % json.dumps(REDUCED_MOTION_CSS)
+
+# An open dropdown, popup or date picker menu
+MENU = '[role="listbox"]'
+
+# Resolves once an element matching the selector is visible and no animation is running on the page
+SETTLED_JS = """(selector) => {
+    const visible = [...document.querySelectorAll(selector)].some(el => el.getClientRects().length > 0);
+    return visible && document.getAnimations().every(animation => animation.playState !== 'running');
+}"""
+
+
+async def suppress_motion(target: Page | BrowserContext) -> None:
+    """
+    Disable CSS animations and transitions for a page or every page of a context.
+
+    Affects documents loaded after the call; on a page that already has a
+    document, the stylesheet is also added to it right away. Does nothing
+    when JOB_APPLY_SUPPRESS_MOTION is "0".
+    """
+    if os.environ.get("JOB_APPLY_SUPPRESS_MOTION", "1") == "0":
+        return
+    await _suppress(target)
+
+
+async def _suppress(target: Page | BrowserContext) -> None:
+    await target.add_init_script(script=INIT_SCRIPT)
+    pages = target.pages if isinstance(target, BrowserContext) else [target]
+    for page in pages:
+        await page.emulate_media(reduced_motion="reduce")
+        if page.url != "about:blank":
+            await page.evaluate(INIT_SCRIPT)
+
+
+async def wait_until_settled(page: Page, selector: str = MENU, timeout: float = 5000) -> None:
+    """Wait until an element matching `selector` is visible and the page's animations have finished."""
+    await page.wait_for_function(SETTLED_JS, arg=selector, timeout=timeout, polling="raf")
+
+
+# Menus that animate like the ones on the job boards: a Workday popup
+# (opacity and transform transition) and a react-select menu (keyframes)
+BENCHMARK_HTML = """<!doctype html>
+<style>
+  .popup { opacity: 0; transform: translateY(-8px); transition: opacity 250ms ease, transform 250ms ease; }
+  .popup.open { opacity: 1; transform: none; }
+  @keyframes drop { from { opacity: 0; transform: scale(0.95); } to { opacity: 1; transform: none; } }
+  .menu { animation: drop 300ms ease-out; }
+</style>
+<button id="popup-trigger">How did you hear about us?</button>
+<button id="menu-trigger">Country</button>
+<div id="root"></div>
+<script>
+  document.getElementById('popup-trigger').onclick = () => {
+    const popup = document.createElement('ul');
+    popup.className = 'popup';
+    popup.setAttribute('data-automation-id', 'activeListContainer');
+    popup.innerHTML = '<li role="option">Event/Conference</li>';
+    document.getElementById('root').replaceChildren(popup);
+    requestAnimationFrame(() => requestAnimationFrame(() => popup.classList.add('open')));
+  };
+  document.getElementById('menu-trigger').onclick = () => {
+    const menu = document.createElement('div');
+    menu.className = 'menu';
+    menu.id = 'react-select-menu';
+    menu.innerHTML = '<div role="option">United States</div>';
+    document.getElementById('root').replaceChildren(menu);
+  };
+</script>"""
+
+BENCHMARK_URL = "http://fixture.local/menus"
+BENCHMARK_CASES = (("Workday popup", "#popup-trigger", '[data-automation-id="activeListContainer"]'),
+                   ("react-select menu", "#menu-trigger", "#react-select-menu"))
+
+
+async def _settle_ms(page: Page, trigger: str, selector: str) -> float:
+    started = await page.evaluate("performance.now()")
+    await page.click(trigger)
+    await page.wait_for_timeout(20)  # Let the transition start before polling for its end
+    await wait_until_settled(page, selector)
+    return await page.evaluate("performance.now()") - started
+
+
+async def benchmark(runs: int = 10) -> None:
+    """Print the median settle time of each fixture menu with and without suppression."""
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        try:
+            for suppressed in (False, True):
+                page = await browser.new_page()
+                if suppressed:
+                    await _suppress(page)  # Regardless of JOB_APPLY_SUPPRESS_MOTION
+                # A real navigation, so init scripts run as they would on a job board
+                await page.route(BENCHMARK_URL, lambda route: route.fulfill(body=BENCHMARK_HTML, content_type="text/html"))
+                await page.goto(BENCHMARK_URL)
+                for name, trigger, selector in BENCHMARK_CASES:
+                    times = sorted([await _settle_ms(page, trigger, selector) for _ in range(runs)])
+                    label = "suppressed" if suppressed else "animated"
+                    print(f"{name:<18} {label:<10} median {times[runs // 2]:6.1f} ms  max {times[-1]:6.1f} ms")
+                await page.close()
+        finally:
+            await browser.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(benchmark())
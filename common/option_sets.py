@@ -0,0 +1,279 @@
+"""
+Upfront validation of application answers against known option sets.
+
+Dropdown answers (race, degree, how you heard, phone device type, ...) must
+match an option label exactly, otherwise `get_by_role("option", name=...)`
+times out deep into a run. Option sets are cached per posting, per board or
+tenant, and per platform; they come from the seeds below, from the
+Greenhouse job API (`harvest_greenhouse_options`), and from the dropdowns
+fill functions open during a run (`record_open_options`).
+`validate_answers` checks a fill function's answers against them and maps
+near-misses to the exact label before any browser is started.
+"""
+
+import inspect
+import re
+
+from playwright.async_api import Page
+
+from common.cache import KeyValueCache
+from common.crawler import fetch
+from common.job_urls import canonical_job_id
+
+YES_NO = ["Yes", "No"]
+
+# Complete option sets taken from the fill functions' documented options, keyed by
+# scope. Dropdowns whose full option list is not known (NVIDIA's how-heard and
+# phone device type) are left out and learned by record_open_options instead.
+KNOWN_OPTIONS = {
+    "greenhouse:anthropic:4020350008": {
+        "in_person_work": YES_NO,
+        "ai_policy": YES_NO,
+        "relocation_open": YES_NO,
+        "previous_interview": YES_NO,
+        "visa_sponsorship": YES_NO,
+        "gender": ["Male", "Female", "Decline To Self Identify"],
+        "hispanic_latino": ["Yes", "No", "Decline To Self Identify"],
+        "race": [
+            "American Indian or Alaskan Native",
+            "Asian",
+            "Black or African American",
+            "White",
+            "Native Hawaiian or Other Pacific Islander",
+            "Two or More Races",
+            "Decline To Self Identify",
+        ],
+        "veteran_status": [
+            "I am not a protected veteran",
+            "I identify as one or more of the classifications of a protected veteran",
+            "I don't wish to answer",
+        ],
+        "disability_status": [
+            "Yes, I have a disability, or have had one in the past",
+            "No, I do not have a disability and have not had one in the past",
+            "I do not want to answer",
+        ],
+    },
+    "greenhouse:figma": {
+        "authorized_to_work": YES_NO,
+        "worked_before": YES_NO,
+    },
+    "greenhouse:xai": {
+        "visa_sponsorship": YES_NO,
+    },
+    "workday:expedia": {
+        "phone_device_type": ["Business", "Mobile", "Telephone"],
+        "how_did_you_hear_about_us": [
+            "Company Career Site",
+            "Current Contingent Worker",
+            "Former Employee",
+            "I am an employee",
+            "I know someone in the company",
+            "Job Advert/Job Board",
+        ],
+    },
+}
+
+DECLINE_MARKERS = ("decline", "don't wish", "do not wish", "do not want", "prefer not", "not to answer")
+
+
+class AnswerValidationError(ValueError):
+    """Raised when answers do not match their option sets; lists every problem found."""
+
+    def __init__(self, job_url: str, problems: list[str]):
+        super().__init__(f"Invalid answers for {job_url}:\n  - " + "\n  - ".join(problems))
+        self.problems = problems
+
+
+_cache: KeyValueCache | None = None
+
+
+def _default_cache() -> KeyValueCache:
+    global _cache
+    if _cache is None:
+        _cache = KeyValueCache("option_sets")
+    return _cache
+
+
+def scopes(job_url: str) -> list[str]:
+    """Return lookup scopes from most to least specific, e.g. posting, tenant, platform."""
+    job_id = canonical_job_id(job_url) or ""
+    parts = job_id.split(":")
+    return [":".join(parts[:n]) for n in range(len(parts), 0, -1) if parts[0] and parts[0] != "url"]
+
+
+def option_set(job_url: str, parameter: str) -> list[str] | None:
+    """Return the most specific known option labels for a parameter, or None."""
+    cache = _default_cache()
+    for scope in scopes(job_url):
+        options = cache.get(f"{scope}|{parameter}") or KNOWN_OPTIONS.get(scope, {}).get(parameter)
+        if options:
+            return options
+    return None
+
+
+def store_option_set(scope: str, parameter: str, options: list[str]) -> None:
+    """Cache harvested option labels for a scope (canonical job id, tenant or platform)."""
+    labels = [label.strip() for label in options if label and label.strip()]
+    if labels:
+        _default_cache().set(f"{scope}|{parameter}", labels)
+
+
+def _normalize(text: str) -> str:
+    return " ".join(re.sub(r"[^\w\s/+()'-]", " ", text.casefold()).split())
+
+
+def map_to_option(value, options: list[str]) -> str | None:
+    """
+    Map an answer onto the exact option label it means.
+
+    Args:
+        value: Answer as configured (str or bool)
+        options: Exact option labels
+
+    Returns:
+        The matching label, or None if the answer is ambiguous or unknown
+    """
+    if isinstance(value, bool):
+        value = "Yes" if value else "No"
+    value = str(value)
+    if value in options:
+        return value
+
+    wanted = _normalize(value)
+    normalized = {_normalize(option): option for option in options}
+    if wanted in normalized:
+        return normalized[wanted]
+
+    if any(marker in wanted for marker in DECLINE_MARKERS):
+        declines = [option for key, option in normalized.items() if any(m in key for m in DECLINE_MARKERS)]
+        if len(declines) == 1:
+            return declines[0]
+
+    for match in (lambda key: key.startswith(wanted), lambda key: wanted in key):
+        candidates = [option for key, option in normalized.items() if match(key)]
+        if len(candidates) == 1:
+            return candidates[0]
+    return None
+
+
+def validate_answers(job_url: str, func, **overrides) -> dict:
+    """
+    Check a fill function's answers against known option sets before starting a browser.
+
+    Args:
+        job_url: URL of the posting the answers are for
+        func: Fill function whose defaults supply answers not given in `overrides`
+        **overrides: Answers to use instead of the function defaults
+
+    Returns:
+        `overrides` with answers mapped to exact labels, plus any default that
+        had to be mapped; control arguments (save, index, ...) pass through untouched
+
+    Raises:
+        AnswerValidationError: If any answer has no matching option
+    """
+    defaults = {
+        name: parameter.default
+        for name, parameter in inspect.signature(func).parameters.items()
+        if name != "page" and parameter.default is not inspect.Parameter.empty
+    }
+    answers = dict(overrides)
+
+    problems = []
+    for name, value in {**defaults, **overrides}.items():
+        if value in ("", None):
+            continue
+        options = option_set(job_url, name)
+        if not options:
+            continue
+        mapped = map_to_option(value, options)
+        if mapped is None:
+            problems.append(f"{name}={value!r} is not one of: {', '.join(options)}")
+        elif mapped != value:
+            print(f"Mapped {name}: {value!r} -> {mapped!r}")
+            answers[name] = mapped
+
+    if problems:
+        raise AnswerValidationError(job_url, problems)
+    return answers
+
+
+def _questions(node):
+    """Yield every {"label", "fields"} question dict in a Greenhouse job payload."""
+    if isinstance(node, dict):
+        if "label" in node and isinstance(node.get("fields"), list):
+            yield node
+        for value in node.values():
+            yield from _questions(value)
+    elif isinstance(node, list):
+        for item in node:
+            yield from _questions(item)
+
+
+async def harvest_greenhouse_options(job_url: str, questions: dict[str, str]) -> dict[str, list[str]]:
+    """
+    Harvest dropdown options for a Greenhouse posting from the public job API (no browser).
+
+    Only parameters without a known option set are looked up, so a posting is
+    fetched at most once. A failed request is reported and leaves the answers
+    unchecked rather than stopping the application.
+
+    Args:
+        job_url: Greenhouse job URL
+        questions: Map of fill-function parameter to (part of) its question label,
+                   e.g. {"race": "Please identify your race"}
+
+    Returns:
+        Map of parameter to harvested option labels (also cached for the posting)
+    """
+    job_id = canonical_job_id(job_url) or ""
+    if not job_id.startswith("greenhouse:"):
+        return {}
+    wanted = {parameter: label for parameter, label in questions.items() if option_set(job_url, parameter) is None}
+    if not wanted:
+        return {}
+
+    _, board, posting_id = job_id.split(":")
+    try:
+        response = await fetch("GET", f"https://boards-api.greenhouse.io/v1/boards/{board}/jobs/{posting_id}?questions=true")
+        payload = response.json()
+    except (OSError, ValueError) as e:
+        print(f"Could not harvest option sets for {job_url}: {e}")
+        return {}
+
+    found = {}
+    for question in _questions(payload):
+        label = question["label"].casefold()
+        for parameter, fragment in wanted.items():
+            if parameter not in found and fragment.casefold() in label:
+                options = [value["label"] for f in question["fields"] for value in f.get("values", [])]
+                if options:
+                    found[parameter] = options
+                    store_option_set(job_id, parameter, options)
+    return found
+
+
+async def record_open_options(page: Page, parameter: str, tenant_wide: bool = True) -> list[str] | None:
+    """
+    Store the labels of the dropdown that is currently open, unless they are already known.
+
+    Fill functions call this right after opening a dropdown, so the option set
+    is learned during a normal run at the cost of one call, once per tenant.
+
+    Args:
+        page: Playwright Page object with the dropdown open
+        parameter: Fill-function parameter the dropdown answers (e.g., "degree")
+        tenant_wide: Store for the whole board/tenant instead of this posting only
+
+    Returns:
+        The option labels read from the page, or None if they were already known
+    """
+    posting_scopes = scopes(page.url)
+    if not posting_scopes or option_set(page.url, parameter) is not None:
+        return None
+    labels = await page.get_by_role("option").all_inner_texts()
+    scope = posting_scopes[1 if tenant_wide and len(posting_scopes) > 1 else 0]
+    store_option_set(scope, parameter, labels)
+    return labels
+
@@ -0,0 +1,181 @@
+"""
+Pacing policy for the artificial delays in the fill functions.
+
+The fill functions sleep with `page.wait_for_timeout(300)` between fields and
+type with `locator.type(text, delay=30)`. Rather than editing those literals,
+a workflow wraps its page with `paced(page, "workday")`: every such delay is
+then rescaled by the platform's policy:
+
+- "fastest": no artificial delay at all
+- "fixed": the literal delay times `scale`
+- "stochastic": a log-normal sample around the scaled delay
+
+A per-application budget caps the total artificial delay; once it is spent,
+the remaining delays are skipped. The pacer also reports how much of a run
+was artificial delay.
+
+Every platform defaults to "fixed" at scale 1.0 with no budget, i.e. the
+delays the code asks for: some of them wait for a dropdown or an upload, so
+shortening them is an opt-in. Opt in per platform in PLATFORM_PACING, or for
+every platform with the JOB_APPLY_PACING (mode), JOB_APPLY_PACING_SCALE and
+JOB_APPLY_PACING_BUDGET (seconds) environment variables.
+"""
+
+import asyncio
+import math
+import os
+import random
+from dataclasses import dataclass, replace
+
+from playwright.async_api import Keyboard, Locator, Page
+
+from common.page_proxy import Proxy, unwrap
+
+MODES = ("fastest", "fixed", "stochastic")
+
+
+@dataclass(frozen=True, slots=True)
+class PacingPolicy:
+    """How a platform's literal delays are turned into real ones."""
+
+    mode: str = "fixed"
+    scale: float = 1.0  # Multiplier on the literal delay ("fixed" and "stochastic")
+    jitter: float = 0.35  # Log-normal sigma ("stochastic")
+    budget_ms: float | None = None  # Max artificial delay per application; None is unlimited
+
+    def __post_init__(self):
+        if self.mode not in MODES:
+            raise ValueError(f"Unknown pacing mode {self.mode!r}; expected one of {MODES}")
+
+
+# Opt-in policies per platform, e.g. "greenhouse": PacingPolicy("stochastic", scale=0.5, budget_ms=8000);
+# anything not listed uses PacingPolicy() and keeps the literal delays
+PLATFORM_PACING: dict[str, PacingPolicy] = {}
+
+
+def policy_for(platform: str) -> PacingPolicy:
+    """The platform's policy with the environment overrides applied."""
+    policy = PLATFORM_PACING.get(platform, PacingPolicy())
+    if mode := os.environ.get("JOB_APPLY_PACING"):
+        policy = replace(policy, mode=mode)
+    if scale := os.environ.get("JOB_APPLY_PACING_SCALE"):
+        policy = replace(policy, scale=float(scale))
+    if budget := os.environ.get("JOB_APPLY_PACING_BUDGET"):
+        policy = replace(policy, budget_ms=float(budget) * 1000)
+    return policy
+
+
+class Pacer:
+    """Applies a PacingPolicy and accounts for the artificial delay it adds."""
+
+    def __init__(self, policy: PacingPolicy, seed: int | None = None):
+        self.policy = policy
+        self.random = random.Random(seed)
+        self.start_application()
+
+    def start_application(self) -> None:
+        """Reset the budget and counters for the next application."""
+        self.requested_ms = 0.0  # Sum of the literal delays in the code
+        self.delayed_ms = 0.0  # Artificial delay actually added
+        self.delays = 0
+        self.skipped = 0  # Delays dropped because the budget was spent
+
+    def sample(self, ms: float) -> float:
+        """The delay the policy assigns to a literal delay of `ms`, within the budget."""
+        policy = self.policy
+        self.requested_ms += ms
+        self.delays += 1
+        if policy.mode == "fastest" or ms <= 0:
+            return 0.0
+        ms *= policy.scale
+        if policy.mode == "stochastic":
+            # Median at the scaled delay; sigma spreads it without going negative
+            ms *= math.exp(self.random.gauss(0, policy.jitter))
+        if policy.budget_ms is not None:
+            left = policy.budget_ms - self.delayed_ms
+            if left <= 0:
+                self.skipped += 1
+                return 0.0
+            ms = min(ms, left)
+        self.delayed_ms += ms
+        return ms
+
+    async def sleep(self, ms: float) -> None:
+        if (delay := self.sample(ms)) > 0:
+            await asyncio.sleep(delay / 1000)
+
+    def keystroke_delay(self, delay: float, text: str) -> float:
+        """Per-keystroke delay for typing `text`, accounted as one delay over all keys."""
+        if not delay or not text:
+            return 0
+        return self.sample(delay * len(text)) / len(text)
+
+    def report(self) -> dict:
+        return {
+            "mode": self.policy.mode,
+            "requested_ms": round(self.requested_ms),
+            "delayed_ms": round(self.delayed_ms),
+            "delays": self.delays,
+            "skipped": self.skipped,
+        }
+
+    def summary(self, elapsed: float | None = None) -> str:
+        """One line for the end of an application; `elapsed` (seconds) adds the delay's share."""
+        line = (
+            f"Pacing ({self.policy.mode}): {self.delayed_ms / 1000:.1f}s artificial delay "
+            f"over {self.delays} delays (code asked for {self.requested_ms / 1000:.1f}s"
+        )
+        if self.skipped:
+            line += f", {self.skipped} skipped by the budget"
+        line += ")"
+        if elapsed:
+            line += f", {self.delayed_ms / 10 / elapsed:.0f}% of the run"
+        return line
+
+
+class _Paced(Proxy):
+    def __init__(self, target, pacer: Pacer):
+        super().__init__(target)
+        self.pacer = pacer
+
+    def _child(self, value):
+        if isinstance(unwrap(value), Keyboard):
+            return _PacedKeyboard(value, self.pacer)
+        if isinstance(unwrap(value), Locator):
+            return _PacedLocator(value, self.pacer)
+        return _Paced(value, self.pacer)
+
+
+class _PacedLocator(_Paced):
+    async def type(self, text: str, delay: float | None = None, **kwargs):
+        return await self._target.type(text, delay=self.pacer.keystroke_delay(delay, text), **kwargs)
+
+    async def press_sequentially(self, text: str, delay: float | None = None, **kwargs):
+        return await self._target.press_sequentially(text, delay=self.pacer.keystroke_delay(delay, text), **kwargs)
+
+
+class _PacedKeyboard(_Paced):
+    async def type(self, text: str, delay: float | None = None):
+        return await self._target.type(text, delay=self.pacer.keystroke_delay(delay, text))
+
+
+class PacedPage(_Paced):
+    """A Page whose `wait_for_timeout` and typing delays follow a pacing policy."""
+
+    async def wait_for_timeout(self, timeout: float) -> None:
+        await self.pacer.sleep(timeout)
+
+
+def paced(page: Page, platform: str, seed: int | None = None) -> PacedPage:
+    """
+    Wrap a page so its artificial delays follow the platform's pacing policy.
+
+    Args:
+        page: Playwright page passed on to the fill functions
+        platform: Key into PLATFORM_PACING (e.g., "workday")
+        seed: Seed for the stochastic mode, for reproducible runs
+
+    Returns:
+        PacedPage; its `pacer` reports the artificial delay of the run
+    """
+    return PacedPage(page, Pacer(policy_for(platform), seed))
@@ -0,0 +1,59 @@
+"""
+Transparent stand-ins for the Playwright page handed to the fill functions.
+
+Pacing and run tracing both change what a page does without touching the
+call sites. A proxy delegates every attribute to the object it wraps and
+re-wraps the locators, frame locators, keyboard and mouse it hands out, so
+`page.locator(...).first.click()` still goes through it. Proxies nest: a
+traced page can wrap a paced one.
+"""
+
+import asyncio
+
+from playwright.async_api import FrameLocator, Keyboard, Locator, Mouse
+
+HANDED_OUT = (Locator, FrameLocator, Keyboard, Mouse)
+
+
+def unwrap(obj):
+    """The Playwright object underneath any number of proxies."""
+    while isinstance(obj, Proxy):
+        obj = obj._target
+    return obj
+
+
+def _handed_out(value) -> bool:
+    return isinstance(unwrap(value), HANDED_OUT)
+
+
+class Proxy:
+    """Delegates to a Playwright object; subclasses override the hooks."""
+
+    def __init__(self, target):
+        self._target = target
+
+    def _child(self, value):
+        """Wrap a locator, frame locator, keyboard or mouse handed out by the target."""
+        raise NotImplementedError
+
+    def _call(self, name: str, method):
+        """Wrap an async method of the target (e.g. `click`); unchanged by default."""
+        return method
+
+    def __getattr__(self, name):
+        value = getattr(self._target, name)
+        if _handed_out(value):  # e.g. `locator.first` or `page.keyboard`
+            return self._child(value)
+        if asyncio.iscoroutinefunction(value):
+            return self._call(name, value)
+        if not callable(value):
+            return value
+
+        def wrapped(*args, **kwargs):
+            result = value(*args, **kwargs)
+            return self._child(result) if _handed_out(result) else result
+
+        return wrapped
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._target!r})"
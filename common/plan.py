@@ -0,0 +1,164 @@
+"""
+Application steps expressed as data, plus an optimizer pass over them.
+
+The scripts started as recorder output: every field is click() then fill(),
+pixel scrolls and fixed sleeps sit between actions. Written as a plan (a list
+of Steps), the same flow can be optimized before it runs:
+
+- a click on the same target right before a fill is dropped (fill focuses)
+- scrolls are dropped (Playwright scrolls elements into view before acting)
+- sleeps right after a fill or upload are dropped (nothing is settling)
+- adjacent sleeps are merged into the longest one
+- independent fills are moved ahead of dropdown interactions inside a
+  segment, so they run back-to-back; barriers (navigation, custom steps,
+  uploads and every click not marked independent) are never crossed, and
+  the settle wait right after a barrier stays with it
+"""
+
+from dataclasses import dataclass, replace
+
+from playwright.async_api import Locator, Page
+
+from common.job_urls import same_posting
+
+# Rough cost of one Playwright action (CDP round trips plus actionability checks)
+ACTION_COST_MS = 60
+
+
+@dataclass(frozen=True, slots=True)
+class Step:
+    """
+    One plan step.
+
+    target is a locator spec: ("role", role, name[, exact]), ("label", text),
+    ("test_id", id) or ("css", selector). value depends on the action: URL for
+    goto, text for fill, file path for upload, ms for wait, (x, y) for scroll
+    and an async callable taking the page for call.
+    """
+
+    action: str  # goto, click, fill, upload, wait, scroll, call
+    target: tuple = ()
+    value: object = None
+    note: str = ""
+    barrier: bool = False  # Steps are never reordered across a barrier
+    independent: bool = False  # A click that only affects its own widget (e.g. a dropdown) is not a barrier
+
+    @property
+    def is_barrier(self) -> bool:
+        # A click can open a section, reveal an input or navigate, so it is a barrier unless marked otherwise
+        return self.barrier or self.action in ("goto", "call", "upload") or (self.action == "click" and not self.independent)
+
+
+def locate(page: Page, target: tuple) -> Locator:
+    """Build a Locator from a step's target spec."""
+    kind, *args = target
+    if kind == "role":
+        role, name, *exact = args
+        return page.get_by_role(role, name=name, exact=bool(exact and exact[0]))
+    if kind == "label":
+        return page.get_by_label(args[0])
+    if kind == "test_id":
+        return page.get_by_test_id(args[0])
+    if kind == "css":
+        return page.locator(args[0])
+    raise ValueError(f"Unknown target kind: {kind}")
+
+
+def estimated_ms(steps: list[Step]) -> int:
+    """Estimate plan duration: the sleeps plus a fixed cost per action."""
+    return sum(step.value if step.action == "wait" else ACTION_COST_MS for step in steps)
+
+
+def _drop_redundant(steps: list[Step]) -> list[Step]:
+    kept = []
+    for i, step in enumerate(steps):
+        following = steps[i + 1] if i + 1 < len(steps) else None
+        if step.action == "click" and following and following.action == "fill" and following.target == step.target:
+            continue
+        if step.action == "scroll":
+            continue
+        if step.action == "wait" and kept and kept[-1].action in ("fill", "upload"):
+            continue
+        kept.append(step)
+    return kept
+
+
+def _merge_waits(steps: list[Step]) -> list[Step]:
+    merged = []
+    for step in steps:
+        if step.action == "wait" and merged and merged[-1].action == "wait":
+            merged[-1] = replace(merged[-1], value=max(merged[-1].value, step.value))
+        else:
+            merged.append(step)
+    return merged
+
+
+def _segments(steps: list[Step]) -> list[list[Step]]:
+    segments, current = [], []
+    for step in steps:
+        if step.is_barrier:
+            if current:
+                segments.append(current)
+            segments.append([step])
+            current = []
+        elif step.action == "wait" and not current and segments and segments[-1][-1].is_barrier:
+            segments[-1].append(step)  # The barrier's settle wait (e.g. after navigation) stays right after it
+        else:
+            current.append(step)
+    if current:
+        segments.append(current)
+    return segments
+
+
+def _reorder(steps: list[Step]) -> list[Step]:
+    """Within each segment, run independent fills first, then the rest in order."""
+    ordered = []
+    for segment in _segments(steps):
+        if segment[0].is_barrier:
+            ordered += segment
+            continue
+        independent = [step.action == "fill" and step.target[0] != "css" for step in segment]
+        ordered += [step for step, moved in zip(segment, independent) if moved]
+        ordered += [step for step, moved in zip(segment, independent) if not moved]
+    return ordered
+
+
+def optimize(steps: list[Step], name: str = "plan") -> list[Step]:
+    """
+    Optimize a plan and print the before/after step count and estimated saving.
+
+    Args:
+        steps: Plan as written (recorder order, with its clicks, scrolls and sleeps)
+        name: Plan name for the printed summary
+
+    Returns:
+        The optimized plan
+    """
+    optimized = _merge_waits(_reorder(_drop_redundant(steps)))
+    optimized = _merge_waits(_drop_redundant(optimized))
+    saved = estimated_ms(steps) - estimated_ms(optimized)
+    print(f"Optimized {name}: {len(steps)} -> {len(optimized)} steps, ~{saved / 1000:.1f}s saved")
+    return optimized
+
+
+async def run_plan(page: Page, steps: list[Step]) -> None:
+    """Execute plan steps in order on a page."""
+    for step in steps:
+        if step.action == "goto":
+            if not same_posting(page.url, step.value):  # A runner may have prefetched the page already
+                await page.goto(step.value, wait_until="load")
+        elif step.action == "click":
+            await locate(page, step.target).click()
+        elif step.action == "fill":
+            await locate(page, step.target).fill(step.value)
+        elif step.action == "upload":
+            await locate(page, step.target).set_input_files(step.value)
+        elif step.action == "wait":
+            await page.wait_for_timeout(step.value)
+        elif step.action == "scroll":
+            await page.mouse.wheel(*step.value)
+        elif step.action == "call":
+            await step.value(page)
+        else:
+            raise ValueError(f"Unknown step action: {step.action}")
+
@@ -0,0 +1,167 @@
+"""
+Local change index for crawled job postings.
+
+Stores one row per posting (board, posting id, content hash, HTTP validators,
+first/last seen) plus the validators of each board listing, so a refresh can
+send conditional requests and only report postings that are new or changed.
+"""
+
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+
+from common.storage import connect
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS postings (
+    board TEXT NOT NULL,
+    posting_id TEXT NOT NULL,
+    url TEXT,
+    content_hash TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    PRIMARY KEY (board, posting_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS boards (
+    board TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    last_crawled REAL
+) WITHOUT ROWID;
+"""
+
+
+@dataclass
+class IndexedPosting:
+    """A posting row as stored in the index."""
+
+    board: str
+    posting_id: str
+    url: str
+    content_hash: str
+    etag: str | None
+    last_modified: str | None
+    first_seen: float
+    last_seen: float
+
+
+def content_hash(data) -> str:
+    """
+    Hash a posting payload independently of key order.
+
+    Args:
+        data: JSON-serializable posting content (dict, list or str)
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON encoding
+    """
+    if not isinstance(data, str):
+        data = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+class PostingIndex:
+    """SQLite-backed index of posting hashes and HTTP validators."""
+
+    def __init__(self, db_name: str = "postings.sqlite3"):
+        self.conn = connect(db_name, SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def get(self, board: str, posting_id: str) -> IndexedPosting | None:
+        """Return the indexed row for a posting, or None if never seen."""
+        row = self.conn.execute(
+            "SELECT * FROM postings WHERE board = ? AND posting_id = ?",
+            (board, posting_id),
+        ).fetchone()
+        return IndexedPosting(**dict(row)) if row else None
+
+    def hashes(self, board: str) -> dict[str, str]:
+        """Return {posting_id: content_hash} for every posting on a board."""
+        rows = self.conn.execute(
+            "SELECT posting_id, content_hash FROM postings WHERE board = ?", (board,)
+        )
+        return {row["posting_id"]: row["content_hash"] for row in rows}
+
+    def board_validators(self, board: str) -> tuple[str | None, str | None]:
+        """Return the (ETag, Last-Modified) pair stored for a board listing."""
+        row = self.conn.execute(
+            "SELECT etag, last_modified FROM boards WHERE board = ?", (board,)
+        ).fetchone()
+        return (row["etag"], row["last_modified"]) if row else (None, None)
+
+    def set_board_validators(self, board: str, etag: str | None, last_modified: str | None) -> None:
+        """Remember the validators returned with a board listing."""
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO boards (board, etag, last_modified, last_crawled) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(board) DO UPDATE SET etag = excluded.etag, "
+                "last_modified = excluded.last_modified, last_crawled = excluded.last_crawled",
+                (board, etag, last_modified, time.time()),
+            )
+
+    def upsert(
+        self,
+        board: str,
+        posting_id: str,
+        url: str,
+        digest: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> bool:
+        """
+        Record a posting as seen now.
+
+        Args:
+            board: Board key (e.g., "greenhouse:anthropic")
+            posting_id: Platform posting id
+            url: Public posting URL
+            digest: Content hash of the posting
+            etag: ETag returned for the posting detail, if any
+            last_modified: Last-Modified returned for the posting detail, if any
+
+        Returns:
+            True if the posting is new or its content hash changed
+        """
+        now = time.time()
+        previous = self.get(board, posting_id)
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO postings (board, posting_id, url, content_hash, etag, last_modified, first_seen, last_seen) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(board, posting_id) DO UPDATE SET url = excluded.url, "
+                "content_hash = excluded.content_hash, "
+                "etag = COALESCE(excluded.etag, postings.etag), "
+                "last_modified = COALESCE(excluded.last_modified, postings.last_modified), "
+                "last_seen = excluded.last_seen",
+                (board, posting_id, url, digest, etag, last_modified, now, now),
+            )
+        return previous is None or previous.content_hash != digest
+
+    def touch(self, board: str, posting_ids) -> None:
+        """Mark unchanged postings as seen now without rewriting their content."""
+        now = time.time()
+        with self.conn:
+            self.conn.executemany(
+                "UPDATE postings SET last_seen = ? WHERE board = ? AND posting_id = ?",
+                [(now, board, posting_id) for posting_id in posting_ids],
+            )
+
+    def touch_board(self, board: str) -> None:
+        """Mark every posting on a board as seen now (board listing was not modified)."""
+        now = time.time()
+        with self.conn:
+            self.conn.execute("UPDATE postings SET last_seen = ? WHERE board = ?", (now, board))
+            self.conn.execute("UPDATE boards SET last_crawled = ? WHERE board = ?", (now, board))
+
+    def stale(self, board: str, before: float) -> list[str]:
+        """Return ids of postings on a board not seen since `before` (likely closed)."""
+        rows = self.conn.execute(
+            "SELECT posting_id FROM postings WHERE board = ? AND last_seen < ?", (board, before)
+        )
+        return [row["posting_id"] for row in rows]
@@ -0,0 +1,427 @@
+"""
+Central applicant profile store.
+
+A profile is loaded lazily from a JSON file (or the profiles SQLite table),
+validated once, and shared by every application in the process. Workflows
+read per-platform projections whose keys match the existing fill-function
+parameter names, so a profile can be passed as `**kwargs_for(func, projection)`
+instead of re-threading dozens of keyword arguments by hand.
+"""
+
+import inspect
+import json
+import os
+import re
+from dataclasses import MISSING, dataclass, field, fields
+from functools import lru_cache
+from pathlib import Path
+
+from common.storage import connect
+
+SAMPLE_PROFILE = Path(__file__).resolve().parent.parent / "profiles" / "sample.json"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    name TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+) WITHOUT ROWID;
+"""
+
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+class ProfileError(ValueError):
+    """Raised when a profile fails validation; lists every problem found."""
+
+    def __init__(self, problems: list[str]):
+        super().__init__("Invalid profile:\n  - " + "\n  - ".join(problems))
+        self.problems = problems
+
+
+@dataclass(frozen=True, slots=True)
+class ContactInfo:
+    first_name: str
+    last_name: str
+    email: str
+    phone: str  # National number, digits only (e.g., "6504443333")
+    phone_country: str = "United States"  # Country name as shown in phone code pickers
+    phone_country_code: str = "+1"
+    address_line_1: str = ""
+    city: str = ""
+    state: str = ""  # Two-letter code for US states (e.g., "CA")
+    postal_code: str = ""
+    country: str = "United States of America"
+    full_legal_name: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class Experience:
+    job_title: str
+    company: str
+    start_month: int
+    start_year: int
+    end_month: int | None = None  # None while current
+    end_year: int | None = None
+    location: str = ""
+    description: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class Education:
+    school: str
+    degree: str  # Degree label as offered by Workday (e.g., "Masters", "PhD")
+    field_of_study: str
+    gpa: str = ""
+    start_year: int | None = None
+    end_year: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class Links:
+    linkedin: str = ""
+    github: str = ""
+    website: str = ""
+    publications: str = ""
+    x_profile: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class EEOAnswers:
+    gender: str = "Decline To Self Identify"
+    hispanic_latino: str = "Decline To Self Identify"
+    race: str = "Decline To Self Identify"
+    veteran_status: str = "I don't wish to answer"
+    disability_status: str = "I do not want to answer"
+
+
+@dataclass(slots=True)
+class Profile:
+    """A validated applicant profile and its cached per-platform projections."""
+
+    contact: ContactInfo
+    experience: tuple[Experience, ...] = ()
+    education: tuple[Education, ...] = ()
+    links: Links = Links()
+    eeo: EEOAnswers = EEOAnswers()
+    essays: dict[str, str] = field(default_factory=dict)  # Keyed like the fill-function parameters
+    answers: dict[str, object] = field(default_factory=dict)  # Other screening answers, same keys
+    resume_path: str = "sample-resume.pdf"
+    _projections: dict = field(default_factory=dict, repr=False, compare=False)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Profile":
+        """
+        Build and validate a profile from its JSON form.
+
+        Raises:
+            ProfileError: Listing every unknown key or invalid field
+        """
+        problems = _shape_problems(data)
+        if problems:
+            raise ProfileError(problems)
+        profile = cls(
+            contact=ContactInfo(**data["contact"]),
+            experience=tuple(Experience(**item) for item in data.get("experience", [])),
+            education=tuple(Education(**item) for item in data.get("education", [])),
+            links=Links(**data.get("links", {})),
+            eeo=EEOAnswers(**data.get("eeo", {})),
+            essays=dict(data.get("essays", {})),
+            answers=dict(data.get("answers", {})),
+            resume_path=data.get("resume_path", "sample-resume.pdf"),
+        )
+        profile.validate()
+        return profile
+
+    def validate(self) -> None:
+        """
+        Check the profile once, up front.
+
+        Raises:
+            ProfileError: Listing every invalid field
+        """
+        problems = []
+        contact = self.contact
+        if not contact.first_name or not contact.last_name:
+            problems.append("contact: first_name and last_name are required")
+        if not EMAIL_PATTERN.match(contact.email):
+            problems.append(f"contact.email: not an email address: {contact.email!r}")
+        if not contact.phone.isdigit() or not 7 <= len(contact.phone) <= 15:
+            problems.append(f"contact.phone: expected 7-15 digits, got {contact.phone!r}")
+        if not contact.phone_country_code.startswith("+"):
+            problems.append(f"contact.phone_country_code: expected '+<digits>', got {contact.phone_country_code!r}")
+
+        for i, job in enumerate(self.experience):
+            for month_field in ("start_month", "end_month"):
+                month = getattr(job, month_field)
+                if month is not None and not 1 <= month <= 12:
+                    problems.append(f"experience[{i}].{month_field}: {month} is not a month")
+            if (job.end_month is None) != (job.end_year is None):
+                problems.append(f"experience[{i}]: set both end_month and end_year, or neither for a current job")
+            elif job.end_year is not None and (job.end_year, job.end_month) < (job.start_year, job.start_month):
+                problems.append(f"experience[{i}]: ends before it starts")
+
+        for i, school in enumerate(self.education):
+            if school.start_year and school.end_year and school.end_year < school.start_year:
+                problems.append(f"education[{i}]: ends before it starts")
+
+        for link_field in fields(Links):
+            url = getattr(self.links, link_field.name)
+            if url and ("." not in url or " " in url):
+                problems.append(f"links.{link_field.name}: not a URL: {url!r}")
+
+        if problems:
+            raise ProfileError(problems)
+
+    def projection(self, platform: str) -> dict:
+        """
+        Return the profile formatted for one platform (computed once, then cached).
+
+        Args:
+            platform: "greenhouse", "ashby", "workday" or "indeed"
+
+        Returns:
+            Dict keyed by the fill-function parameter names of that platform
+        """
+        if platform not in self._projections:
+            builders = {
+                "greenhouse": _greenhouse,
+                "ashby": _ashby,
+                "workday": _workday,
+                "indeed": _indeed,
+            }
+            if platform not in builders:
+                raise ValueError(f"Unknown platform: {platform}")
+            self._projections[platform] = builders[platform](self)
+        return self._projections[platform]
+
+    def arguments(self, func, platform: str) -> dict:
+        """
+        Return the keyword arguments `func` accepts from a platform projection.
+
+        The selection is cached per function, so thousands of applications
+        share one dict instead of rebuilding it per job. Treat it as read-only.
+        """
+        key = (platform, func.__module__, func.__qualname__)
+        if key not in self._projections:
+            self._projections[key] = kwargs_for(func, self.projection(platform))
+        return self._projections[key]
+
+
+# JSON sections and the dataclass each one (or each item of a list section) is built from
+SECTIONS = {"contact": ContactInfo, "experience": Experience, "education": Education, "links": Links, "eeo": EEOAnswers}
+FREE_FORM = ("essays", "answers", "resume_path")
+
+
+def _shape_problems(data: dict) -> list[str]:
+    problems = [f"{key}: unknown section" for key in data if key not in SECTIONS and key not in FREE_FORM]
+    if "contact" not in data:
+        problems.append("contact: required")
+    for section, cls in SECTIONS.items():
+        value = data.get(section)
+        if value is None:
+            continue
+        items = value if isinstance(value, list) else [value]
+        known = {f.name for f in fields(cls)}
+        for i, item in enumerate(items):
+            where = f"{section}[{i}]" if isinstance(value, list) else section
+            if not isinstance(item, dict):
+                problems.append(f"{where}: expected an object, got {type(item).__name__}")
+                continue
+            problems += [f"{where}.{key}: unknown field" for key in item if key not in known]
+            problems += [
+                f"{where}.{f.name}: required"
+                for f in fields(cls)
+                if f.name not in item and f.default is MISSING and f.default_factory is MISSING
+            ]
+    return problems
+
+
+def _us_phone(digits: str, pattern: str) -> str:
+    if len(digits) != 10:
+        return digits
+    return pattern.format(digits[:3], digits[3:6], digits[6:])
+
+
+def _common(profile: Profile) -> dict:
+    contact = profile.contact
+    return {
+        "first_name": contact.first_name,
+        "last_name": contact.last_name,
+        "email": contact.email,
+        "resume_path": profile.resume_path,
+        **profile.answers,
+        **profile.essays,
+    }
+
+
+def _greenhouse(profile: Profile) -> dict:
+    contact, links, eeo = profile.contact, profile.links, profile.eeo
+    # Greenhouse phone country option labels look like "United States +1"
+    country_option = f"{contact.phone_country} {contact.phone_country_code}"
+    phone = _us_phone(contact.phone, "({}) {}-{}") if contact.phone_country_code == "+1" else contact.phone
+    return {
+        **_common(profile),
+        "country_phone": country_option,
+        "phone_country": country_option,
+        "country": country_option,
+        "phone": phone,
+        "phone_number": phone,
+        "location": ", ".join(part for part in (contact.city, contact.state) if part),
+        "full_legal_name": contact.full_legal_name or f"{contact.first_name} {contact.last_name}",
+        "website": links.website,
+        "publications_url": links.publications,
+        "github_url": links.github,
+        "linkedin_profile": links.linkedin,
+        "x_profile": links.x_profile,
+        "gender": eeo.gender,
+        "hispanic_latino": eeo.hispanic_latino,
+        "race": eeo.race,
+        "veteran_status": eeo.veteran_status,
+        "disability_status": eeo.disability_status,
+    }
+
+
+def _ashby(profile: Profile) -> dict:
+    contact, links = profile.contact, profile.links
+    return {
+        **_common(profile),
+        "name": f"{contact.first_name} {contact.last_name}",
+        "phone_number": f"{contact.phone_country_code.lstrip('+')}-" + _us_phone(contact.phone, "{}-{}-{}"),
+        "location": ", ".join(part for part in (contact.city, contact.state, contact.country) if part),
+        "github_url": links.github,
+        "linkedin_url": links.linkedin,
+    }
+
+
+def _workday(profile: Profile) -> dict:
+    contact, links = profile.contact, profile.links
+    return {
+        **_common(profile),
+        "country": contact.country,
+        # Workday phone code options look like "United States of America (+1)"
+        "country_phone_code": f"{contact.country} ({contact.phone_country_code})",
+        "phone_number": contact.phone,
+        "address_line_1": contact.address_line_1,
+        "city": contact.city,
+        "state": contact.state,
+        "postal_code": contact.postal_code,
+        "linkedin_url": links.linkedin,
+        "github_url": links.github,
+        "work_experiences": [
+            {
+                "job_title": job.job_title,
+                "company": job.company,
+                "company_name": job.company,
+                "location": job.location,
+                "start_month": job.start_month,
+                "start_year": job.start_year,
+                "end_month": job.end_month,
+                "end_year": job.end_year,
+                "currently_work_here": job.end_year is None,
+                "role_description": job.description,
+            }
+            for job in profile.experience
+        ],
+        "educations": [
+            {
+                "school_name": school.school,
+                "degree": school.degree,
+                "field_of_study": school.field_of_study,
+                "gpa": school.gpa,
+                "start_year": school.start_year,
+                "end_year": school.end_year,
+            }
+            for school in profile.education
+        ],
+    }
+
+
+def _indeed(profile: Profile) -> dict:
+    contact = profile.contact
+    latest = profile.experience[0] if profile.experience else None
+    return {
+        **_common(profile),
+        "phone_number": _us_phone(contact.phone, "{}-{}-{}"),
+        "zip_code": contact.postal_code,
+        "city_state": ", ".join(part for part in (contact.city, contact.state) if part),
+        "street_address": contact.address_line_1,
+        "job_title": latest.job_title if latest else "",
+        "company_name": latest.company if latest else "",
+    }
+
+
+@lru_cache(maxsize=None)
+def _parameters(func) -> frozenset[str]:
+    return frozenset(inspect.signature(func).parameters)
+
+
+def kwargs_for(func, projection: dict) -> dict:
+    """
+    Select the projection entries a fill function accepts.
+
+    Args:
+        func: Fill function (e.g., fill_anthropic_job_application)
+        projection: Result of Profile.projection(...)
+
+    Returns:
+        Keyword arguments for `func`, skipping empty values so defaults still apply
+    """
+    accepted = _parameters(func)
+    return {key: value for key, value in projection.items() if key in accepted and value not in ("", None)}
+
+
+_profiles: dict[tuple[str, str], Profile] = {}
+
+
+def load_profile(source: str | Path = SAMPLE_PROFILE, name: str = "default") -> Profile:
+    """
+    Load a profile once per process and return the shared instance.
+
+    Args:
+        source: Path to a profile JSON file, or a SQLite database name in the
+                state directory (e.g., "profiles.sqlite3")
+        name: Profile name inside a SQLite database
+
+    Returns:
+        The validated, shared Profile
+
+    Raises:
+        ProfileError: If the profile is invalid
+        LookupError: If the named profile is not in the database
+    """
+    key = (str(source), name)
+    if key not in _profiles:
+        if str(source).endswith((".sqlite3", ".db")):
+            conn = connect(str(source), SCHEMA)
+            row = conn.execute("SELECT data FROM profiles WHERE name = ?", (name,)).fetchone()
+            conn.close()
+            if row is None:
+                raise LookupError(f"No profile named {name!r} in {source}")
+            data = json.loads(row["data"])
+        else:
+            data = json.loads(Path(source).read_text())
+        _profiles[key] = Profile.from_dict(data)
+    return _profiles[key]
+
+
+def env_profile() -> Profile | None:
+    """
+    Load the profile named by JOB_APPLY_PROFILE, if set.
+
+    The variable holds what load_profile accepts: a profile JSON path or a
+    SQLite database name in the state directory.
+    """
+    source = os.environ.get("JOB_APPLY_PROFILE")
+    return load_profile(source) if source else None
+
+
+def save_profile(data: dict, name: str = "default", db_name: str = "profiles.sqlite3") -> None:
+    """Validate a profile dict and store it in the profiles database."""
+    Profile.from_dict(data)
+    conn = connect(db_name, SCHEMA)
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO profiles (name, data) VALUES (?, ?)", (name, json.dumps(data))
+        )
+    conn.close()
+    _profiles.pop((db_name, name), None)
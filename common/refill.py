@@ -0,0 +1,82 @@
+"""
+Differential re-fill: read every target field once, write only mismatches.
+
+Workday's "Autofill with Resume" and returning sessions often prefill fields,
+and a retried step is usually partly filled already. Fill functions describe
+their fields as name -> (selector, wanted value); `fields_to_fill` reads all
+current values in a single evaluate and returns only the names whose value
+differs after normalization, so matching fields cost nothing.
+"""
+
+import re
+
+from playwright.async_api import Page
+
+# Inputs report their value; Workday dropdown buttons their label; search
+# prompts (e.g. country phone code) their selected chips. Labels and chips are
+# display text ("display": true), which may carry a prefix before the value.
+READ_VALUES_JS = """(selectors) => Object.fromEntries(Object.entries(selectors).map(([name, selector]) => {
+    const el = document.querySelector(selector);
+    if (!el) return [name, null];
+    if ('value' in el && el.tagName !== 'BUTTON' && el.value) return [name, {value: el.value, display: false}];
+    const field = el.closest('[data-automation-id^="formField-"]');
+    const chips = field ? [...field.querySelectorAll('[data-automation-id="selectedItem"]')] : [];
+    if (chips.length) return [name, {value: chips.map(chip => chip.innerText.trim()).join(', '), display: true}];
+    return [name, {value: el.tagName === 'BUTTON' ? el.innerText : '', display: el.tagName === 'BUTTON'}];
+}))"""
+
+
+def normalize_value(value) -> str:
+    """Case-fold and collapse whitespace; None becomes ""."""
+    return " ".join(str(value or "").casefold().split())
+
+
+def values_match(current, wanted, display: bool = False) -> bool:
+    """
+    Compare a field's current value with the wanted one.
+
+    Matches on normalized text and on digits alone for phone-like values
+    ("844-555-2698" vs "(844) 555-2698"). Display text of dropdown buttons and
+    chips (`display=True`) also matches on a trailing label, as the text can
+    include the field name; a text input must match exactly.
+    """
+    current, wanted = normalize_value(current), normalize_value(wanted)
+    if current == wanted:
+        return True
+    wanted_digits = re.sub(r"\D", "", wanted)
+    if len(wanted_digits) >= 7 and wanted_digits == re.sub(r"\D", "", current):
+        return True
+    return display and bool(wanted) and current.endswith(f" {wanted}")
+
+
+async def read_values(page: Page, selectors: dict[str, str]) -> dict[str, dict | None]:
+    """
+    Read the current value of every field in one call.
+
+    Returns:
+        Map of field name to {"value", "display"}, or None if a field is missing
+    """
+    return await page.evaluate(READ_VALUES_JS, selectors)
+
+
+async def fields_to_fill(page: Page, fields: dict[str, tuple[str, object]]) -> set[str]:
+    """
+    Return the names of fields whose current value differs from the wanted one.
+
+    Args:
+        page: Playwright Page object
+        fields: Map of field name to (CSS selector, wanted value). Fields with an
+                empty wanted value are never returned.
+
+    Returns:
+        Names of the fields that still need to be written
+    """
+    wanted = {name: value for name, (_, value) in fields.items() if value not in ("", None)}
+    current = await read_values(page, {name: fields[name][0] for name in wanted})
+    todo = {
+        name
+        for name, value in wanted.items()
+        if (read := current.get(name)) is None or not values_match(read["value"], value, read["display"])
+    }
+    print(f"Differential fill: {len(wanted) - len(todo)} of {len(wanted)} fields already match")
+    return todo
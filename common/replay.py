@@ -0,0 +1,201 @@
+"""
+Record live application runs and replay them offline.
+
+A recording is a directory in recordings/ in the state directory:
+
+- network.zip: HAR of every request the run made, responses attached
+- steps/NN-<step>.html: the DOM each step started from, plus the final DOM
+- manifest.json: job URL, viewport and the captured steps
+
+Recording opens the job URL in a fresh context with HAR capture, on a page
+traced under the URL's platform, and runs the fill function there, so the
+Workday and SmartApply router steps (see common/run_trace.trace_step) each
+get a DOM state. The fill function takes the page as its only required
+argument (e.g., apply_nvidia, not nvidia_application_workflow, which opens
+its own browser). Replaying serves the HAR back with `route_from_har` in a
+headless browser, so the exact same fill function runs offline. The trace
+record of the replay gives repeatable timings for tuning waits without
+touching live job boards.
+
+    python common/replay.py record anthropic-4020350008 anthropic:fill_anthropic_job_application https://job-boards.greenhouse.io/anthropic/jobs/4020350008
+    python common/replay.py replay anthropic-4020350008 anthropic:fill_anthropic_job_application
+    python common/replay.py record nvidia-jr2005476 workday.nvidia.nvidia:apply_nvidia <NVIDIA job URL>
+"""
+
+import asyncio
+import importlib
+import json
+import re
+import sys
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Awaitable, Callable
+
+from playwright.async_api import Browser, async_playwright
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.job_urls import platform_of
+from common.page_proxy import unwrap
+from common.run_trace import TracedPage, traced
+from common.storage import STATE_DIR
+
+RECORDINGS_DIR = STATE_DIR / "recordings"
+
+VIEWPORT = {"width": 1508, "height": 859}
+
+
+@dataclass
+class RecordedStep:
+    index: int
+    step: str
+    url: str
+    file: str
+    at: float  # Seconds since the recording started
+
+
+@dataclass
+class Manifest:
+    name: str
+    platform: str
+    url: str = ""
+    recorded_at: float = field(default_factory=time.time)
+    viewport: dict = field(default_factory=lambda: dict(VIEWPORT))
+    steps: list[RecordedStep] = field(default_factory=list)
+
+    @classmethod
+    def load(cls, directory: Path) -> "Manifest":
+        data = json.loads((directory / "manifest.json").read_text())
+        data["steps"] = [RecordedStep(**step) for step in data["steps"]]
+        return cls(**data)
+
+    def save(self, directory: Path) -> None:
+        (directory / "manifest.json").write_text(json.dumps(asdict(self), indent=2))
+
+
+class StepRecorder:
+    """Saves the DOM each traced step starts from."""
+
+    def __init__(self, directory: Path, manifest: Manifest, page: TracedPage):
+        self.directory = directory
+        self.manifest = manifest
+        self.page = page
+        self.started = time.perf_counter()
+
+    async def capture(self, step: str) -> bool:
+        raw = unwrap(self.page)
+        if raw.url.startswith("about:"):
+            return False  # Nothing loaded yet; try again on the next operation
+        html = await raw.content()
+        index = len(self.manifest.steps)
+        file = f"steps/{index:02d}-{re.sub(r'[^a-z0-9-]+', '-', step.lower())}.html"
+        await asyncio.to_thread((self.directory / file).write_text, html)
+        self.manifest.steps.append(RecordedStep(index, step, raw.url, file, round(time.perf_counter() - self.started, 3)))
+        return True
+
+
+@asynccontextmanager
+async def record_run(browser: Browser, name: str, platform: str, url: str = ""):
+    """
+    Open a traced page in a new context that records a HAR and per-step DOM.
+
+    The HAR is written when the context closes on exit.
+
+    Args:
+        browser: Launched or CDP-connected browser
+        name: Recording name (directory under recordings/)
+        platform: Platform name for the trace (e.g., "greenhouse")
+        url: Job URL, kept in the manifest
+    """
+    directory = RECORDINGS_DIR / name
+    (directory / "steps").mkdir(parents=True, exist_ok=True)
+    manifest = Manifest(name, platform, url)
+    context = await browser.new_context(
+        viewport=manifest.viewport,
+        record_har_path=str(directory / "network.zip"),
+        record_har_content="attach",
+    )
+    page = traced(await context.new_page(), platform, url)
+    recorder = StepRecorder(directory, manifest, page)
+    page.trace.on_step = recorder.capture
+    try:
+        yield page
+        await recorder.capture("final")
+    finally:
+        manifest.url = manifest.url or (manifest.steps[0].url if manifest.steps else "")
+        manifest.save(directory)
+        await context.close()
+        print(f"Recorded {len(manifest.steps)} steps to {directory}")
+
+
+@asynccontextmanager
+async def replay_run(browser: Browser, name: str):
+    """
+    Open a traced page whose network is served from a recording.
+
+    Requests missing from the HAR are aborted, so a replay never reaches a
+    live job board.
+    """
+    directory = RECORDINGS_DIR / name
+    manifest = Manifest.load(directory)
+    context = await browser.new_context(viewport=manifest.viewport)
+    await context.route_from_har(str(directory / "network.zip"), not_found="abort")
+    page = traced(await context.new_page(), manifest.platform, manifest.url)
+    try:
+        yield page
+    finally:
+        await context.close()
+
+
+async def replay(name: str, apply: Callable[..., Awaitable[None]], **kwargs) -> dict:
+    """
+    Re-run a fill function against a recording in a headless browser.
+
+    Returns:
+        The trace record of the replay (seconds, operations and sleeps per step)
+    """
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        try:
+            async with replay_run(browser, name) as page:
+                error = ""
+                try:
+                    if page.trace.url:
+                        await page.goto(page.trace.url, wait_until="load")
+                    await apply(page, **kwargs)
+                except Exception as exc:
+                    error = f"{type(exc).__name__}: {exc}"
+                return page.trace.write(ok=not error, error=error)
+        finally:
+            await browser.close()
+
+
+def _function(spec: str) -> Callable:
+    """Import "module:function", e.g. "anthropic:fill_anthropic_job_application"."""
+    module, function = spec.split(":")
+    return getattr(importlib.import_module(module), function)
+
+
+async def _record(name: str, spec: str, url: str) -> None:
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=False)
+        try:
+            async with record_run(browser, name, platform_of(url), url) as page:
+                await page.goto(url, wait_until="load")
+                await _function(spec)(page)
+        finally:
+            await browser.close()
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path.cwd()))
+    if sys.argv[1:2] == ["record"] and len(sys.argv) == 5:
+        asyncio.run(_record(*sys.argv[2:]))
+    elif sys.argv[1:2] == ["replay"] and len(sys.argv) == 4:
+        print(json.dumps(asyncio.run(replay(sys.argv[2], _function(sys.argv[3]))), indent=2))
+    else:
+        sys.exit(
+            "Usage: python common/replay.py record <name> <module:function> <job_url>\n"
+            "       python common/replay.py replay <name> <module:function>"
+        )
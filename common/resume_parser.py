@@ -0,0 +1,368 @@
+"""
+Local resume parser that feeds the profile store.
+
+Text is extracted locally (PDF through the optional pypdf package, DOCX
+through the standard library, plain text as is; nothing leaves the machine),
+then contact details, experience and education are pulled out with simple
+section and date-range heuristics. Results are cached by file content hash,
+so a resume is parsed once however many applications upload it.
+
+The parsed resume can be merged into a profile (so repeated Workday sections
+are pre-populated from it) and used to predict which Workday fields "Autofill
+with Resume" will already cover.
+"""
+
+import hashlib
+import re
+import zipfile
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from xml.etree import ElementTree
+
+from common.cache import KeyValueCache
+from common.profile import Profile, save_profile
+
+try:
+    from pypdf import PdfReader
+except ImportError:  # Only needed for PDF resumes
+    PdfReader = None
+
+# Bump when the heuristics change so cached results are re-parsed
+PARSER_VERSION = 1
+
+MONTHS = {name: i for i, name in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], start=1
+)}
+DATE = r"(?:(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+|\d{1,2}/)?(?:19|20)\d{2}"
+DATE_RANGE = re.compile(
+    rf"(?P<start>{DATE})\s*(?:-|–|—|to)\s*(?P<end>{DATE}|present|current|now)", re.IGNORECASE
+)
+
+SECTION_HEADINGS = {
+    "experience": re.compile(r"^(work |professional |relevant )?(experience|employment( history)?)$", re.IGNORECASE),
+    "education": re.compile(r"^education( and training)?$", re.IGNORECASE),
+    "other": re.compile(r"^(skills|projects|publications|awards|certifications|interests|summary|languages)\b.*$", re.IGNORECASE),
+}
+
+EMAIL = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+PHONE = re.compile(r"(?<![\w/])\+?\d[\d\s().-]{8,}\d")
+LINK = re.compile(r"(?:https?://)?(?:www\.)?[\w-]+(?:\.[\w-]+)+(?:/[\w./%-]*)?", re.IGNORECASE)
+CITY_STATE = re.compile(r"\b([A-Z][A-Za-z .]+),\s*([A-Z]{2})\b(?:\s+(\d{5}))?")
+GPA = re.compile(r"\bgpa[:\s]*([0-4]\.\d{1,2})", re.IGNORECASE)
+YEAR = re.compile(r"\b(?:19|20)\d{2}\b")
+SCHOOL = re.compile(r"\b(university|college|institute|school|academy)\b", re.IGNORECASE)
+DEGREES = [
+    ("PhD", re.compile(r"\b(ph\.?\s?d|doctor(ate)?)\b", re.IGNORECASE)),
+    ("Masters", re.compile(r"\b(master'?s?|m\.?s\.?c?|m\.?eng|mba|m\.?a\.)\b", re.IGNORECASE)),
+    ("Bachelors", re.compile(r"\b(bachelor'?s?|b\.?s\.?c?|b\.?a\.?|b\.?eng)\b", re.IGNORECASE)),
+    ("Associates", re.compile(r"\bassociate'?s?\b", re.IGNORECASE)),
+]
+TITLE_COMPANY_SEPARATORS = re.compile(r"\s+(?:at|@|\||—|–|-)\s+|,\s+")
+
+# Workday fields its resume autofill maps from resume text; GPA, "how did you
+# hear" and the self-identification questions are never autofilled
+AUTOFILL_CONTACT_FIELDS = {
+    "first_name": "first_name",
+    "last_name": "last_name",
+    "email": "email",
+    "phone": "phone_number",
+    "city": "city",
+    "state": "state",
+    "postal_code": "postal_code",
+}
+AUTOFILL_EXPERIENCE_FIELDS = ("job_title", "company", "location", "start_month", "start_year", "end_month", "end_year", "description")
+AUTOFILL_EDUCATION_FIELDS = ("school", "degree", "field_of_study", "start_year", "end_year")
+
+
+@dataclass(slots=True)
+class ParsedResume:
+    """Fields extracted from a resume, in the profile JSON shape."""
+
+    contact: dict = field(default_factory=dict)
+    experience: list[dict] = field(default_factory=list)
+    education: list[dict] = field(default_factory=list)
+    links: dict = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class AutofillPrediction:
+    """Workday fields expected to be prefilled by resume autofill, and the rest."""
+
+    covered: list[str]
+    manual: list[str]
+
+    def summary(self) -> str:
+        total = len(self.covered) + len(self.manual)
+        return f"Workday autofill should cover {len(self.covered)}/{total} profile fields; fill manually: {', '.join(self.manual) or 'none'}"
+
+
+def extract_text(path: str | Path) -> str:
+    """
+    Extract plain text from a PDF, DOCX or text resume without any network access.
+
+    Raises:
+        RuntimeError: For PDFs when pypdf is not installed
+        ValueError: For unsupported file types
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == ".pdf":
+        if PdfReader is None:
+            raise RuntimeError("Parsing PDF resumes requires pypdf (pip install pypdf)")
+        return "\n".join(page.extract_text() or "" for page in PdfReader(path).pages)
+    if suffix == ".docx":
+        namespace = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+        with zipfile.ZipFile(path) as archive:
+            root = ElementTree.fromstring(archive.read("word/document.xml"))
+        return "\n".join(
+            "".join(node.text or "" for node in paragraph.iter(f"{namespace}t"))
+            for paragraph in root.iter(f"{namespace}p")
+        )
+    if suffix in (".txt", ".md"):
+        return path.read_text(errors="ignore")
+    raise ValueError(f"Unsupported resume format: {suffix}")
+
+
+def _parse_date(text: str) -> tuple[int | None, int | None]:
+    """Return (month, year) for "Jan 2020", "01/2020" or "2020"; (None, None) for present."""
+    year = YEAR.search(text)
+    if not year:
+        return None, None
+    prefix = text[:year.start()].strip().lower()
+    if prefix.endswith("/") and prefix[:-1].isdigit():
+        return int(prefix[:-1]), int(year.group())
+    return MONTHS.get(prefix[:3]), int(year.group())
+
+
+def _sections(lines: list[str]) -> dict[str, list[str]]:
+    sections = {"header": [], "experience": [], "education": [], "other": []}
+    current = "header"
+    for line in lines:
+        heading = line.rstrip(":").strip()
+        matched = next((name for name, pattern in SECTION_HEADINGS.items() if pattern.match(heading)), None)
+        if matched:
+            current = matched
+        else:
+            sections[current].append(line)
+    return sections
+
+
+def _parse_contact(lines: list[str], text: str) -> tuple[dict, dict]:
+    contact, links = {}, {}
+    for line in lines[:5]:
+        words = line.split()
+        if 2 <= len(words) <= 4 and all(word.replace("-", "").replace(".", "").isalpha() for word in words):
+            contact["first_name"], contact["last_name"] = words[0], words[-1]
+            if len(words) > 2:
+                contact["full_legal_name"] = " ".join(words)
+            break
+
+    if email := EMAIL.search(text):
+        contact["email"] = email.group()
+    if phone := PHONE.search(text):
+        digits = re.sub(r"\D", "", phone.group())
+        if len(digits) == 11 and digits.startswith("1"):
+            digits = digits[1:]
+        contact["phone"] = digits
+    for line in lines[:8]:
+        if location := CITY_STATE.search(line):
+            contact["city"], contact["state"] = location.group(1).strip(), location.group(2)
+            if location.group(3):
+                contact["postal_code"] = location.group(3)
+            break
+
+    for match in LINK.finditer(text):
+        url = match.group()
+        if "@" in text[max(match.start() - 1, 0):match.start() + 1]:
+            continue  # Domain part of an email address
+        if "linkedin.com" in url.lower():
+            links.setdefault("linkedin", _with_scheme(url))
+        elif "github.com" in url.lower():
+            links.setdefault("github", _with_scheme(url))
+        elif url.lower().startswith(("http", "www.")):
+            links.setdefault("website", _with_scheme(url))
+    return contact, links
+
+
+def _with_scheme(url: str) -> str:
+    return url if url.lower().startswith("http") else f"https://{url}"
+
+
+def _parse_experience(lines: list[str]) -> list[dict]:
+    jobs, previous = [], ""
+    for line in lines:
+        dates = DATE_RANGE.search(line)
+        if not dates:
+            if jobs and line.lstrip().startswith(("•", "-", "*", "–")):
+                bullet = line.strip().lstrip("•-*– ").strip()
+                jobs[-1]["description"] = " ".join(filter(None, [jobs[-1]["description"], bullet]))
+            elif jobs and not jobs[-1]["company"]:
+                jobs[-1]["company"] = line.strip()
+            else:
+                previous = line.strip()
+            continue
+
+        header = (line[:dates.start()] + line[dates.end():]).strip(" ,|–—-\t")
+        if not header:
+            header, previous = previous, ""
+        parts = [part.strip() for part in TITLE_COMPANY_SEPARATORS.split(header) if part.strip()]
+        start_month, start_year = _parse_date(dates.group("start"))
+        end_month, end_year = _parse_date(dates.group("end"))
+        jobs.append({
+            "job_title": parts[0] if parts else "",
+            "company": parts[1] if len(parts) > 1 else previous,
+            "location": ", ".join(parts[2:]),
+            "start_month": start_month or 1,
+            "start_year": start_year,
+            "end_month": (end_month or 12) if end_year else None,
+            "end_year": end_year,
+            "description": "",
+        })
+        previous = ""
+    return [job for job in jobs if job["job_title"] and job["company"] and job["start_year"]]
+
+
+def _parse_education(lines: list[str]) -> list[dict]:
+    groups: list[list[str]] = []
+    for line in lines:
+        if not line.strip():
+            continue
+        if not groups or (SCHOOL.search(line) and any(SCHOOL.search(seen) for seen in groups[-1])):
+            groups.append([])
+        groups[-1].append(line.strip())
+
+    schools = []
+    for group in groups:
+        text = " ".join(group)
+        school = next((line for line in group if SCHOOL.search(line)), "")
+        degree_line = next((line for line in group if any(pattern.search(line) for _, pattern in DEGREES)), "")
+        degree = next((name for name, pattern in DEGREES if pattern.search(degree_line)), "")
+        field_match = re.search(r"\bin\s+([A-Z][A-Za-z &]+)", degree_line)
+        years = sorted(int(year) for year in YEAR.findall(text))
+        gpa = GPA.search(text)
+        if school:
+            schools.append({
+                "school": re.split(r",|\s+[-–—|]\s+", school)[0].strip(),
+                "degree": degree,
+                "field_of_study": field_match.group(1).strip() if field_match else "",
+                "gpa": gpa.group(1) if gpa else "",
+                "start_year": years[0] if len(years) > 1 else None,
+                "end_year": years[-1] if years else None,
+            })
+    return schools
+
+
+def parse_text(text: str) -> ParsedResume:
+    """Parse resume text into contact, links, experience and education."""
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    sections = _sections(lines)
+    contact, links = _parse_contact(sections["header"] or lines, text)
+    return ParsedResume(
+        contact=contact,
+        experience=_parse_experience(sections["experience"]),
+        education=_parse_education(sections["education"]),
+        links=links,
+    )
+
+
+_cache: KeyValueCache | None = None
+
+
+def _default_cache() -> KeyValueCache:
+    global _cache
+    if _cache is None:
+        _cache = KeyValueCache("resumes")
+    return _cache
+
+
+def parse_resume(path: str | Path) -> ParsedResume:
+    """
+    Parse a resume file, once per distinct file content.
+
+    Args:
+        path: Path to a PDF, DOCX or text resume
+
+    Returns:
+        The parsed resume (from the cache when this content was parsed before)
+    """
+    digest = hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    key = f"v{PARSER_VERSION}/{digest}"
+    cached = _default_cache().get(key)
+    if cached is not None:
+        return ParsedResume(**cached)
+    parsed = parse_text(extract_text(path))
+    _default_cache().set(key, asdict(parsed))
+    print(f"Parsed resume {Path(path).name}: {len(parsed.experience)} jobs, {len(parsed.education)} schools")
+    return parsed
+
+
+def merge_resume(parsed: ParsedResume, base: dict, resume_path: str = "") -> dict:
+    """
+    Merge a parsed resume into profile JSON data.
+
+    Values found in the resume win; the base profile supplies everything the
+    resume does not contain (EEO answers, screening answers, phone country, ...).
+    """
+    data = {**base}
+    data["contact"] = {**base.get("contact", {}), **parsed.contact}
+    data["links"] = {**base.get("links", {}), **parsed.links}
+    if parsed.experience:
+        data["experience"] = parsed.experience
+    if parsed.education:
+        data["education"] = parsed.education
+    if resume_path:
+        data["resume_path"] = resume_path
+    return data
+
+
+def profile_from_resume(path: str | Path, base: dict | None = None, save_as: str = "") -> Profile:
+    """
+    Build a validated profile from a resume, optionally storing it in the profile store.
+
+    Args:
+        path: Resume file
+        base: Profile JSON data supplying what the resume lacks
+        save_as: Profile name to save under in profiles.sqlite3 ("" to not save)
+
+    Raises:
+        ProfileError: If the merged profile is incomplete or invalid
+    """
+    data = merge_resume(parse_resume(path), base or {}, str(path))
+    profile = Profile.from_dict(data)
+    if save_as:
+        save_profile(data, name=save_as)
+    return profile
+
+
+def predict_autofill(parsed: ParsedResume, profile: Profile) -> AutofillPrediction:
+    """
+    Predict which profile fields Workday's resume autofill will prefill.
+
+    Workday parses the same text, so a field is expected to be covered when
+    this parser found it and it agrees with the profile; everything else has
+    to be typed.
+    """
+    covered, manual = [], []
+    for name, workday_name in AUTOFILL_CONTACT_FIELDS.items():
+        wanted = getattr(profile.contact, name, "")
+        if not wanted:
+            continue
+        found = parsed.contact.get(name, "")
+        (covered if str(found).casefold() == str(wanted).casefold() else manual).append(workday_name)
+
+    for section, entries, names in (
+        ("work_experiences", profile.experience, AUTOFILL_EXPERIENCE_FIELDS),
+        ("educations", profile.education, AUTOFILL_EDUCATION_FIELDS),
+    ):
+        parsed_entries = parsed.experience if section == "work_experiences" else parsed.education
+        for i, entry in enumerate(entries):
+            found = parsed_entries[i] if i < len(parsed_entries) else {}
+            for name in names:
+                wanted = getattr(entry, name)
+                if wanted in ("", None):
+                    continue
+                (covered if found.get(name) == wanted else manual).append(f"{section}[{i}].{name}")
+    for entry_index, entry in enumerate(profile.education):
+        if entry.gpa:
+            manual.append(f"educations[{entry_index}].gpa")
+    return AutofillPrediction(covered, manual)
@@ -0,0 +1,239 @@
+"""
+Run-wide JSONL trace of Playwright operations and sleeps.
+
+`traced(page, platform, url)` hands the fill functions a page that counts
+and times every awaited Page, Locator, keyboard and mouse operation (click,
+fill, count, inner_text, evaluate, goto, ...) without changing a call site.
+`wait_for_timeout` is summed separately as sleep. Operations are grouped
+under the current step: routers name their steps with `trace_step`, and
+everything else lands in "application". At the end of an application,
+`page.trace.write(...)` appends one record to traces/runs.jsonl in the state
+directory. The record shows whether a slow run was network, DOM queries or
+our own sleeps.
+
+The trace also keeps the last actions and a few lightweight DOM snapshots in
+memory. They cost nothing on disk unless the application fails; see
+common/failure_capture.py.
+"""
+
+import asyncio
+import json
+import time
+from collections import Counter, defaultdict, deque
+from contextlib import contextmanager, nullcontext
+from typing import Awaitable, Callable
+
+from playwright.async_api import Page
+
+from common.page_proxy import Proxy, unwrap
+from common.storage import STATE_DIR
+
+RUN_TRACE_PATH = STATE_DIR / "traces" / "runs.jsonl"
+
+SLEEPS = ("wait_for_timeout",)
+
+# A few facts about the page in one cheap evaluate (no HTML)
+LIGHT_SNAPSHOT_JS = """() => {
+    const active = document.activeElement;
+    return {
+        url: location.href,
+        title: document.title,
+        active: active && active !== document.body
+            ? `${active.tagName.toLowerCase()}${active.id ? '#' + active.id : ''}${active.name ? `[name=${active.name}]` : ''}`
+            : '',
+        headings: [...document.querySelectorAll('h1, h2, h3')].map(e => e.innerText.trim()).filter(Boolean).slice(0, 5),
+        dialogs: document.querySelectorAll('[role="dialog"], [role="listbox"]').length,
+        invalid: [...document.querySelectorAll('[aria-invalid="true"]')].map(e => e.id || e.name || e.tagName.toLowerCase()).slice(0, 10),
+        fields: document.querySelectorAll('input, select, textarea').length,
+    };
+}"""
+
+
+def _describe(target, args: tuple) -> str:
+    """Short description of an operation: its first argument (selector, URL, value) or the locator's selector."""
+    if args:
+        return repr(args[0])[:80]
+    return getattr(unwrap(target), "_selector", "")[:80]
+
+
+class StepTotals:
+    """Operation counts and times for one step."""
+
+    def __init__(self):
+        self.ops = Counter()
+        self.op_ms = defaultdict(float)
+        self.sleeps = 0
+        self.sleep_ms = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "ops": dict(self.ops),
+            "op_ms": {op: round(ms, 1) for op, ms in self.op_ms.items()},
+            "sleeps": self.sleeps,
+            "sleep_ms": round(self.sleep_ms, 1),
+        }
+
+
+class RunTrace:
+    """Operation and sleep accounting for one application."""
+
+    def __init__(self, platform: str, url: str = "", page: Page | None = None, recent: int = 50, snapshot_every: int = 10):
+        """
+        Args:
+            platform: Platform name recorded in the trace (e.g., "workday")
+            url: Job URL recorded in the trace
+            page: Page the lightweight snapshots are taken on
+            recent: Number of recent actions kept for failure reports
+            snapshot_every: Take a snapshot after this many actions (and on each new step)
+        """
+        self.platform = platform
+        self.url = url
+        self.page = page
+        self.started = time.perf_counter()
+        self.started_at = time.time()
+        self.current = "application"
+        self.steps: dict[str, StepTotals] = defaultdict(StepTotals)
+        self.recent: deque[dict] = deque(maxlen=recent)
+        self.snapshots: deque[dict] = deque(maxlen=max(1, recent // snapshot_every))
+        self.snapshot_every = snapshot_every
+        self._since_snapshot = 0
+        self._snapshot_step = None
+        # Called with the step name before the step's first operation; returns
+        # False to be called again on the next one (see common/replay.py)
+        self.on_step: Callable[[str], Awaitable[bool]] | None = None
+        self._entered_step = None
+        self.written = False  # The application's record is in the run trace
+
+    @contextmanager
+    def step(self, name: str):
+        """Attribute the operations inside the block to step `name`."""
+        previous, self.current = self.current, name
+        try:
+            yield
+        finally:
+            self.current = previous
+
+    def add(self, op: str, seconds: float, detail: str = "", error: str = "") -> None:
+        self.recent.append({
+            "at": round(time.perf_counter() - self.started, 3),
+            "step": self.current,
+            "op": op,
+            "detail": detail,
+            "ms": round(seconds * 1000, 1),
+            "error": error,
+        })
+        self._since_snapshot += 1
+        totals = self.steps[self.current]
+        if op in SLEEPS:
+            totals.sleeps += 1
+            totals.sleep_ms += seconds * 1000
+        else:
+            totals.ops[op] += 1
+            totals.op_ms[op] += seconds * 1000
+
+    async def enter_step(self) -> None:
+        if self.on_step is not None and self._entered_step != self.current:
+            if await self.on_step(self.current):
+                self._entered_step = self.current
+
+    async def maybe_snapshot(self) -> None:
+        """Take a lightweight DOM snapshot on a new step or every `snapshot_every` actions."""
+        if self.page is None:
+            return
+        if self._snapshot_step == self.current and self._since_snapshot < self.snapshot_every:
+            return
+        self._snapshot_step, self._since_snapshot = self.current, 0
+        try:
+            snapshot = await self.page.evaluate(LIGHT_SNAPSHOT_JS)
+        except Exception as error:  # Navigating or closed; the next one will do
+            snapshot = {"error": str(error)[:200]}
+        self.snapshots.append({"at": round(time.perf_counter() - self.started, 3), "step": self.current, **snapshot})
+
+    def record(self, ok: bool = True, error: str = "") -> dict:
+        seconds = time.perf_counter() - self.started
+        op_ms = sum(sum(totals.op_ms.values()) for totals in self.steps.values())
+        sleep_ms = sum(totals.sleep_ms for totals in self.steps.values())
+        return {
+            "platform": self.platform,
+            "url": self.url,
+            "started_at": self.started_at,
+            "seconds": round(seconds, 3),
+            "ok": ok,
+            "error": error,
+            "totals": {
+                "ops": sum(sum(totals.ops.values()) for totals in self.steps.values()),
+                "op_ms": round(op_ms, 1),
+                "sleeps": sum(totals.sleeps for totals in self.steps.values()),
+                "sleep_ms": round(sleep_ms, 1),
+                # Python work and anything not awaited through the page
+                "other_ms": round(max(0.0, seconds * 1000 - op_ms - sleep_ms), 1),
+            },
+            "steps": {name: totals.as_dict() for name, totals in self.steps.items()},
+        }
+
+    def write(self, ok: bool = True, error: str = "") -> dict:
+        """Append this application's record to the run trace and print a summary."""
+        record = self.record(ok, error)
+        RUN_TRACE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(RUN_TRACE_PATH, "a") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.written = True
+        totals = record["totals"]
+        print(
+            f"Trace: {totals['ops']} page operations {totals['op_ms'] / 1000:.1f}s, "
+            f"{totals['sleeps']} sleeps {totals['sleep_ms'] / 1000:.1f}s, "
+            f"other {totals['other_ms'] / 1000:.1f}s of {record['seconds']:.1f}s"
+        )
+        return record
+
+
+class _Traced(Proxy):
+    def __init__(self, target, trace: RunTrace):
+        super().__init__(target)
+        self.trace = trace
+
+    def _child(self, value):
+        return _Traced(value, self.trace)
+
+    def _call(self, name: str, method):
+        async def timed(*args, **kwargs):
+            await self.trace.enter_step()
+            started, error = time.perf_counter(), ""
+            try:
+                return await method(*args, **kwargs)
+            except Exception as exc:
+                error = f"{type(exc).__name__}: {exc}"[:300]
+                raise
+            except asyncio.CancelledError:  # E.g. the application's deadline passed; no snapshot
+                error = "cancelled"
+                raise
+            finally:
+                self.trace.add(name, time.perf_counter() - started, _describe(self._target, args), error)
+                if not error:
+                    await self.trace.maybe_snapshot()
+
+        return timed
+
+
+class TracedPage(_Traced):
+    """A Page that reports every awaited operation to its `trace`."""
+
+
+def traced(page: Page, platform: str, url: str = "") -> TracedPage:
+    """
+    Wrap a page so its operations are counted and timed.
+
+    Args:
+        page: Playwright page (or a paced page) passed on to the fill functions
+        platform: Platform name recorded in the trace (e.g., "workday")
+        url: Job URL recorded in the trace
+
+    Returns:
+        TracedPage; call `page.trace.write(ok, error)` when the application ends
+    """
+    return TracedPage(page, RunTrace(platform, url, page=unwrap(page)))
+
+
+def trace_step(page, name: str):
+    """Context manager naming the current step when `page` is traced; a no-op otherwise."""
+    return page.trace.step(name) if isinstance(page, TracedPage) else nullcontext()
@@ -0,0 +1,219 @@
+"""
+Pipelined application runner with speculative prefetch of the next jobs.
+
+While one application fills and submits, the next queued jobs are opened in
+background pages: navigated, waited on until their core form is rendered, and
+introspected (headings, test ids and labels in one evaluate). Navigation
+latency then overlaps with work already in progress. The number of
+prefetched pages is capped so a long queue does not open a tab per job.
+
+With a HostController, every page load and application holds a slot for its
+host. Applications still run one at a time, so the host's limit only throttles
+the prefetched loads next to the current application; jobs on a host whose
+circuit is open are deferred behind jobs on healthy hosts.
+
+Pages come from a BrowserSession (common/lifecycle.py), so each one is
+cleaned up after its job, and a session with its own contexts recycles them
+every few applications. A job with a platform gets its page wrapped like the
+entry points wrap theirs: bounded by the platform's deadline, paced and
+traced; its application is cancelled when the deadline runs out
+(common/deadline.py), so a misbehaving posting cannot hold a slot. Fill
+functions that navigate themselves skip the goto when the page is already on
+their posting (common.job_urls.same_posting), so the prefetch is not wasted.
+
+greenhouse/batch.py runs the Greenhouse workflows through this runner.
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Iterable
+
+from playwright.async_api import BrowserContext, Page
+
+from common.applied_jobs import already_applied
+from common.deadline import bounded, enforce_deadline
+from common.failure_capture import capture_failure
+from common.host_controller import HostController, Outcome, host_key, is_challenge
+from common.lifecycle import BrowserSession
+from common.pacing import paced
+from common.run_trace import traced
+from common.step_trace import SNAPSHOT_JS
+
+
+@dataclass
+class Job:
+    """A queued application."""
+
+    url: str
+    apply: Callable[[Page], Awaitable[None]]  # Fills and submits; the page is already on `url`
+    ready: Callable[[Page], Awaitable[None]] | None = None  # Waits until the core form is rendered
+    platform: str = ""  # Deadline, pacing and trace platform (e.g., "greenhouse"); "" leaves the page unwrapped
+
+
+@dataclass
+class PreparedPage:
+    """A job's page after prefetch."""
+
+    page: Page
+    snapshot: dict = field(default_factory=dict)  # Headings, test ids and labels seen on load
+    error: BaseException | None = None
+
+
+@dataclass
+class JobResult:
+    """Outcome of one application."""
+
+    url: str
+    ok: bool
+    error: str = ""
+    seconds: float = 0.0
+    waited_for_prefetch: float = 0.0  # Time the runner sat waiting for this job's page
+
+
+def _slot(controller: HostController | None, url: str, kind: str):
+    return controller.slot(url, kind) if controller is not None else nullcontext(Outcome())
+
+
+async def prefetch(
+    session: BrowserSession,
+    job: Job,
+    timeout: int = 30000,
+    controller: HostController | None = None,
+) -> PreparedPage:
+    """Open a job in a new page, wait for its form and introspect it."""
+    page = None
+    try:
+        page = await session.new_page()
+        prepared = PreparedPage(page)
+        async with _slot(controller, job.url, "load") as outcome:
+            await page.goto(job.url, wait_until="load", timeout=timeout)
+            if job.ready is not None:
+                await job.ready(page)
+            prepared.snapshot = await page.evaluate(SNAPSHOT_JS)
+            outcome.challenge = is_challenge(prepared.snapshot)
+        if outcome.challenge:
+            prepared.error = RuntimeError(f"Challenge page on {host_key(job.url)}: {prepared.snapshot.get('title')!r}")
+    except asyncio.CancelledError:
+        if page is not None:
+            await session.release(page)
+        raise
+    except Exception as error:  # Reported when the job comes up, not in the background
+        if page is None:
+            raise
+        prepared.error = error
+    return prepared
+
+
+class PrefetchingRunner:
+    """Apply to queued jobs one at a time while the next ones load in the background."""
+
+    def __init__(
+        self,
+        context: BrowserContext | BrowserSession,
+        max_prefetch: int = 1,
+        timeout: int = 30000,
+        controller: HostController | None = None,
+        deadline: float | None = None,
+    ):
+        """
+        Args:
+            context: Browser context the job pages are opened in, or a
+                     BrowserSession that recycles its own contexts
+            max_prefetch: Max pages loading or waiting ahead of the current job
+            timeout: Navigation timeout in ms for each prefetched page
+            controller: Per-host concurrency controller; None applies no host limits
+            deadline: Seconds each application may take once its page is ready; None uses the
+                      job's platform deadline, or no limit for a job without a platform
+        """
+        self.session = context if isinstance(context, BrowserSession) else BrowserSession(context=context)
+        self.max_prefetch = max_prefetch
+        self.timeout = timeout
+        self.controller = controller
+        self.deadline = deadline
+
+    def _wrap(self, page: Page, job: Job) -> Page:
+        """Bound, pace and trace a job's page the way the entry points do."""
+        if not job.platform:
+            return bounded(page, seconds=self.deadline) if self.deadline else page
+        page = bounded(page, job.platform, self.deadline)
+        return traced(paced(page, job.platform), job.platform, job.url)
+
+    async def run(self, jobs: Iterable[Job]) -> list[JobResult]:
+        """
+        Run every job in order.
+
+        Returns:
+            One JobResult per job that was not already applied to
+        """
+        queue = deque(job for job in jobs if not already_applied(job.url))
+        pending: deque[tuple[Job, asyncio.Task]] = deque()
+        results = []
+
+        def next_job() -> Job | None:
+            """The first queued job whose host is not paused."""
+            for job in queue:
+                if self.controller is None or not self.controller.is_open(job.url):
+                    queue.remove(job)
+                    return job
+            return None
+
+        def top_up(limit: int) -> None:
+            while queue and len(pending) < limit:
+                job = next_job()
+                if job is None:
+                    return
+                task = asyncio.create_task(prefetch(self.session, job, self.timeout, self.controller))
+                pending.append((job, task))
+
+        try:
+            top_up(self.max_prefetch + 1)
+            while pending or queue:
+                if not pending:
+                    # Every remaining job is on a paused host: wait for the first to reopen
+                    await asyncio.sleep(min(self.controller.reopens_in(job.url) for job in queue))
+                    top_up(self.max_prefetch + 1)
+                    continue
+                job, task = pending.popleft()
+                top_up(self.max_prefetch)  # Keep the next jobs loading while this one runs
+
+                started = time.perf_counter()
+                prepared, page, waited = None, None, 0.0
+                try:
+                    prepared = await task  # Raises when no page could be opened for the job
+                    waited = time.perf_counter() - started
+                    if prepared.error is not None:
+                        raise prepared.error
+                    async with _slot(self.controller, job.url, "apply"):
+                        page = self._wrap(prepared.page, job)
+                        async with enforce_deadline(page):
+                            await job.apply(page)
+                    if job.platform:
+                        page.trace.write()
+                    results.append(JobResult(job.url, True, seconds=time.perf_counter() - started, waited_for_prefetch=waited))
+                except Exception as error:
+                    print(f"✗ {job.url}: {error}")
+                    trace = getattr(page, "trace", None)
+                    if trace is not None and not trace.written:
+                        trace.write(ok=False, error=repr(error))
+                    if prepared is not None:
+                        await capture_failure(page or prepared.page, host_key(job.url), error)
+                    results.append(JobResult(job.url, False, str(error), time.perf_counter() - started, waited))
+                finally:
+                    if prepared is not None:
+                        await self.session.release(prepared.page)
+        finally:
+            for _, task in pending:
+                task.cancel()  # A prefetch still running closes its own page
+            # Wait for that cleanup before the session closes; release the pages that did load
+            for prepared in await asyncio.gather(*(task for _, task in pending), return_exceptions=True):
+                if isinstance(prepared, PreparedPage):
+                    await self.session.release(prepared.page)
+
+        overlapped = sum(1 for result in results if result.waited_for_prefetch < 0.05)
+        print(f"Ran {len(results)} applications; {overlapped} pages were ready before they were needed")
+        if self.controller is not None:
+            print(f"Host limits: {self.controller.limits()}")
+        return results
@@ -0,0 +1,89 @@
+"""
+Selector resolution with ordered fallback strategies and a learned winner cache.
+
+Some targets have several possible locators (a build-specific hashed test id,
+a stable test id, the visible text). Trying them one after another stacks a
+full locator timeout per miss. The resolver instead waits once on the union
+of all strategies, checks which one matched, and remembers the winner per
+platform/module/target on disk so the next run checks it first.
+"""
+
+from typing import Callable
+
+from playwright.async_api import Locator, Page, TimeoutError as PlaywrightTimeoutError
+
+from common.cache import KeyValueCache
+
+Strategy = tuple[str, Callable[[Page], Locator]]
+
+
+class SelectorMissError(LookupError):
+    """None of the strategies for a target matched within the timeout."""
+
+
+class SelectorResolver:
+    """Resolve targets through ordered strategies, trying the cached winner first."""
+
+    def __init__(self, platform: str):
+        self.platform = platform
+        self.cache = KeyValueCache("selectors")
+
+    def _key(self, module: str, target: str) -> str:
+        return f"{self.platform}/{module}/{target}"
+
+    def _ordered(self, module: str, target: str, strategies: list[Strategy]) -> list[Strategy]:
+        winner = self.cache.get(self._key(module, target))
+        return sorted(strategies, key=lambda strategy: strategy[0] != winner)
+
+    async def resolve(
+        self,
+        page: Page,
+        module: str,
+        target: str,
+        strategies: list[Strategy],
+        timeout: int = 5000,
+    ) -> Locator:
+        """
+        Return the first locator among the strategies that matches on the page.
+
+        Args:
+            page: Playwright Page object
+            module: Page/module the target lives on (e.g., "contact-info")
+            target: Name of the target (e.g., "continue")
+            strategies: Ordered (name, locator builder) pairs, most specific first
+            timeout: Max total time in ms to wait for any strategy to match
+
+        Returns:
+            Locator (first match) of the winning strategy
+
+        Raises:
+            SelectorMissError: If no strategy matched within the timeout
+        """
+        ordered = self._ordered(module, target, strategies)
+        locators = [(name, build(page)) for name, build in ordered]
+
+        # Fast path: the cached winner is usually already on the page
+        name, locator = locators[0]
+        if await locator.count() > 0:
+            self.cache.set(self._key(module, target), name)
+            return locator.first
+
+        # One wait on the union of all strategies instead of one timeout per strategy
+        union = locator
+        for _, other in locators[1:]:
+            union = union.or_(other)
+        try:
+            await union.first.wait_for(state="visible", timeout=timeout)
+        except PlaywrightTimeoutError:
+            tried = ", ".join(name for name, _ in locators)
+            raise SelectorMissError(
+                f"{self._key(module, target)}: no strategy matched within {timeout} ms ({tried})"
+            ) from None
+
+        for name, locator in locators:
+            if await locator.count() > 0:
+                self.cache.set(self._key(module, target), name)
+                print(f"Resolved {self._key(module, target)} via '{name}'")
+                return locator.first
+
+        raise SelectorMissError(f"{self._key(module, target)}: match disappeared before it could be used")
@@ -0,0 +1,62 @@
+"""
+Small TF-IDF cosine-similarity index over pre-tokenized documents.
+
+Shared by the answer bank (question words) and the field matcher (label
+character n-grams). The index is a dense, row-normalized NumPy matrix, so
+scoring a query against every document is a single matrix-vector product.
+NumPy is optional: without it, building an index raises RuntimeError and
+callers fall back to what they can do without similarity.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # Only needed for the similarity fallbacks
+    np = None
+
+
+class TfidfIndex:
+    """TF-IDF vectors for a fixed list of documents, each a list of terms."""
+
+    def __init__(self, documents: list[list[str]]):
+        if np is None:
+            raise RuntimeError("Similarity matching requires numpy (pip install numpy)")
+        self.vocabulary: dict[str, int] = {}
+        for terms in documents:
+            for term in terms:
+                self.vocabulary.setdefault(term, len(self.vocabulary))
+
+        counts = np.zeros((len(documents), len(self.vocabulary)), dtype=np.float32)
+        for i, terms in enumerate(documents):
+            for term in terms:
+                counts[i, self.vocabulary[term]] += 1
+        document_frequency = np.count_nonzero(counts, axis=0)
+        self.idf = (np.log((1 + len(documents)) / (1 + document_frequency)) + 1).astype(np.float32)
+        self.matrix = _normalize_rows(counts * self.idf)
+
+    def __len__(self) -> int:
+        return self.matrix.shape[0]
+
+    def vectors(self, queries: list[list[str]]) -> "np.ndarray":
+        """Return row-normalized TF-IDF vectors for queries; unknown terms are ignored."""
+        counts = np.zeros((len(queries), len(self.vocabulary)), dtype=np.float32)
+        for i, terms in enumerate(queries):
+            for term in terms:
+                column = self.vocabulary.get(term)
+                if column is not None:
+                    counts[i, column] += 1
+        return _normalize_rows(counts * self.idf)
+
+    def scores(self, queries: list[list[str]]) -> "np.ndarray":
+        """Return the (queries x documents) cosine similarity matrix."""
+        return self.vectors(queries) @ self.matrix.T
+
+    def best(self, terms: list[str]) -> tuple[int, float]:
+        """Return (document index, cosine similarity) of the closest document."""
+        scores = self.scores([terms])[0]
+        best = int(np.argmax(scores))
+        return best, float(scores[best])
+
+
+def _normalize_rows(weights: "np.ndarray") -> "np.ndarray":
+    norms = np.linalg.norm(weights, axis=1, keepdims=True)
+    return weights / np.where(norms == 0, 1, norms)
@@ -0,0 +1,306 @@
+"""
+Soak test: run the workflows against the mock ATS for hours and watch memory.
+
+Each application runs one scenario, taking them in turn:
+
+- "indeed" and "nvidia": the full workflow functions, as they run in
+  production. They connect to the browser over CDP and open their own pages.
+- "anthropic": the Greenhouse fill function on a page from a BrowserSession
+  (common/lifecycle.py), which recycles its context every few applications.
+
+The harness launches a headless Chromium on the CDP port the workflows
+connect to (9222), so nothing may be listening there already. The job URLs
+point at a local MockATS (common/mock_ats.py), so no live job board is
+touched. Each application starts with a fresh in-memory applied-set, so the
+same mock posting can be applied to again and the real applied-jobs database
+is never written.
+
+Every `sample_every` applications, the harness records three numbers:
+
+- Python RSS, plus the memory tracemalloc has traced
+- Chromium RSS, summed over the browser's processes (Linux /proc)
+- the number of open page targets
+
+The report gives each number's growth per application: a least-squares slope
+over the samples after the warmup. It also lists the tracemalloc allocation
+sites that grew the most. The run fails if Python or Chromium memory grows
+faster than its threshold.
+
+Reports and the workflows' output are written to soak/ in the state
+directory. Traces and failure reports go to the state directory as usual, so
+point JOB_APPLY_STATE_DIR at a scratch directory for long runs.
+
+    python common/soak.py --hours 4
+    python common/soak.py --applications 500 --scenario indeed --latency-ms 200
+"""
+
+import argparse
+import asyncio
+import contextlib
+import gc
+import importlib
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from playwright.async_api import Browser, async_playwright
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+from common import applied_jobs
+from common.applied_jobs import AppliedJobs
+from common.deadline import bounded, enforce_deadline
+from common.failure_capture import capture_failures
+from common.lifecycle import BrowserSession
+from common.mock_ats import Fault, MockATS, route_to_mock
+from common.pacing import paced
+from common.run_trace import traced
+from common.storage import STATE_DIR
+
+SOAK_DIR = STATE_DIR / "soak"
+
+CDP_PORT = 9222  # The port the workflows' CDP_URL points at
+
+INDEED_URL = "https://us.smartapply.indeed.com/beta/indeedapply/form/resume-selection-module"
+NVIDIA_URL = "https://nvidia.wd5.myworkdayjobs.com/en-US/NVIDIAExternalCareerSite/job/US,-CA,-Santa-Clara/Senior-ASIC-Test-Timing-Engineer_JR2005476"
+ANTHROPIC_URL = "https://job-boards.greenhouse.io/anthropic/jobs/4020350008"
+
+# Default failure thresholds, in KB of growth per application
+PYTHON_KB_PER_APP = 64
+CHROMIUM_KB_PER_APP = 512
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+# ==================== Scenarios ====================
+
+async def _indeed(session: BrowserSession, server: MockATS, resume: str) -> None:
+    if str(ROOT / "indeed") not in sys.path:
+        sys.path.insert(0, str(ROOT / "indeed"))  # indeed.py imports its siblings by bare name
+    workflow = importlib.import_module("indeed").indeed_application_workflow
+    await workflow(job_url=server.url(INDEED_URL), resume_path=resume)
+
+
+async def _nvidia(session: BrowserSession, server: MockATS, resume: str) -> None:
+    workflow = importlib.import_module("workday.nvidia.nvidia").nvidia_application_workflow
+    await workflow(resume_path=resume, job_url=server.url(NVIDIA_URL))
+
+
+async def _anthropic(session: BrowserSession, server: MockATS, resume: str) -> None:
+    fill = importlib.import_module("anthropic").fill_anthropic_job_application
+    async with session.page() as page:
+        await route_to_mock(page, server)
+        page = traced(paced(bounded(page, "greenhouse"), "greenhouse"), "greenhouse", ANTHROPIC_URL)
+        async with capture_failures(page, "anthropic"), enforce_deadline(page):
+            await fill(page, resume_path=resume)
+        page.trace.write()
+
+
+SCENARIOS = {"indeed": _indeed, "nvidia": _nvidia, "anthropic": _anthropic}
+
+
+# ==================== Memory sampling ====================
+
+def _rss_kb(pid: int | str = "self") -> int | None:
+    """Resident set size of a process from /proc; None where /proc is unavailable."""
+    try:
+        return int(Path(f"/proc/{pid}/statm").read_text().split()[1]) * PAGE_SIZE // 1024
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+async def chromium_memory(browser: Browser) -> dict:
+    """RSS summed over the browser's processes and the number of open page targets."""
+    cdp = await browser.new_browser_cdp_session()
+    try:
+        processes = (await cdp.send("SystemInfo.getProcessInfo"))["processInfo"]
+        targets = (await cdp.send("Target.getTargets"))["targetInfos"]
+    finally:
+        await cdp.detach()
+    sizes = [size for size in (_rss_kb(process["id"]) for process in processes) if size is not None]
+    return {
+        "chromium_rss_kb": sum(sizes) if sizes else None,
+        "chromium_processes": len(processes),
+        "pages": sum(1 for target in targets if target["type"] == "page"),
+    }
+
+
+def _growth(samples: list[dict], key: str, warmup: int) -> float | None:
+    """Least-squares slope of `key` per application over the samples after the warmup."""
+    points = [(s["applications"], s[key]) for s in samples if s["applications"] >= warmup and s[key] is not None]
+    if len(points) < 2 or len({x for x, _ in points}) < 2:
+        return None
+    return statistics.linear_regression(*zip(*points)).slope
+
+
+def _top_allocations(baseline: tracemalloc.Snapshot, top: int) -> list[dict]:
+    ignore = (tracemalloc.Filter(False, tracemalloc.__file__),)
+    current = tracemalloc.take_snapshot().filter_traces(ignore)
+    return [
+        {
+            "where": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+            "size_diff_kb": round(stat.size_diff / 1024, 1),
+            "count_diff": stat.count_diff,
+        }
+        for stat in current.compare_to(baseline.filter_traces(ignore), "lineno")[:top]
+    ]
+
+
+# ==================== Soak loop ====================
+
+def _fresh_applied_set() -> None:
+    """Give the workflows an empty in-memory applied-set for the next application."""
+    if applied_jobs._applied_jobs is not None:
+        applied_jobs._applied_jobs.close()
+    applied_jobs._applied_jobs = AppliedJobs(":memory:")
+
+
+async def soak(
+    scenarios: list[str] | None = None,
+    hours: float | None = None,
+    applications: int | None = None,
+    sample_every: int = 10,
+    warmup: int = 20,
+    python_kb: float = PYTHON_KB_PER_APP,
+    chromium_kb: float = CHROMIUM_KB_PER_APP,
+    faults: dict[str, Fault] | None = None,
+    top: int = 15,
+) -> dict:
+    """
+    Run applications in a loop until the time or application limit and report memory growth.
+
+    Args:
+        scenarios: Names from SCENARIOS, run in turn (default: all)
+        hours: Stop after this long
+        applications: Stop after this many applications (default 200 when `hours` is not given either)
+        sample_every: Take a memory sample every this many applications
+        warmup: Applications before growth is measured (caches and JIT settle first)
+        python_kb: Fail if Python RSS grows more than this per application
+        chromium_kb: Fail if Chromium RSS grows more than this per application
+        faults: Fault injection for the mock server (see common/mock_ats.py)
+        top: Number of tracemalloc allocation sites in the report
+
+    Returns:
+        The report; "passed" is False when a growth threshold is exceeded
+    """
+    scenarios = scenarios or list(SCENARIOS)
+    if hours is None and applications is None:
+        applications = 200
+    deadline = time.monotonic() + hours * 3600 if hours is not None else None
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    SOAK_DIR.mkdir(parents=True, exist_ok=True)
+    resume = SOAK_DIR / "resume.txt"
+    resume.write_text("Harry Potter\nSoftware Engineer\n")
+    log_path = SOAK_DIR / f"soak-{stamp}.log"
+
+    samples: list[dict] = []
+    errors: dict[str, int] = {}
+    done = failures = 0
+    baseline = None
+    started = time.monotonic()
+    tracemalloc.start()
+
+    async def sample(browser: Browser) -> None:
+        gc.collect()
+        record = {
+            "applications": done,
+            "elapsed": round(time.monotonic() - started, 1),
+            "python_rss_kb": _rss_kb(),
+            "python_traced_kb": tracemalloc.get_traced_memory()[0] // 1024,
+            **await chromium_memory(browser),
+            "failures": failures,
+        }
+        samples.append(record)
+        print(
+            f"[soak] {done} applications, {record['elapsed']:.0f}s: python {record['python_rss_kb']} KB, "
+            f"chromium {record['chromium_rss_kb']} KB in {record['chromium_processes']} processes, "
+            f"{record['pages']} pages, {failures} failures"
+        )
+
+    with MockATS(faults) as server, open(log_path, "a") as log:
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True, args=[f"--remote-debugging-port={CDP_PORT}"])
+            session = BrowserSession(browser)
+            try:
+                await sample(browser)
+                while (applications is None or done < applications) and (deadline is None or time.monotonic() < deadline):
+                    name = scenarios[done % len(scenarios)]
+                    _fresh_applied_set()
+                    try:
+                        with contextlib.redirect_stdout(log):
+                            await SCENARIOS[name](session, server, str(resume))
+                    except Exception as error:
+                        print(f"{name} application {done + 1} failed: {error!r}", file=log)
+                        failures += 1
+                        key = f"{name}: {type(error).__name__}"
+                        errors[key] = errors.get(key, 0) + 1
+                    done += 1
+                    if done == warmup:
+                        gc.collect()
+                        baseline = tracemalloc.take_snapshot()
+                    if done % sample_every == 0:
+                        await sample(browser)
+                if done % sample_every:
+                    await sample(browser)
+            finally:
+                await session.close()
+                await browser.close()
+
+    growth = {key: _growth(samples, key, warmup) for key in ("python_rss_kb", "python_traced_kb", "chromium_rss_kb", "pages")}
+    exceeded = [
+        f"{key} grew {growth[key]:.1f} KB per application (threshold {limit} KB)"
+        for key, limit in (("python_rss_kb", python_kb), ("chromium_rss_kb", chromium_kb))
+        if growth[key] is not None and growth[key] > limit
+    ]
+    report = {
+        "scenarios": scenarios,
+        "applications": done,
+        "failures": failures,
+        "errors": errors,
+        "seconds": round(time.monotonic() - started, 1),
+        "warmup": warmup,
+        "thresholds_kb_per_application": {"python_rss_kb": python_kb, "chromium_rss_kb": chromium_kb},
+        "growth_per_application": {key: None if value is None else round(value, 2) for key, value in growth.items()},
+        "exceeded": exceeded,
+        "passed": not exceeded,
+        "top_allocations": _top_allocations(baseline, top) if baseline else [],
+        "samples": samples,
+        "server_requests": dict(server.requests),
+        "contexts_recycled": session.recycled,
+        "log": str(log_path),
+    }
+    tracemalloc.stop()
+
+    report_path = SOAK_DIR / f"soak-{stamp}.json"
+    report_path.write_text(json.dumps(report, indent=2))
+    print(f"[soak] {'PASSED' if report['passed'] else 'FAILED'}: {done} applications, {failures} failures; report {report_path}")
+    for line in exceeded:
+        print(f"[soak]   {line}")
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Soak the workflows against the mock ATS and check memory growth.")
+    parser.add_argument("--hours", type=float)
+    parser.add_argument("--applications", type=int)
+    parser.add_argument("--scenario", action="append", choices=list(SCENARIOS), help="Repeat for several (default: all)")
+    parser.add_argument("--sample-every", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--python-kb", type=float, default=PYTHON_KB_PER_APP, help="Max Python RSS growth per application")
+    parser.add_argument("--chromium-kb", type=float, default=CHROMIUM_KB_PER_APP, help="Max Chromium RSS growth per application")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Mock latency for every endpoint")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Mock error rate for every endpoint")
+    args = parser.parse_args()
+
+    os.environ.setdefault("JOB_APPLY_PACING", "fastest")  # Memory, not pacing, is under test
+    sys.path.insert(0, str(Path.cwd()))
+    faults = {"*": Fault(latency_ms=args.latency_ms, jitter_ms=args.latency_ms / 2, error_rate=args.error_rate)}
+    result = asyncio.run(soak(
+        args.scenario, args.hours, args.applications, args.sample_every, args.warmup,
+        args.python_kb, args.chromium_kb, faults,
+    ))
+    sys.exit(0 if result["passed"] else 1)
@@ -0,0 +1,59 @@
+"""
+Recorded traces for application steps the automation does not recognise.
+
+When a step detector lands on a page it has no handler for, it calls
+`record_unknown_step` so the page can be inspected later and a handler added.
+"""
+
+import json
+import time
+from dataclasses import asdict
+
+from playwright.async_api import Page
+
+from common.field_matcher import classify_labels
+from common.storage import STATE_DIR
+
+TRACE_DIR = STATE_DIR / "traces"
+
+# Collected in a single evaluate so tracing costs one round trip
+SNAPSHOT_JS = """() => ({
+    title: document.title,
+    headings: [...document.querySelectorAll('h1, h2, h3, legend')].map(e => e.innerText.trim()).filter(Boolean).slice(0, 20),
+    testIds: [...new Set([...document.querySelectorAll('[data-testid], [data-automation-id]')]
+        .map(e => e.getAttribute('data-testid') || e.getAttribute('data-automation-id')))].slice(0, 200),
+    labels: [...document.querySelectorAll('label')].map(e => e.innerText.trim()).filter(Boolean).slice(0, 50),
+})"""
+
+
+async def record_unknown_step(platform: str, page: Page, reason: str, detected: dict | None = None) -> str:
+    """
+    Save a trace of the current page for a step we could not handle.
+
+    Args:
+        platform: Platform name (e.g., "indeed", "workday")
+        page: Playwright Page object on the unknown step
+        reason: Why the step is being traced (e.g., "unknown module")
+        detected: Whatever the detector saw (markers, URL parts, ...)
+
+    Returns:
+        Path of the written trace file
+    """
+    TRACE_DIR.mkdir(parents=True, exist_ok=True)
+    snapshot = await page.evaluate(SNAPSHOT_JS)
+    trace = {
+        "platform": platform,
+        "reason": reason,
+        "url": page.url,
+        "recorded_at": time.time(),
+        "detected": detected or {},
+        **snapshot,
+        # Suggested profile attribute per label, to speed up writing the handler
+        "field_matches": {label: asdict(match) for label, match in classify_labels(platform, snapshot["labels"]).items()},
+    }
+    stem = f"{platform}-{time.strftime('%Y%m%d-%H%M%S')}-{int(time.time() * 1000) % 1000:03d}"
+    path = TRACE_DIR / f"{stem}.json"
+    path.write_text(json.dumps(trace, indent=2, ensure_ascii=False))
+    (TRACE_DIR / f"{stem}.html").write_text(await page.content())
+    print(f"Recorded unknown {platform} step ({reason}): {path}")
+    return str(path)
@@ -0,0 +1,40 @@
+"""
+Local on-disk state shared by the job application workflows.
+
+Every persistent index or cache lives in a single state directory as a small
+SQLite database, so runs on the same machine share what earlier runs learned.
+"""
+
+import os
+import sqlite3
+from pathlib import Path
+
+# Override with the JOB_APPLY_STATE_DIR environment variable
+STATE_DIR = Path(
+    os.environ.get("JOB_APPLY_STATE_DIR", Path(__file__).resolve().parent.parent / ".state")
+)
+
+
+def connect(db_name: str, schema: str = "") -> sqlite3.Connection:
+    """
+    Open (and create if needed) a SQLite database in the state directory.
+
+    Args:
+        db_name: File name of the database (e.g., "postings.sqlite3").
+                 Use ":memory:" for a throwaway in-memory database.
+        schema: SQL script run on every open; use CREATE ... IF NOT EXISTS
+
+    Returns:
+        An open sqlite3 connection in WAL mode with row access by name
+    """
+    if db_name == ":memory:":
+        conn = sqlite3.connect(db_name)
+    else:
+        STATE_DIR.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(STATE_DIR / db_name)
+        conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.row_factory = sqlite3.Row
+    if schema:
+        conn.executescript(schema)
+    return conn
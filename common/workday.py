@@ -0,0 +1,164 @@
+"""
+Response-driven Save and Continue for Workday application steps.
+
+Instead of clicking and sleeping, a save waits for the save request's
+response and then for the next step's heading. Only a request to the save
+endpoint (SAVE_URL) counts: Workday also fires autosave, typeahead and
+telemetry calls while a step is open, and their responses say nothing about
+the save. A tenant whose save request does not match SAVE_URL falls back to
+waiting for the step to change. Validation errors, either in
+the response body or in the error banner Workday renders, are parsed into a
+structured list and raised, so a failed save is reported where it happened
+rather than as a timeout on the next page.
+"""
+
+import json
+import re
+from dataclasses import dataclass
+from urllib.parse import urlparse
+
+from playwright.async_api import Page, Response, TimeoutError as PlaywrightTimeoutError
+
+# The active step label in the progress bar; falls back to the page heading
+HEADING_JS = """() => {
+    const el = document.querySelector('[data-automation-id="progressBarActiveStep"]')
+        || document.querySelector('main h2, h2');
+    return el ? el.innerText.trim() : '';
+}"""
+
+# Resolves once the heading changed or Workday rendered an error banner
+TRANSITION_JS = """(before) => {
+    if (document.querySelector('[data-automation-id="errorBanner"], [data-automation-id="errorMessage"]')) return true;
+    const el = document.querySelector('[data-automation-id="progressBarActiveStep"]')
+        || document.querySelector('main h2, h2');
+    return !!el && el.innerText.trim() !== before;
+}"""
+
+# Error messages rendered in the banner and next to fields
+DOM_ERRORS_JS = """() => [...document.querySelectorAll('[data-automation-id="errorMessage"]')].map(e => {
+    const widget = e.closest('[data-automation-id^="formField-"]');
+    return {
+        field: widget ? widget.getAttribute('data-automation-id').replace('formField-', '') : '',
+        message: e.innerText.trim(),
+    };
+}).filter(error => error.message)"""
+
+ERROR_KEYS = ("errors", "validationErrors", "errorMessages", "fieldErrors")
+
+# The save endpoint: a "save" path segment or action, but not autosave or a draft save
+SAVE_URL = re.compile(r"(/save(AndContinue)?(/|\?|$)|[?&]action=save(&|$))", re.IGNORECASE)
+
+
+@dataclass(frozen=True, slots=True)
+class FieldError:
+    """One validation error reported by Workday."""
+
+    field: str  # Field id or label, "" for page-level errors
+    message: str
+
+
+class WorkdaySaveError(RuntimeError):
+    """Raised when Save and Continue is rejected; lists every validation error."""
+
+    def __init__(self, step: str, errors: list[FieldError]):
+        details = "\n  - ".join(f"{error.field}: {error.message}" if error.field else error.message for error in errors)
+        super().__init__(f"Save failed on {step or 'current step'}:\n  - {details}")
+        self.step = step
+        self.errors = errors
+
+
+def parse_errors(payload, inside_errors: bool = False) -> list[FieldError]:
+    """
+    Collect validation errors from a save response body.
+
+    Looks for lists under keys like "errors" or "validationErrors" whose items
+    carry a message, at any depth.
+    """
+    found = []
+    if isinstance(payload, dict):
+        message = payload.get("message") or payload.get("errorMessage")
+        if inside_errors and isinstance(message, str):
+            field = payload.get("field") or payload.get("widgetId") or payload.get("label") or ""
+            found.append(FieldError(str(field), message))
+        for key, value in payload.items():
+            if isinstance(value, (dict, list)):
+                found += parse_errors(value, inside_errors or key in ERROR_KEYS)
+    elif isinstance(payload, list):
+        for item in payload:
+            found += parse_errors(item, inside_errors)
+    elif inside_errors and isinstance(payload, str):
+        found.append(FieldError("", payload))
+    return found
+
+
+def _is_save_request(page: Page, save_url: re.Pattern):
+    host = urlparse(page.url).netloc
+
+    def predicate(response: Response) -> bool:
+        request = response.request
+        return (
+            request.method in ("POST", "PUT")
+            and request.resource_type in ("xhr", "fetch")
+            and urlparse(response.url).netloc == host
+            and save_url.search(response.url) is not None
+        )
+
+    return predicate
+
+
+async def _response_errors(response: Response) -> list[FieldError]:
+    try:
+        payload = json.loads(await response.text())
+    except (ValueError, UnicodeDecodeError):
+        payload = None
+    errors = parse_errors(payload) if payload is not None else []
+    if response.status >= 400 and not errors:
+        errors = [FieldError("", f"HTTP {response.status} from {urlparse(response.url).path}")]
+    return errors
+
+
+async def save_and_continue(page: Page, timeout: int = 15000, save_url: re.Pattern = SAVE_URL) -> str:
+    """
+    Click Save and Continue and wait for the save response and the next step.
+
+    Args:
+        page: Playwright Page object on a Workday application step
+        timeout: Max time in ms to wait for the response and the next heading
+        save_url: Pattern the save request's URL matches; other requests are ignored
+
+    Returns:
+        Heading of the step the application moved to
+
+    Raises:
+        WorkdaySaveError: If the server or the page reports validation errors,
+            or the step does not change after the save
+    """
+    step = await page.evaluate(HEADING_JS)
+    save_button = page.get_by_role("button", name="Save and Continue")
+
+    clicked = False
+    try:
+        async with page.expect_response(_is_save_request(page, save_url), timeout=timeout) as response_info:
+            await save_button.click(timeout=timeout)
+            clicked = True
+        errors = await _response_errors(await response_info.value)
+    except PlaywrightTimeoutError:
+        if not clicked:
+            raise
+        # The tenant's save request does not match save_url; the step change still tells
+        print(f"No save response matched {save_url.pattern}; waiting for the step to change")
+        errors = []
+    if errors:
+        raise WorkdaySaveError(step, errors)
+
+    try:
+        await page.wait_for_function(TRANSITION_JS, arg=step, timeout=timeout)
+    except PlaywrightTimeoutError:
+        raise WorkdaySaveError(step, [FieldError("", f"still on this step {timeout // 1000}s after Save and Continue")]) from None
+    errors = [FieldError(**error) for error in await page.evaluate(DOM_ERRORS_JS)]
+    if errors:
+        raise WorkdaySaveError(step, errors)
+
+    next_step = await page.evaluate(HEADING_JS)
+    print(f"Saved '{step}', now on '{next_step}'")
+    return next_step
@@ -0,0 +1,83 @@
+"""
+Greenhouse Batch Application Script
+
+This script runs the Greenhouse workflows (Anthropic, xAI, Figma) one after
+another through the PrefetchingRunner (common/runner.py): while one form is
+being filled, the next posting is already loading in a second tab.
+
+Each workflow's answers are prepared and validated before the browser is
+started, and postings that were already applied to are skipped. A failed
+application is captured and the batch moves on to the next posting.
+
+    python greenhouse/batch.py
+"""
+
+import asyncio
+import importlib
+import sys
+import time
+from pathlib import Path
+
+from playwright.async_api import async_playwright
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+from common.applied_jobs import already_applied
+from common.host_controller import HostController
+from common.motion import suppress_motion
+from common.runner import Job, PrefetchingRunner
+
+# (module, job URL attribute, fill function attribute); each module has prepare_answers and finish_application
+WORKFLOWS = (
+    ("anthropic", "ANTHROPIC_JOB_URL", "fill_anthropic_job_application"),
+    ("greenhouse.xai", "XAI_JOB_URL", "fill_xai_job_application"),
+    ("greenhouse.figma", "FIGMA_JOB_URL", "apply_for_figma_job"),
+)
+
+
+def _apply(module, fill, answers: dict):
+    async def apply(page):
+        started = time.perf_counter()
+        await suppress_motion(page)  # react-select menus open without animating
+        await fill(page, **answers)
+        print(page.pacer.summary(time.perf_counter() - started))
+        module.finish_application(answers)
+
+    return apply
+
+
+async def greenhouse_batch(cdp_url: str = "http://localhost:9222", max_prefetch: int = 1) -> list:
+    """
+    Apply to every Greenhouse workflow's posting not applied to yet.
+
+    Args:
+        cdp_url: Chrome DevTools Protocol URL of the browser to apply in
+        max_prefetch: Max postings loading ahead of the one being filled
+
+    Returns:
+        The runner's JobResult for each posting that was attempted
+    """
+    jobs = []
+    for name, url_attribute, fill_attribute in WORKFLOWS:
+        module = importlib.import_module(name)
+        url = getattr(module, url_attribute)
+        if already_applied(url):
+            continue
+        answers = await module.prepare_answers()
+        jobs.append(Job(url, apply=_apply(module, getattr(module, fill_attribute), answers), platform="greenhouse"))
+    if not jobs:
+        return []
+
+    async with async_playwright() as p:
+        browser = await p.chromium.connect_over_cdp(cdp_url)
+        try:
+            runner = PrefetchingRunner(browser.contexts[0], max_prefetch=max_prefetch, controller=HostController())
+            return await runner.run(jobs)
+        finally:
+            await browser.close()
+
+
+if __name__ == "__main__":
+    results = asyncio.run(greenhouse_batch())
+    for result in results:
+        print(f"{'✓' if result.ok else '✗'} {result.url} ({result.seconds:.1f}s)")
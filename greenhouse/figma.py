@@ -9,10 +9,36 @@ uploads a resume, and completes the form.
 """
 
 import os
+import sys
 import asyncio
+import time
+from pathlib import Path
 from playwright.async_api import async_playwright
 import re
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.answer_bank import approve_answers, bank_answers, typed_answers
+from common.applied_jobs import already_applied, mark_applied
+from common.option_sets import harvest_greenhouse_options, validate_answers
+from common.motion import suppress_motion
+from common.pacing import paced
+from common.run_trace import traced
+from common.autocomplete import select_autocomplete
+from common.deadline import bounded, enforce_deadline
+from common.lifecycle import browser_page
+from common.failure_capture import capture_failures
+from common.plan import Step, optimize, run_plan
+
+FIGMA_JOB_URL = "https://job-boards.greenhouse.io/figma/jobs/5660873004?gh_jid=5660873004"
+ESSAY_QUESTIONS = {
+    "why_join": "Why do you want to join Figma?",
+}
+# Dropdown parameters and their question labels, for harvesting option sets
+DROPDOWN_QUESTIONS = {
+    "authorized_to_work": "authorized to work",
+    "worked_before": "worked for Figma before",
+}
+
 async def apply_for_figma_job(
     page,
     first_name: str = "Miku",
@@ -107,152 +133,109 @@ async def apply_for_figma_job(
         resume_path: Path to resume file (pdf, doc, docx, txt, rtf)
     """
 
-    try:
-        # Navigate to the Figma job posting
-        await page.goto(
-            "https://job-boards.greenhouse.io/figma/jobs/5660873004?gh_jid=5660873004",
-            wait_until="load"
-        )
-        await page.wait_for_timeout(1500)
-
-        # Click Apply button to open the application form
-        apply_button = page.get_by_role("button", name="Apply")
-        await apply_button.click()
-        await page.wait_for_timeout(500)
-
-        # Fill First Name
-        first_name_field = page.get_by_role("textbox", name="First Name", exact=True)
-        await first_name_field.click()
-        await first_name_field.fill(first_name)
-        await page.wait_for_timeout(300)
-
-        # Fill Last Name
-        last_name_field = page.get_by_role("textbox", name="Last Name")
-        await last_name_field.click()
-        await last_name_field.fill(last_name)
-        await page.wait_for_timeout(300)
+    async def select_location(page):
+        location_field = page.get_by_role("combobox", name="Location (City)")
+        await select_autocomplete(page, "greenhouse", "location", location_field, location)
 
-        # Fill Email
-        email_field = page.get_by_role("textbox", name="Email")
-        await email_field.click()
-        await email_field.fill(email)
-        await page.wait_for_timeout(300)
+    def dropdown(name, option):
+        return [
+            Step("click", ("role", "combobox", name, True), independent=True),
+            Step("wait", value=500),
+            Step("click", ("role", "option", option), independent=True),
+            Step("wait", value=300),
+        ]
 
+    plan = [
+        # Navigate to the Figma job posting
+        Step("goto", value=FIGMA_JOB_URL),
+        Step("wait", value=1500),
+        # Click Apply button to open the application form
+        Step("click", ("role", "button", "Apply"), barrier=True),
+        Step("wait", value=500),
+        Step("click", ("role", "textbox", "First Name", True)),
+        Step("fill", ("role", "textbox", "First Name", True), first_name),
+        Step("wait", value=300),
+        Step("click", ("role", "textbox", "Last Name")),
+        Step("fill", ("role", "textbox", "Last Name"), last_name),
+        Step("wait", value=300),
+        Step("click", ("role", "textbox", "Email")),
+        Step("fill", ("role", "textbox", "Email"), email),
+        Step("wait", value=300),
         # Select Phone Country (custom dropdown)
-        # Click to open the country dropdown
-        country = page.get_by_role("combobox", name="Country", exact=True)
-        await country.click()
-        await page.wait_for_timeout(500)
-
-        # Select the country option
-        country_option = page.get_by_role("option", name=phone_country)
-        await country_option.click()
-        await page.wait_for_timeout(300)
-
-        # Fill Phone Number
-        phone_field = page.get_by_role("textbox", name="Phone")
-        await phone_field.click()
-        await phone_field.fill(phone_number)
-        await page.wait_for_timeout(500)
-
+        *dropdown("Country", phone_country),
+        # Selecting the country reformats the phone field, so keep the phone after it
+        Step("click", ("role", "textbox", "Phone")),
+        Step("fill", ("role", "textbox", "Phone"), phone_number, barrier=True),
+        Step("wait", value=500),
         # Select Location (City) - Autocomplete combobox
-        location_field = page.get_by_role("combobox", name="Location (City)")
-        await location_field.click()
-        await location_field.fill(location)
-        await page.wait_for_timeout(500)
-
-        # Click the location option
-        location_option = page.get_by_role("option", name=location).nth(0)
-        await location_option.click()
-        await page.wait_for_timeout(500)
-
-        # Scroll down to see Resume/CV section
-        await page.wait_for_timeout(300)
-
-        # Upload Resume - Click Attach button
-        attach_button = page.get_by_role("button", name="Attach")
-        await attach_button.click()
-        await page.wait_for_timeout(300)
-
-        # Set the file input
-        file_input = page.locator('input[type="file"]#resume')
-        await file_input.set_input_files(os.path.abspath(resume_path))
-        await page.wait_for_timeout(1000)
-
-        # Scroll down to see more fields
-        await page.wait_for_timeout(300)
-
-        # Fill Why do you want to join Figma?
-        why_join_field = page.get_by_role("textbox", name="Why do you want to join Figma?")
-        await why_join_field.click()
-        await why_join_field.fill(why_join)
-        await page.wait_for_timeout(300)
-
-        # Scroll down to work location field
-        await page.wait_for_timeout(300)
-
-        # Fill From where do you intend to work?
-        work_location_field = page.get_by_role("textbox", name="From where do you intend to work?")
-        await work_location_field.click()
-        await work_location_field.fill(work_location)
-        await page.wait_for_timeout(300)
-
-        # Scroll down to authorization fields
-        await page.wait_for_timeout(300)
+        Step("call", value=select_location),
+        Step("wait", value=300, note="Scroll down to see Resume/CV section"),
+        # Upload Resume - Click Attach button, then set the file input
+        Step("click", ("role", "button", "Attach")),
+        Step("wait", value=300),
+        Step("upload", ("css", 'input[type="file"]#resume'), os.path.abspath(resume_path)),
+        Step("wait", value=1000),
+        Step("wait", value=300, note="Scroll down to see more fields"),
+        Step("click", ("role", "textbox", "Why do you want to join Figma?")),
+        Step("fill", ("role", "textbox", "Why do you want to join Figma?"), why_join),
+        Step("wait", value=300),
+        Step("wait", value=300, note="Scroll down to work location field"),
+        Step("click", ("role", "textbox", "From where do you intend to work?")),
+        Step("fill", ("role", "textbox", "From where do you intend to work?"), work_location),
+        Step("wait", value=300),
+        Step("wait", value=300, note="Scroll down to authorization fields"),
+        *dropdown("Are you authorized to work in the country for which you applied?", authorized_to_work),
+        *dropdown("Have you ever worked for Figma before, as an employee or a contractor/consultant?", worked_before),
+        Step("wait", value=500, note="Scroll to Submit button"),
+        # Submit the application
+        Step("click", ("role", "button", "Submit application"), barrier=True),
+        Step("wait", value=1000),
+    ]
 
-        # Select "Are you authorized to work in the country for which you applied?"
-        auth_dropdown = page.get_by_role("combobox", name="Are you authorized to work in the country for which you applied?")
-        await auth_dropdown.click()
-        await page.wait_for_timeout(500)
+    try:
+        await run_plan(page, optimize(plan, "figma application"))
 
-        auth_option = page.get_by_role("option", name=authorized_to_work)
-        await auth_option.click()
-        await page.wait_for_timeout(300)
+        print("✓ Application submitted successfully")
+        mark_applied(FIGMA_JOB_URL, status="submitted")
 
-        # Select "Have you ever worked for Figma before, as an employee or a contractor/consultant?"
-        worked_before_dropdown = page.get_by_role("combobox", name="Have you ever worked for Figma before, as an employee or a contractor/consultant?")
-        await worked_before_dropdown.click()
-        await page.wait_for_timeout(500)
+    except Exception as e:
+        print(f"✗ Error during application submission: {str(e)}")
+        raise
 
-        worked_before_option = page.get_by_role("option", name=worked_before)
-        await worked_before_option.click()
-        await page.wait_for_timeout(300)
 
-        # Scroll to Submit button
-        await page.wait_for_timeout(500)
+async def prepare_answers() -> dict:
+    """
+    Answers for apply_for_figma_job, checked before a browser is started.
 
-        # Submit the application
-        submit_button = page.get_by_role("button", name="Submit application")
-        await submit_button.click()
-        await page.wait_for_timeout(1000)
+    Approved essay answers come from the answer bank; answers that match no
+    option fail here.
+    """
+    await harvest_greenhouse_options(FIGMA_JOB_URL, DROPDOWN_QUESTIONS)  # Unknown option sets only
+    return validate_answers(FIGMA_JOB_URL, apply_for_figma_job, **bank_answers("Figma", ESSAY_QUESTIONS))
 
-        print("✓ Application submitted successfully")
 
-    except Exception as e:
-        print(f"✗ Error during application submission: {str(e)}")
-        raise
+def finish_application(answers: dict) -> None:
+    """Learn the essays actually typed; only called once the submit went through."""
+    approve_answers("Figma", ESSAY_QUESTIONS, typed_answers(apply_for_figma_job, ESSAY_QUESTIONS, answers))
 
 
 if __name__ == "__main__":
     CDP_URL = "http://localhost:9222"  # Set to None for new browser
 
     async def main():
-        async with async_playwright() as p:
-            if CDP_URL:
-                # Connect to existing browser via CDP
-                browser = await p.chromium.connect_over_cdp(CDP_URL)
-                ctx = browser.contexts[0]
-                page = await ctx.new_page()
-            else:
-                # Launch new headless browser
-                browser = await p.chromium.launch(headless=True)
-                page = await browser.new_page()
-
+        if already_applied(FIGMA_JOB_URL):
+            return
+        answers = await prepare_answers()
+
+        async with async_playwright() as p, browser_page(p, CDP_URL, headless=True) as page:
+            page = traced(paced(bounded(page, "greenhouse"), "greenhouse"), "greenhouse", FIGMA_JOB_URL)
+            started = time.perf_counter()
+            await suppress_motion(page)  # react-select menus open without animating
             # Call the automation function
-            await apply_for_figma_job(
-                page
-            )
-
-            await browser.close()
+            async with capture_failures(page, "figma"), enforce_deadline(page):
+                await apply_for_figma_job(page, **answers)
+            print(page.pacer.summary(time.perf_counter() - started))
+            page.trace.write()
+            finish_application(answers)
 
     asyncio.run(main())
@@ -4,9 +4,35 @@ Fills out the Greenhouse job application form with provided information.
 """
 
 import os
+import sys
 import asyncio
+import time
+from pathlib import Path
 from playwright.async_api import async_playwright
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.answer_bank import bank_answers, hold_answers, typed_answers
+from common.applied_jobs import FILLED, already_applied, mark_applied
+from common.job_urls import same_posting
+from common.option_sets import harvest_greenhouse_options, validate_answers
+from common.deadline import bounded, enforce_deadline
+from common.lifecycle import browser_page
+from common.failure_capture import capture_failures
+from common.motion import suppress_motion, wait_until_settled
+from common.pacing import paced
+from common.profile import env_profile
+from common.run_trace import traced
+
+XAI_JOB_URL = "https://job-boards.greenhouse.io/xai/jobs/4977264007"
+ESSAY_QUESTIONS = {
+    "ideal_candidate_response": "What makes you the ideal candidate for this position?",
+    "exceptional_work_response": "What exceptional work have you done?",
+}
+# Dropdown parameters and their question labels, for harvesting option sets
+DROPDOWN_QUESTIONS = {
+    "visa_sponsorship": "require sponsorship",
+}
+
 
 async def fill_xai_job_application(
     page,
@@ -49,12 +75,10 @@ async def fill_xai_job_application(
         x_profile: X (formerly Twitter) profile URL
     """
 
-    # Navigate to the job posting page
-    await page.goto(
-        "https://job-boards.greenhouse.io/xai/jobs/4977264007",
-        wait_until="load"
-    )
-    await page.wait_for_timeout(1500)
+    # Navigate to the job posting page, unless a runner already opened it
+    if not same_posting(page.url, XAI_JOB_URL):
+        await page.goto(XAI_JOB_URL, wait_until="load")
+        await page.wait_for_timeout(1500)
 
     # Fill First Name
     await page.get_by_role("textbox", name="First Name").click()
@@ -76,7 +100,7 @@ async def fill_xai_job_application(
     country_input = page.get_by_role("combobox", name="Country")
     await country_input.click()
     await country_input.fill("united")
-    await page.wait_for_timeout(500)
+    await wait_until_settled(page)
 
     # Click the appropriate country option
     # Using dynamic ID matching since the option ID contains numbers
@@ -134,7 +158,7 @@ async def fill_xai_job_application(
     # Click on the dropdown using its label
     visa_dropdown = page.locator("label:has-text('Will you now, or in the future, require sponsorship')").locator("..").locator("[class*='select__control']")
     await visa_dropdown.click()
-    await page.wait_for_timeout(500)
+    await wait_until_settled(page)
 
     # Select Yes or No based on visa_sponsorship parameter
     if visa_sponsorship == "Yes":
@@ -166,25 +190,45 @@ async def fill_xai_job_application(
     print("Application form filled successfully!")
 
 
+async def prepare_answers() -> dict:
+    """
+    Answers for fill_xai_job_application, checked before a browser is started.
+
+    Approved essay answers come from the answer bank and a profile named by
+    JOB_APPLY_PROFILE overrides them; answers that match no option fail here.
+    """
+    await harvest_greenhouse_options(XAI_JOB_URL, DROPDOWN_QUESTIONS)  # Unknown option sets only
+    profile = env_profile()
+    answers = {
+        **bank_answers("xAI", ESSAY_QUESTIONS),
+        **(profile.arguments(fill_xai_job_application, "greenhouse") if profile else {}),
+    }
+    return validate_answers(XAI_JOB_URL, fill_xai_job_application, **answers)
+
+
+def finish_application(answers: dict) -> None:
+    """Record the filled application; it was not submitted, so its essays wait for approval."""
+    mark_applied(XAI_JOB_URL, status=FILLED)  # Stops before submitting
+    hold_answers(XAI_JOB_URL, "xAI", ESSAY_QUESTIONS, typed_answers(fill_xai_job_application, ESSAY_QUESTIONS, answers))
+
+
 if __name__ == "__main__":
     CDP_URL = "http://localhost:9222"  # Set to None for new browser
 
     async def main():
-        async with async_playwright() as p:
-            if CDP_URL:
-                # Connect to existing browser via CDP
-                browser = await p.chromium.connect_over_cdp(CDP_URL)
-                ctx = browser.contexts[0]
-                page = await ctx.new_page()
-            else:
-                # Launch new headless browser
-                browser = await p.chromium.launch(headless=True)
-                page = await browser.new_page()
-
-            try:
-                # Call the automation function with default or custom parameters
-                await fill_xai_job_application(page)
-            finally:
-                await browser.close()
+        if already_applied(XAI_JOB_URL):
+            return
+        answers = await prepare_answers()
+
+        async with async_playwright() as p, browser_page(p, CDP_URL, headless=True) as page:
+            page = traced(paced(bounded(page, "greenhouse"), "greenhouse"), "greenhouse", XAI_JOB_URL)
+            started = time.perf_counter()
+            await suppress_motion(page)  # react-select menus open without animating
+            # Call the automation function with default or custom parameters
+            async with capture_failures(page, "xai"), enforce_deadline(page):
+                await fill_xai_job_application(page, **answers)
+            print(page.pacer.summary(time.perf_counter() - started))
+            page.trace.write()
+            finish_application(answers)
 
     asyncio.run(main())
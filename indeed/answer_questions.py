@@ -0,0 +1,124 @@
+"""
+Indeed Job Application Automation - Employer Questions Module
+
+Screening questions differ per posting, so this handler reads every question
+on the module in one evaluate, finds an answer for each (configured answers
+first, then the applicant profile through the field matcher), and fills
+text inputs, text areas, selects, radio groups and checkboxes. Choice
+answers are mapped onto the exact option label. A required question without
+an answer fails the module with the list of open questions instead of
+clicking Continue into a validation error.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.field_matcher import classify_labels, profile_value
+from common.option_sets import map_to_option
+from common.profile import Profile
+
+# Radio and checkbox groups come from fieldsets; every other control from its own label.
+# Each question's element is tagged with its index so it can be located without its label.
+QUESTIONS_JS = """() => {
+    const text = el => (el ? el.innerText : '').replace(/\\s*\\*\\s*$/, '').trim();
+    const questions = [];
+    const grouped = new Set();
+    const tag = el => el.setAttribute('data-question-index', questions.length);
+    for (const group of document.querySelectorAll('main fieldset')) {
+        const inputs = [...group.querySelectorAll('input[type="radio"], input[type="checkbox"]')];
+        if (!inputs.length) continue;
+        inputs.forEach(input => grouped.add(input));
+        tag(group);
+        questions.push({
+            label: text(group.querySelector('legend')) || group.getAttribute('aria-label') || '',
+            kind: inputs[0].type,
+            options: inputs.map(input => text(input.labels[0]) || input.value),
+            answered: inputs.some(input => input.checked),
+            required: inputs.some(input => input.required) || group.getAttribute('aria-required') === 'true',
+        });
+    }
+    for (const el of document.querySelectorAll('main input, main textarea, main select')) {
+        if (grouped.has(el) || ['hidden', 'file', 'radio', 'checkbox', 'submit'].includes(el.type)) continue;
+        tag(el);
+        questions.push({
+            label: text(el.labels && el.labels[0]) || el.getAttribute('aria-label') || '',
+            kind: el.tagName === 'SELECT' ? 'select' : 'text',
+            options: el.tagName === 'SELECT' ? [...el.options].map(o => o.text.trim()).filter(Boolean) : [],
+            answered: el.value.trim() !== '',
+            required: el.required || el.getAttribute('aria-required') === 'true',
+        });
+    }
+    return questions;
+}"""
+
+
+def find_answer(label: str, answers: dict[str, object], profile: Profile | None, match=None):
+    """
+    Answer for one question: the first configured answer whose key occurs in the
+    label (case-insensitive), else the profile value its label classifies to.
+    """
+    folded = label.casefold()
+    for key, value in answers.items():
+        if key.casefold() in folded:
+            return value
+    if profile is not None and match is not None and match.confident:
+        return profile_value(profile, match.attribute)
+    return None
+
+
+async def answer_questions(
+    page,
+    answers: dict[str, object] | None = None,
+    profile: Profile | None = None,
+):
+    """
+    Answer the employer's screening questions on the questions module.
+
+    Args:
+        page: Playwright page object (already on the questions module)
+        answers: Map of question text fragment to answer, e.g.
+                 {"authorized to work": True, "years of": "3"}; checked before the profile
+        profile: Applicant profile for questions the matcher recognises (work
+                 authorization, sponsorship, start date, ...)
+
+    Raises:
+        ValueError: If a required question has no answer or its answer matches no option
+    """
+    answers = answers or {}
+    questions = await page.evaluate(QUESTIONS_JS)
+    matches = classify_labels("indeed", [question["label"] for question in questions if question["label"]])
+    problems = []
+
+    for index, question in enumerate(questions):
+        label, kind = question["label"], question["kind"]
+        element = page.locator(f"[data-question-index='{index}']")
+        value = find_answer(label, answers, profile, matches.get(label)) if label else None
+        if value in ("", None):
+            if question["required"] and not question["answered"]:
+                problems.append(f"{label!r}: no answer")
+            continue
+
+        if kind == "checkbox" and len(question["options"]) == 1:
+            # A single consent or confirmation box: any truthy answer ticks it
+            checkbox = element.get_by_role("checkbox")
+            await (checkbox.check() if value else checkbox.uncheck())
+            continue
+
+        if kind in ("radio", "checkbox", "select"):
+            option = map_to_option(value, question["options"])
+            if option is None:
+                problems.append(f"{label!r}: {value!r} is not one of: {', '.join(question['options'])}")
+                continue
+            print(f"  {label} -> {option}")
+            if kind == "select":
+                await element.select_option(label=option)
+            else:
+                await element.get_by_label(option, exact=True).check()
+        else:
+            print(f"  {label} -> {value}")
+            await element.fill(str(value))
+        await page.wait_for_timeout(200)
+
+    if problems:
+        raise ValueError("Unanswered screening questions:\n  - " + "\n  - ".join(problems))
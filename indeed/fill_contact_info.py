@@ -6,39 +6,24 @@ Fills out contact details including name, phone, and location information.
 import asyncio
 from playwright.async_api import async_playwright
 
+from smartapply import click_continue
 
-async def fill_contact_information(
+
+async def fill_name_and_phone(
     page,
     first_name: str = "Harry",
     last_name: str = "Potter",
     phone_number: str = "650-777-9340",
-    zip_code: str = "95129",
-    city_state: str = "San Jose, CA",
-    street_address: str = "4 Privet Drive",
-    skip_navigation: bool = False,
 ):
     """
-    Fill out the Indeed job application contact information form.
+    Fill the name and phone fields of the contact information module.
 
     Args:
-        page: Playwright page object
-        first_name: Applicant's first name. Default: "Harry"
-        last_name: Applicant's last name. Default: "Potter"
-        phone_number: Phone number in format XXX-XXX-XXXX. Default: "650-777-9340"
-        zip_code: Postal/zip code. Default: "95129"
-        city_state: City and state information. Default: "San Jose, CA"
-        street_address: Street address. Default: "4 Privet Drive"
-        skip_navigation: If True, skip page navigation (for workflow use)
+        page: Playwright page object (already on the contact information module)
+        first_name: Applicant's first name
+        last_name: Applicant's last name
+        phone_number: Phone number in format XXX-XXX-XXXX
     """
-
-    if not skip_navigation:
-        # Navigate to the contact information form
-        await page.goto(
-            "https://us.smartapply.indeed.com/beta/indeedapply/form/contact-info-module",
-            wait_until="load"
-        )
-    await page.wait_for_timeout(1500)
-
     # Fill first name
     first_name_input = page.get_by_test_id("name-fields-first-name-input")
     await first_name_input.click()
@@ -57,14 +42,22 @@ async def fill_contact_information(
     await phone_input.fill(phone_number)
     await page.wait_for_timeout(500)
 
-    # Click Continue button to proceed to next section
-    continue_button = page.get_by_test_id("81fa2ee401fae0bc3addc8c4c29e6ffa9610a7d7ca0eee6949a40d1689b131fb")
-    await continue_button.click()
-    await page.wait_for_timeout(1500)
 
-    # Wait for location information section to load
-    await page.wait_for_selector("[data-test-id='location-fields-postal-code-input']", timeout=5000)
+async def fill_location(
+    page,
+    zip_code: str = "95129",
+    city_state: str = "San Jose, CA",
+    street_address: str = "4 Privet Drive",
+):
+    """
+    Fill the location fields shown after the name and phone fields.
 
+    Args:
+        page: Playwright page object (already on the location fields)
+        zip_code: Postal/zip code
+        city_state: City and state information
+        street_address: Street address
+    """
     # Fill postal/zip code
     postal_code_input = page.get_by_test_id("location-fields-postal-code-input")
     await postal_code_input.click()
@@ -83,9 +76,54 @@ async def fill_contact_information(
     await address_input.fill(street_address)
     await page.wait_for_timeout(500)
 
+
+async def fill_contact_information(
+    page,
+    first_name: str = "Harry",
+    last_name: str = "Potter",
+    phone_number: str = "650-777-9340",
+    zip_code: str = "95129",
+    city_state: str = "San Jose, CA",
+    street_address: str = "4 Privet Drive",
+    skip_navigation: bool = False,
+):
+    """
+    Fill out the Indeed job application contact information form.
+
+    Args:
+        page: Playwright page object
+        first_name: Applicant's first name. Default: "Harry"
+        last_name: Applicant's last name. Default: "Potter"
+        phone_number: Phone number in format XXX-XXX-XXXX. Default: "650-777-9340"
+        zip_code: Postal/zip code. Default: "95129"
+        city_state: City and state information. Default: "San Jose, CA"
+        street_address: Street address. Default: "4 Privet Drive"
+        skip_navigation: If True, skip page navigation (for workflow use)
+    """
+
+    if not skip_navigation:
+        # Navigate to the contact information form
+        await page.goto(
+            "https://us.smartapply.indeed.com/beta/indeedapply/form/contact-info-module",
+            wait_until="load"
+        )
+        await page.wait_for_timeout(1500)
+
+    # Fill first name, last name and phone number
+    await fill_name_and_phone(page, first_name, last_name, phone_number)
+
+    # Click Continue button to proceed to next section
+    await click_continue(page, "contact-info")
+    await page.wait_for_timeout(1500)
+
+    # Wait for location information section to load
+    await page.wait_for_selector("[data-test-id='location-fields-postal-code-input']", timeout=5000)
+
+    # Fill postal/zip code, city/state and street address
+    await fill_location(page, zip_code, city_state, street_address)
+
     # Click Continue button to submit location information
-    continue_button = page.get_by_test_id("81fa2ee401fae0bc3addc8c4c29e6ffa9610a7d7ca0eee6949a40d1689b131fb")
-    await continue_button.click()
+    await click_continue(page, "location")
     await page.wait_for_timeout(1500)
 
 
@@ -5,9 +5,41 @@ This script automates the job experience entry form on Indeed's SmartApply platf
 It fills in job title and company name fields with autocomplete selection.
 """
 
+import sys
 import asyncio
+from pathlib import Path
 from playwright.async_api import async_playwright
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.autocomplete import select_autocomplete
+from smartapply import click_continue
+
+
+async def fill_job_title_and_company(
+    page,
+    job_title: str = "security officer",
+    company_name: str = "warner bros",
+):
+    """
+    Fill the job title and company autocomplete fields of the experience module.
+
+    Args:
+        page: Playwright page object (already on the job experience module)
+        job_title: Job title to enter
+        company_name: Company name to enter
+    """
+    # Wait for the job title input field to be visible
+    await page.wait_for_selector('[data-testid="job-title-input"]', state="visible", timeout=3000)
+
+    # Fill in job title field and select the matching suggestion
+    # The learned prefix/label replaces typing the full value and guessing the label with .title()
+    job_title_input = page.get_by_test_id("job-title-input")
+    await select_autocomplete(page, "indeed", "job-title", job_title_input, job_title)
+
+    # Fill in company name field and select the matching suggestion
+    company_input = page.get_by_test_id("company-name-input")
+    await select_autocomplete(page, "indeed", "company", company_input, company_name)
+
 
 async def fill_job_experience(
     page,
@@ -34,39 +66,17 @@ async def fill_job_experience(
             "https://us.smartapply.indeed.com/beta/indeedapply/form/resume-selection-module/privacy-settings",
             wait_until="load"
         )
-    await page.wait_for_timeout(1500)
+        await page.wait_for_timeout(1500)
 
     # Click Continue button on privacy settings page
-    await page.get_by_text("Continue").click()
+    await click_continue(page, "privacy-settings")
     await page.wait_for_timeout(1000)
 
-    # Wait for the job title input field to be visible
-    await page.wait_for_selector('[data-testid="job-title-input"]', state="visible", timeout=3000)
-
-    # Fill in job title field
-    job_title_input = page.get_by_test_id("job-title-input")
-    await job_title_input.click()
-    await job_title_input.fill(job_title)
-    await page.wait_for_timeout(500)  # Wait for dropdown to appear
-
-    # Select the job title from dropdown
-    # The dropdown shows matching job titles based on input
-    await page.get_by_role("option", name=job_title.title()).click()
-    await page.wait_for_timeout(500)
-
-    # Fill in company name field
-    company_input = page.get_by_test_id("company-name-input")
-    await company_input.click()
-    await company_input.fill(company_name)
-    await page.wait_for_timeout(500)  # Wait for dropdown to appear
-
-    # Select the company from dropdown
-    # Match the exact company name from the dropdown options
-    await page.get_by_role("option", name=company_name.title()).click()
-    await page.wait_for_timeout(500)
+    # Fill job title and company with autocomplete selection
+    await fill_job_title_and_company(page, job_title, company_name)
 
     # Click Continue button to proceed to next step
-    await page.get_by_test_id("continue-button").click()
+    await click_continue(page, "work-experience")
     await page.wait_for_timeout(1500)
 
 
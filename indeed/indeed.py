@@ -3,22 +3,44 @@ Indeed Job Application Workflow
 
 This script orchestrates the full Indeed SmartApply job application flow:
 1. Navigate to job application URL
-2. Upload resume
-3. Fill contact information
-4. Fill job experience
+2. Walk the SmartApply modules in whatever order the posting routes through
+   (resume, contact information, location, job experience, employer
+   questions, ...) until review
 """
 
+import sys
 import asyncio
+import time
+from pathlib import Path
 from playwright.async_api import async_playwright
 
-from upload_resume import upload_resume_to_indeed
-from fill_contact_info import fill_contact_information
-from fill_job_experience import fill_job_experience
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.applied_jobs import FILLED, already_applied, mark_applied
+from common.job_urls import canonical_job_id, indeed_job_url
+from common.failure_capture import capture_failures
+from common.deadline import bounded, enforce_deadline
+from common.lifecycle import browser_page
+from common.motion import suppress_motion
+from common.pacing import paced
+from common.run_trace import traced
+from common.profile import Profile
+from upload_resume import select_and_upload_resume
+from fill_contact_info import fill_name_and_phone, fill_location
+from fill_job_experience import fill_job_title_and_company
+from answer_questions import answer_questions
+from smartapply import read_job_key, run_smartapply
 
 CDP_URL = "http://localhost:9222"
 
 INDEED_JOB_URL = "https://us.smartapply.indeed.com/beta/indeedapply/form/contact-info-module"
 
+# Question text fragment -> answer for the employer's screening questions
+SCREENING_ANSWERS = {
+    "authorized to work": True,
+    "sponsorship": False,
+    "years of": "3",
+}
+
 
 async def indeed_application_workflow(
     job_url: str = INDEED_JOB_URL,
@@ -31,6 +53,9 @@ async def indeed_application_workflow(
     street_address: str = "4 Privet Drive",
     job_title: str = "security officer",
     company_name: str = "warner bros",
+    screening_answers: dict[str, object] | None = None,
+    job_key: str | None = None,
+    profile: Profile | None = None,
 ):
     """
     Run the complete Indeed job application workflow.
@@ -46,49 +71,70 @@ async def indeed_application_workflow(
         street_address: Street address
         job_title: Current/most recent job title
         company_name: Current/most recent company name
+        screening_answers: Question text fragment -> answer for the employer
+            questions (default SCREENING_ANSWERS); the profile answers the rest
+        job_key: Indeed job key of the posting; read from the SmartApply page when
+            neither it nor `job_url` names the job
+        profile: Applicant profile; when given, its Indeed projection replaces
+            the individual applicant arguments above
     """
+    # SmartApply form URLs do not name the job; dedupe on the posting's job key
+    posting_url = indeed_job_url(job_key) if job_key else job_url
+    if canonical_job_id(posting_url) is not None and already_applied(posting_url):
+        return
+
+    if profile is not None:
+        indeed = profile.projection("indeed")
+        resume_path = indeed["resume_path"]
+        first_name, last_name, phone_number = indeed["first_name"], indeed["last_name"], indeed["phone_number"]
+        zip_code, city_state, street_address = indeed["zip_code"], indeed["city_state"], indeed["street_address"]
+        job_title, company_name = indeed["job_title"], indeed["company_name"]
+
     print("=== Starting Indeed Application Workflow ===\n")
 
-    async with async_playwright() as p:
-        browser = await p.chromium.connect_over_cdp(CDP_URL)
-        ctx = browser.contexts[0]
-        page = await ctx.new_page()
+    async with async_playwright() as p, browser_page(p, CDP_URL) as page:
+        page = traced(paced(bounded(page, "indeed"), "indeed"), "indeed", job_url)
+        started = time.perf_counter()
+        await suppress_motion(page)  # Popups open without animating
 
         # Step 1: Navigate to job application URL
         print("Step 1: Opening job application URL...")
         await page.goto(job_url, wait_until="load")
-        await page.wait_for_timeout(1500)
         print(f"Navigated to: {job_url}\n")
 
-        # Step 2: Upload resume
-        print("Step 2: Uploading resume...")
-        await upload_resume_to_indeed(page, resume_path=resume_path, skip_navigation=True)
-        print()
-
-        # Step 3: Fill contact information
-        print("Step 3: Filling contact information...")
-        await fill_contact_information(
-            page,
-            first_name=first_name,
-            last_name=last_name,
-            phone_number=phone_number,
-            zip_code=zip_code,
-            city_state=city_state,
-            street_address=street_address,
-            skip_navigation=True,
-        )
-        print()
-
-        # Step 4: Fill job experience
-        print("Step 4: Filling job experience...")
-        await fill_job_experience(
-            page,
-            job_title=job_title,
-            company_name=company_name,
-            skip_navigation=True,
-        )
-        print()
-
+        if canonical_job_id(posting_url) is None:
+            if job_key := await read_job_key(page):
+                posting_url = indeed_job_url(job_key)
+                if already_applied(posting_url):
+                    return
+            else:
+                print("No job key on the page; this application cannot be deduplicated")
+
+        # Step 2: Walk the SmartApply modules, dispatching a handler per module
+        print("Step 2: Filling SmartApply modules...")
+        handlers = {
+            "resume-selection": lambda page: select_and_upload_resume(page, resume_path),
+            "contact-info": lambda page: fill_name_and_phone(page, first_name, last_name, phone_number),
+            "location": lambda page: fill_location(page, zip_code, city_state, street_address),
+            "work-experience": lambda page: fill_job_title_and_company(page, job_title, company_name),
+            "questions": lambda page: answer_questions(
+                page, SCREENING_ANSWERS if screening_answers is None else screening_answers, profile
+            ),
+        }
+        async with capture_failures(page, "indeed"), enforce_deadline(page):
+            result = await run_smartapply(page, handlers)
+        print(f"Visited: {result.visited}, skipped: {result.skipped}, stopped at: {result.stopped_at}")
+        print(page.pacer.summary(time.perf_counter() - started))
+        page.trace.write(ok=result.completed, error="" if result.completed else f"stopped at {result.stopped_at}")
+
+    if not result.completed:
+        print(f"=== Indeed Application Workflow Stopped ({result.stopped_at}) ===")
+        if result.trace_path:
+            print(f"Trace: {result.trace_path}")
+        return
+
+    if canonical_job_id(posting_url) is not None:
+        mark_applied(posting_url, status=FILLED)  # Stops before submitting
     print("=== Indeed Application Workflow Complete ===")
 
 
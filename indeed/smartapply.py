@@ -0,0 +1,255 @@
+"""
+Indeed SmartApply module state machine.
+
+SmartApply routes each application through a variable set of modules
+(resume selection, privacy settings, contact info, work experience,
+questions, review). Instead of assuming a fixed order, the state machine
+detects the current module from the URL and DOM after every Continue,
+dispatches the matching handler, skips modules whose fields are already
+filled, and records a trace for any module it does not recognise.
+"""
+
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Awaitable, Callable
+
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.run_trace import trace_step
+from common.selector_resolver import SelectorResolver, Strategy
+from common.step_trace import record_unknown_step
+
+Handler = Callable[[Page], Awaitable[None]]
+
+# Build-specific hash seen on the contact info module; it rotates between Indeed releases
+CONTINUE_HASHED_TEST_ID = "81fa2ee401fae0bc3addc8c4c29e6ffa9610a7d7ca0eee6949a40d1689b131fb"
+
+CONTINUE_STRATEGIES: list[Strategy] = [
+    ("hashed-test-id", lambda page: page.get_by_test_id(CONTINUE_HASHED_TEST_ID)),
+    ("test-id", lambda page: page.get_by_test_id("continue-button")),
+    ("role", lambda page: page.get_by_role("button", name="Continue", exact=True)),
+    ("text", lambda page: page.get_by_text("Continue", exact=True)),
+]
+
+_resolver: SelectorResolver | None = None
+
+
+@dataclass(frozen=True)
+class Module:
+    """A SmartApply module and how to recognise it."""
+
+    name: str
+    url_marker: str = ""  # Substring of the form URL path
+    dom_marker: str = ""  # CSS selector only present on this module
+    inputs: tuple[str, ...] = ()  # CSS selectors of inputs that must be non-empty for the module to be complete
+    passive: bool = False  # Nothing to fill, only Continue
+
+
+# DOM markers are checked before URL markers: contact info and location share a URL
+MODULES = (
+    Module(
+        "location",
+        dom_marker="[data-testid='location-fields-postal-code-input']",
+        inputs=(
+            "[data-testid='location-fields-postal-code-input']",
+            "[data-testid='location-fields-locality-input']",
+        ),
+    ),
+    Module(
+        "contact-info",
+        url_marker="contact-info-module",
+        dom_marker="[data-testid='name-fields-first-name-input']",
+        inputs=(
+            "[data-testid='name-fields-first-name-input']",
+            "[data-testid='name-fields-last-name-input']",
+            "input[aria-label='Type phone number']",  # What fill_contact_info targets; it has no stable test id
+        ),
+    ),
+    Module(
+        "work-experience",
+        url_marker="work-experience",
+        dom_marker="[data-testid='job-title-input']",
+        inputs=("[data-testid='job-title-input']", "[data-testid='company-name-input']"),
+    ),
+    Module("privacy-settings", url_marker="privacy-settings", passive=True),
+    Module(
+        "resume-selection",
+        url_marker="resume-selection-module",
+        dom_marker="[data-testid='resume-selection-file-resume-upload-button-header-subtitle']",
+    ),
+    Module("questions", url_marker="questions-module"),
+    Module("review", url_marker="review-module"),
+    Module("post-apply", url_marker="post-apply"),
+)
+
+# The flow stops (without submitting) when one of these is reached
+STOP_MODULES = ("review", "post-apply")
+
+# One evaluate returns everything detection needs: path, present markers and a signature
+DETECT_JS = """(markers) => {
+    const present = markers.filter(selector => document.querySelector(selector));
+    return {path: location.pathname, present, signature: location.pathname + '|' + present.join(',')};
+}"""
+
+TRANSITION_JS = """([markers, before]) => {
+    const present = markers.filter(selector => document.querySelector(selector));
+    return location.pathname + '|' + present.join(',') !== before;
+}"""
+
+INPUTS_FILLED_JS = """(selectors) => selectors.every(selector => {
+    const input = document.querySelector(selector);
+    return input && input.value.trim() !== '';
+})"""
+
+DOM_MARKERS = [module.dom_marker for module in MODULES if module.dom_marker]
+
+# The posting's job key: in the form URL or the posting that opened it, or in the page's initial data
+JOB_KEY_JS = """() => {
+    for (const href of [location.href, document.referrer]) {
+        if (!href) continue;
+        const params = new URL(href).searchParams;
+        const key = params.get('jk') || params.get('vjk') || params.get('jobKey');
+        if (key) return key;
+    }
+    const data = window._initialData || {};
+    const key = data.jobKey || (data.jobInfo || {}).jobKey
+        || document.querySelector('[data-jk]')?.getAttribute('data-jk');
+    return key || null;
+}"""
+
+
+@dataclass
+class SmartApplyResult:
+    """Outcome of a state machine run."""
+
+    visited: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    stopped_at: str | None = None
+    trace_path: str | None = None
+
+    @property
+    def completed(self) -> bool:
+        return self.stopped_at in STOP_MODULES
+
+
+async def detect_module(page: Page) -> tuple[Module | None, dict]:
+    """
+    Detect the current SmartApply module from the DOM and URL in one call.
+
+    Args:
+        page: Playwright page object on a SmartApply form
+
+    Returns:
+        Tuple of (matching module or None, raw detection data)
+    """
+    detected = await page.evaluate(DETECT_JS, DOM_MARKERS)
+    for module in MODULES:
+        if module.dom_marker and module.dom_marker in detected["present"]:
+            return module, detected
+    for module in MODULES:
+        if module.url_marker and module.url_marker in detected["path"]:
+            return module, detected
+    return None, detected
+
+
+async def click_continue(page: Page, module: str = "any", timeout: int = 5000) -> None:
+    """
+    Click whichever Continue button the current module renders.
+
+    The strategy that matched last time on this module is tried first; a miss
+    costs a single timeout, not one per strategy.
+
+    Args:
+        page: Playwright page object
+        module: SmartApply module name, used as the cache key for the winning strategy
+        timeout: Max time in ms to wait for any Continue button
+    """
+    global _resolver
+    if _resolver is None:
+        _resolver = SelectorResolver("indeed")
+    continue_button = await _resolver.resolve(page, module, "continue", CONTINUE_STRATEGIES, timeout=timeout)
+    await continue_button.click(timeout=timeout)
+
+
+async def read_job_key(page: Page) -> str | None:
+    """
+    Read the Indeed job key of the posting a SmartApply form belongs to.
+
+    The form URL (`/form/<module>`) does not name the job, so this is what
+    applications are deduplicated on.
+
+    Returns:
+        The job key (e.g., "8f3a2b1c4d5e6f70"), or None if the page does not expose it
+    """
+    return await page.evaluate(JOB_KEY_JS)
+
+
+async def _is_complete(page: Page, module: Module) -> bool:
+    return bool(module.inputs) and await page.evaluate(INPUTS_FILLED_JS, list(module.inputs))
+
+
+async def run_smartapply(
+    page: Page,
+    handlers: dict[str, Handler],
+    max_steps: int = 15,
+    transition_timeout: int = 10000,
+) -> SmartApplyResult:
+    """
+    Drive a SmartApply application module by module until the review page.
+
+    Each handler fills its module's fields; the state machine clicks Continue
+    and then waits for the URL or module markers to change instead of
+    sleeping for a fixed time.
+
+    Args:
+        page: Playwright page object already on the first SmartApply module
+        handlers: Map of module name (e.g., "contact-info") to an async handler
+        max_steps: Safety cap on the number of modules to walk through
+        transition_timeout: Max time in ms to wait for the next module after Continue
+
+    Returns:
+        SmartApplyResult with the visited/skipped modules and where the run stopped
+    """
+    result = SmartApplyResult()
+
+    for _ in range(max_steps):
+        module, detected = await detect_module(page)
+
+        if module is None:
+            result.trace_path = await record_unknown_step("indeed", page, "unknown module", detected)
+            result.stopped_at = "unknown"
+            return result
+
+        print(f"SmartApply module: {module.name}")
+        if module.name in STOP_MODULES:
+            result.stopped_at = module.name
+            return result
+
+        handler = handlers.get(module.name)
+        with trace_step(page, module.name):
+            if await _is_complete(page, module):
+                print(f"  Already complete, skipping {module.name}")
+                result.skipped.append(module.name)
+            elif handler is not None:
+                await handler(page)
+            elif not module.passive:
+                result.trace_path = await record_unknown_step("indeed", page, f"no handler for {module.name}", detected)
+                result.stopped_at = module.name
+                return result
+
+            result.visited.append(module.name)
+            await click_continue(page, module.name)
+            try:
+                await page.wait_for_function(
+                    TRANSITION_JS, arg=[DOM_MARKERS, detected["signature"]], timeout=transition_timeout
+                )
+            except PlaywrightTimeoutError:
+                # Continue did not advance the form (validation error or missing answer)
+                result.trace_path = await record_unknown_step("indeed", page, f"stuck on {module.name}", detected)
+                result.stopped_at = module.name
+                return result
+
+    result.stopped_at = "max-steps"
+    return result
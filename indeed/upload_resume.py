@@ -4,6 +4,30 @@ import asyncio
 import os
 from playwright.async_api import async_playwright
 
+from smartapply import click_continue
+
+
+async def select_and_upload_resume(page, resume_path: str = "resume.pdf"):
+    """
+    Select the "Upload a resume" option and upload the resume file.
+
+    Args:
+        page: Playwright page object (already on the resume selection module)
+        resume_path: Path to the resume file to upload (PDF, DOCX, RTF, or TXT)
+    """
+    # Click on "Upload a resume" option to select it
+    # This is the second radio button option in the resume selection module
+    await page.get_by_test_id("resume-selection-file-resume-upload-button-header-subtitle").click()
+    await page.wait_for_timeout(500)
+
+    # Click on the file input to open the file picker
+    file_input = page.get_by_test_id("resume-selection-file-resume-upload-button-file-input")
+
+    # Set the input files with the resume path
+    # Using absolute path to ensure the file is found
+    await file_input.set_input_files(os.path.abspath(resume_path))
+    await page.wait_for_timeout(1000)
+
 
 async def upload_resume_to_indeed(page, resume_path: str = "resume.pdf", skip_navigation: bool = False):
     """
@@ -23,20 +47,10 @@ async def upload_resume_to_indeed(page, resume_path: str = "resume.pdf", skip_na
             "https://us.smartapply.indeed.com/beta/indeedapply/form/resume-selection-module/resume-selection",
             wait_until="load"
         )
-    await page.wait_for_timeout(1500)
-
-    # Click on "Upload a resume" option to select it
-    # This is the second radio button option in the resume selection module
-    await page.get_by_test_id("resume-selection-file-resume-upload-button-header-subtitle").click()
-    await page.wait_for_timeout(500)
-
-    # Click on the file input to open the file picker
-    file_input = page.get_by_test_id("resume-selection-file-resume-upload-button-file-input")
+        await page.wait_for_timeout(1500)
 
-    # Set the input files with the resume path
-    # Using absolute path to ensure the file is found
-    await file_input.set_input_files(os.path.abspath(resume_path))
-    await page.wait_for_timeout(1000)
+    # Select the upload option and set the resume file
+    await select_and_upload_resume(page, resume_path)
 
     # Wait for the upload to complete
     # The upload state indicator changes from "Uploading..." to completed state
@@ -47,7 +61,7 @@ async def upload_resume_to_indeed(page, resume_path: str = "resume.pdf", skip_na
     await page.wait_for_timeout(500)
 
     # Click the Continue button to proceed to the next step
-    await page.get_by_text("Continue").click()
+    await click_continue(page, "resume-selection")
     await page.wait_for_timeout(1500)
 
 
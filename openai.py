@@ -7,11 +7,26 @@ on the OpenAI jobs portal (Ashby ATS).
 
 import asyncio
 import os
+import time
 from datetime import datetime
 from playwright.async_api import async_playwright, Page
 
+from common.applied_jobs import FILLED, already_applied, mark_applied
+from common.autocomplete import select_autocomplete
+from common.deadline import bounded, enforce_deadline
+from common.failure_capture import capture_failures
+from common.job_urls import same_posting
+from common.lifecycle import browser_page
+from common.motion import suppress_motion, wait_until_settled
+from common.pacing import paced
+from common.profile import env_profile
+from common.run_trace import traced
+
+OPENAI_JOB_URL = "https://jobs.ashbyhq.com/openai/43174eb6-0ffe-4744-9323-c7969e7ea2e1/application"
+
 
 async def submit_openai_job_application(
+    page: Page,
     name: str = "Nico",
     email: str = "nico@gmail.com",
     github_url: str = "github.com/nico",
@@ -27,6 +42,7 @@ async def submit_openai_job_application(
     Automate OpenAI job application submission.
 
     Args:
+        page: Playwright page object
         name: Full name of the applicant
         email: Email address of the applicant
         github_url: GitHub profile URL
@@ -38,130 +54,114 @@ async def submit_openai_job_application(
         require_sponsorship: Whether visa sponsorship is required
         can_work_from_sf_office: Whether applicant can work from SF office 3 days/week
     """
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=False)
-        context = await browser.new_context()
-        page = await context.new_page()
-
-        try:
-            # Navigate to the job application URL
-            url = "https://jobs.ashbyhq.com/openai/43174eb6-0ffe-4744-9323-c7969e7ea2e1/application"
-            await page.goto(url, wait_until="load")
-            await page.wait_for_timeout(1500)
-
-            # Fill Name field
-            name_input = page.locator("//input[@id='_systemfield_name']")
-            await name_input.click()
-            await name_input.fill(name)
-            await page.wait_for_timeout(300)
-
-            # Fill Email field
-            email_input = page.locator("//input[@id='_systemfield_email']")
-            await email_input.click()
-            await email_input.fill(email)
-            await page.wait_for_timeout(300)
-
-            # Fill GitHub Link field (ID starts with digit, use attribute selector)
-            github_input = page.locator('input[id="44d2e6b6-9bdf-44ab-b068-3d70459b2b61"]')
-            await github_input.click()
-            await github_input.fill(github_url)
-            await page.wait_for_timeout(300)
-
-            # Fill LinkedIn Profile field (ID starts with digit, use attribute selector)
-            linkedin_input = page.locator('input[id="dfc4cc4e-8ea1-41af-8fad-2c436934bdd9"]')
-            await linkedin_input.click()
-            await linkedin_input.fill(linkedin_url)
-            await page.wait_for_timeout(300)
-
-            # Upload Resume
-            abs_resume_path = os.path.abspath(resume_path)
-            file_input = page.locator('input[id="_systemfield_resume"]')
-            await file_input.set_input_files(abs_resume_path)
-            await page.wait_for_timeout(1000)
-
-            # Scroll down to find phone number field
-            await page.wait_for_timeout(500)
-
-            # Fill Phone Number field (ID starts with digit, use attribute selector)
-            phone_input = page.locator('input[id="d5fd375a-e8e3-420a-b915-d70085f610b2"]')
-            await phone_input.click()
-            await phone_input.fill(phone_number)
-            await page.wait_for_timeout(300)
-
-            # Fill Location field using combobox with dropdown interaction
-            location_input = page.locator("//div[@id='form']/div[3]/div/div[7]/div/input")
-            await location_input.click()
-            await location_input.fill("san mateo")
-            await page.wait_for_timeout(500)
-
-            # Click the location option from dropdown
-            # Using aria selector to find the option with "San Mateo, California, United States"
-            location_option = page.locator("text=San Mateo, California, United States").first
-            await location_option.click()
-            await page.wait_for_timeout(500)
-
-            # Fill Start Date using date picker
-            # Click on date input to open picker
-            date_input = page.locator(
-                "//div[@id='form']/div[3]/div/div[8]/div[1]/div/input"
-            )
-            await date_input.click()
-            await page.wait_for_timeout(500)
-
-            # Click next month button to go to December 2025
-            next_month_btn = page.locator(
-                "//div[@id='form']/div[3]/div/div[8]/div[2]/div/div/div[2]/div[1]/div[1]/div/button[2]"
-            )
-            await next_month_btn.click()
-            await page.wait_for_timeout(300)
-
-            # Click on day 31 in December
-            # day_31 = page.locator("text=31").filter(has_role="option").last
-            day_31 = page.get_by_role("option", name="31").last
-            await day_31.click()
-            await page.wait_for_timeout(500)
-
-            # Answer visa sponsorship question based on require_sponsorship parameter
-            if require_sponsorship:
-                # Click "Yes" button (first button)
-                sponsorship_btn = page.locator(
-                    "//div[@id='form']/div[3]/div/div[9]/div[2]/button[1]"
-                )
-            else:
-                # Click "No" button (second button)
-                sponsorship_btn = page.locator(
-                    "//div[@id='form']/div[3]/div/div[9]/div[2]/button[2]"
-                )
-            await sponsorship_btn.click()
-            await page.wait_for_timeout(300)
-
-            # Answer SF office attendance question based on can_work_from_sf_office parameter
-            if can_work_from_sf_office:
-                # Click "Yes" button (first button)
-                sf_office_btn = page.locator(
-                    "//div[@id='form']/div[3]/div/div[10]/div/button[1]"
-                )
-            else:
-                # Click "No" button (second button)
-                sf_office_btn = page.locator(
-                    "//div[@id='form']/div[3]/div/div[10]/div/button[2]"
-                )
-            await sf_office_btn.click()
-            await page.wait_for_timeout(500)
-
-            print("Application form completed successfully!")
-
-        except Exception as e:
-            print(f"Error during application submission: {e}")
-            raise
-        finally:
-            await context.close()
-            await browser.close()
+    # Navigate to the job application URL, unless a runner already opened it
+    if not same_posting(page.url, OPENAI_JOB_URL):
+        await page.goto(OPENAI_JOB_URL, wait_until="load")
+        await page.wait_for_timeout(1500)
+
+    # Fill Name field
+    name_input = page.locator("//input[@id='_systemfield_name']")
+    await name_input.click()
+    await name_input.fill(name)
+    await page.wait_for_timeout(300)
+
+    # Fill Email field
+    email_input = page.locator("//input[@id='_systemfield_email']")
+    await email_input.click()
+    await email_input.fill(email)
+    await page.wait_for_timeout(300)
+
+    # Fill GitHub Link field (ID starts with digit, use attribute selector)
+    github_input = page.locator('input[id="44d2e6b6-9bdf-44ab-b068-3d70459b2b61"]')
+    await github_input.click()
+    await github_input.fill(github_url)
+    await page.wait_for_timeout(300)
+
+    # Fill LinkedIn Profile field (ID starts with digit, use attribute selector)
+    linkedin_input = page.locator('input[id="dfc4cc4e-8ea1-41af-8fad-2c436934bdd9"]')
+    await linkedin_input.click()
+    await linkedin_input.fill(linkedin_url)
+    await page.wait_for_timeout(300)
+
+    # Upload Resume
+    abs_resume_path = os.path.abspath(resume_path)
+    file_input = page.locator('input[id="_systemfield_resume"]')
+    await file_input.set_input_files(abs_resume_path)
+    await page.wait_for_timeout(1000)
+
+    # Scroll down to find phone number field
+    await page.wait_for_timeout(500)
+
+    # Fill Phone Number field (ID starts with digit, use attribute selector)
+    phone_input = page.locator('input[id="d5fd375a-e8e3-420a-b915-d70085f610b2"]')
+    await phone_input.click()
+    await phone_input.fill(phone_number)
+    await page.wait_for_timeout(300)
+
+    # Fill Location field using combobox with dropdown interaction
+    # Types the learned shortest prefix and clicks the exact suggestion label
+    location_input = page.locator("//div[@id='form']/div[3]/div/div[7]/div/input")
+    await select_autocomplete(page, "ashby", "location", location_input, location)
+
+    # Fill Start Date using date picker
+    # Click on date input to open picker
+    date_input = page.locator(
+        "//div[@id='form']/div[3]/div/div[8]/div[1]/div/input"
+    )
+    await date_input.click()
+    await wait_until_settled(page)
+
+    # Click next month button to go to December 2025
+    next_month_btn = page.locator(
+        "//div[@id='form']/div[3]/div/div[8]/div[2]/div/div/div[2]/div[1]/div[1]/div/button[2]"
+    )
+    await next_month_btn.click()
+    await page.wait_for_timeout(300)
+
+    # Click on day 31 in December
+    # day_31 = page.locator("text=31").filter(has_role="option").last
+    day_31 = page.get_by_role("option", name="31").last
+    await day_31.click()
+    await page.wait_for_timeout(500)
+
+    # Answer visa sponsorship question based on require_sponsorship parameter
+    if require_sponsorship:
+        # Click "Yes" button (first button)
+        sponsorship_btn = page.locator(
+            "//div[@id='form']/div[3]/div/div[9]/div[2]/button[1]"
+        )
+    else:
+        # Click "No" button (second button)
+        sponsorship_btn = page.locator(
+            "//div[@id='form']/div[3]/div/div[9]/div[2]/button[2]"
+        )
+    await sponsorship_btn.click()
+    await page.wait_for_timeout(300)
+
+    # Answer SF office attendance question based on can_work_from_sf_office parameter
+    if can_work_from_sf_office:
+        # Click "Yes" button (first button)
+        sf_office_btn = page.locator(
+            "//div[@id='form']/div[3]/div/div[10]/div/button[1]"
+        )
+    else:
+        # Click "No" button (second button)
+        sf_office_btn = page.locator(
+            "//div[@id='form']/div[3]/div/div[10]/div/button[2]"
+        )
+    await sf_office_btn.click()
+    await page.wait_for_timeout(500)
+
+    print("Application form completed successfully!")
 
 
 async def main():
     """Run the application automation with example parameters."""
+    if already_applied(OPENAI_JOB_URL):
+        return
+
     # await submit_openai_job_application(
+    #     page,
     #     name="Nico",
     #     email="nico@gmail.com",
     #     github_url="github.com/nico",
@@ -174,18 +174,32 @@ async def main():
     #     can_work_from_sf_office=True,
     # )
     
-    await submit_openai_job_application(
+    example = dict(
         name="Kamisato Ayaka",
         email="ayaka@gmail.com",
         github_url="github.com/ayaka",
         linkedin_url="linkedin.com/in/ayaka",
         resume_path="sample-resume.pdf",
         phone_number="1-222-333-4444",
-        location="Inazuma, Teyvat",
+        location="San Francisco, California, United States",  # Must match a real suggestion
         start_date="12/31/2025",
         require_sponsorship=True,
         can_work_from_sf_office=False,
     )
+    # A profile named by JOB_APPLY_PROFILE replaces the example answers it covers
+    profile = env_profile()
+    if profile is not None:
+        example.update(profile.arguments(submit_openai_job_application, "ashby"))
+
+    async with async_playwright() as p, browser_page(p, headless=False) as page:
+        page = traced(paced(bounded(page, "ashby"), "ashby"), "ashby", OPENAI_JOB_URL)
+        started = time.perf_counter()
+        await suppress_motion(page)  # The date picker opens without animating
+        async with capture_failures(page, "openai"), enforce_deadline(page):
+            await submit_openai_job_application(page, **example)
+        print(page.pacer.summary(time.perf_counter() - started))
+        page.trace.write()
+    mark_applied(OPENAI_JOB_URL, status=FILLED)  # Stops before submitting
 
 
 if __name__ == "__main__":
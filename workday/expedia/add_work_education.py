@@ -5,7 +5,12 @@ Fills out job application with work experience and education information.
 
 import os
 import re
+import sys
 from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+from common.motion import wait_until_settled
 
 
 async def fill_job_application(
@@ -26,6 +31,7 @@ async def fill_job_application(
             - start_year (int): Start year
             - end_month (int): End month (1-12)
             - end_year (int): End year
+            - currently_work_here (bool, optional): Current job; no end date is entered
             - role_description (str, optional): Description of role
         educations: List of education dictionaries with keys:
             - school_name (str): School or university name
@@ -125,14 +131,21 @@ async def fill_job_application(
         await page.keyboard.type(str(work_exp["start_year"]))   # Type year
         await page.wait_for_timeout(300)
 
-        # Fill in End Date - click the display element first to reveal input
-        end_month_display = page.locator("div[id$='--endDate-dateSectionMonth-display']").last
-        await end_month_display.click()
-        await page.keyboard.type(str(work_exp["end_month"]))  # Type month, focus auto-moves to year
-        await page.keyboard.type(str(work_exp["end_year"]))   # Type year
-        await page.wait_for_timeout(300)
+        if work_exp.get("currently_work_here"):
+            # A current job has no end date; Workday hides the End Date field once this is ticked
+            await page.locator("[id$='--currentlyWorkHere']").last.check()
+            await page.wait_for_timeout(300)
+            end = "present"
+        else:
+            # Fill in End Date - click the display element first to reveal input
+            end_month_display = page.locator("div[id$='--endDate-dateSectionMonth-display']").last
+            await end_month_display.click()
+            await page.keyboard.type(str(work_exp["end_month"]))  # Type month, focus auto-moves to year
+            await page.keyboard.type(str(work_exp["end_year"]))   # Type year
+            await page.wait_for_timeout(300)
+            end = f"{work_exp['end_month']}/{work_exp['end_year']}"
 
-        print(f"✓ Work experience dates filled: {work_exp['start_month']}/{work_exp['start_year']} to {work_exp['end_month']}/{work_exp['end_year']}")
+        print(f"✓ Work experience dates filled: {work_exp['start_month']}/{work_exp['start_year']} to {end}")
 
         # Fill Role Description (if provided)
         if work_exp.get("role_description"):
@@ -179,7 +192,7 @@ async def fill_job_application(
         # Select Degree
         degree_button = page.get_by_role("button", name=re.compile(r"Degree.*Required"))
         await degree_button.click()
-        await page.wait_for_timeout(500)
+        await wait_until_settled(page)
 
         # Click the degree option from dropdown
         await page.get_by_text(education["degree"]).click()
@@ -11,9 +11,20 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
 import asyncio
+import time
 from playwright.async_api import async_playwright
 from workday.expedia.personal_info import fill_job_application_info
 from workday.expedia.add_work_education import fill_job_application
+from workday.steps import run_workday
+from common.applied_jobs import FILLED, already_applied, mark_applied
+from common.option_sets import validate_answers
+from common.failure_capture import capture_failures
+from common.deadline import bounded, enforce_deadline
+from common.lifecycle import browser_page
+from common.motion import suppress_motion
+from common.pacing import paced
+from common.run_trace import traced
+from common.profile import Profile
 
 CDP_URL = "http://localhost:9222"
 
@@ -42,6 +53,7 @@ async def expedia_application_workflow(
     state: str = "",
     postal_code: str = "",
     phone_extension: str = "",
+    profile: Profile | None = None,
 ) -> None:
     """
     Run the complete Expedia job application workflow.
@@ -61,14 +73,41 @@ async def expedia_application_workflow(
         state: State/Province of residence (optional)
         postal_code: Postal code (optional)
         phone_extension: Phone extension number (optional)
+        profile: Applicant profile; when given, its Workday projection replaces
+            the individual applicant arguments above
     """
+    if already_applied(job_url):
+        return
+
+    if profile is not None:
+        personal_info = profile.arguments(fill_job_application_info, "workday")
+    else:
+        personal_info = dict(
+            how_did_you_hear_about_us=how_did_you_hear_about_us,
+            country=country,
+            first_name=first_name,
+            last_name=last_name,
+            phone_device_type=phone_device_type,
+            country_phone_code=country_phone_code,
+            phone_number=phone_number,
+            address_line_1=address_line_1,
+            city=city,
+            state=state,
+            postal_code=postal_code,
+            phone_extension=phone_extension,
+        )
+
+    # Check dropdown answers against known option sets before opening a browser;
+    # the step router saves the page, so the fill function must not
+    personal_info = validate_answers(job_url, fill_job_application_info, **personal_info, save=False)
+
     print("=== Starting Expedia Application Workflow ===\n")
 
     # Connect to browser - all steps share the same page
-    async with async_playwright() as p:
-        browser = await p.chromium.connect_over_cdp(CDP_URL)
-        ctx = browser.contexts[0]
-        page = await ctx.new_page()
+    async with async_playwright() as p, browser_page(p, CDP_URL) as page:
+        page = traced(paced(bounded(page, "workday"), "workday"), "workday", job_url)
+        started = time.perf_counter()
+        await suppress_motion(page)  # Popups open without animating
 
         # Step 1: Open job application URL
         print("Step 1: Opening job application URL...")
@@ -83,30 +122,30 @@ async def expedia_application_workflow(
         # )
         # print("Resume upload complete.\n")
 
-        # Step 2: Fill personal information (includes how you heard, phone, and saves)
-        print("Step 2: Filling personal information...")
-        await fill_job_application_info(
-            page=page,
-            how_did_you_hear_about_us=how_did_you_hear_about_us,
-            country=country,
-            first_name=first_name,
-            last_name=last_name,
-            phone_device_type=phone_device_type,
-            country_phone_code=country_phone_code,
-            phone_number=phone_number,
-            address_line_1=address_line_1,
-            city=city,
-            state=state,
-            postal_code=postal_code,
-            phone_extension=phone_extension,
-        )
-        print("Personal info complete.\n")
-
-        # Step 3: Fill work experience and education
-        print("Step 3: Filling work experience and education...")
-        await fill_job_application(page=page)
-        print("Work experience and education complete.\n")
-
+        history = profile.arguments(fill_job_application, "workday") if profile is not None else {}
+
+        # My Information covers how you heard, name, address and phone
+        async def my_information(page):
+            print("Filling personal information...")
+            await fill_job_application_info(page=page, **personal_info)
+            print("Personal info complete.\n")
+
+        async def my_experience(page):
+            print("Filling work experience and education...")
+            await fill_job_application(page=page, **history)
+            print("Work experience and education complete.\n")
+
+        # Route on the detected step (the router saves each one); steps without a
+        # handler are traced and stop the run
+        async with capture_failures(page, "expedia"), enforce_deadline(page):
+            result = await run_workday(page, {"my-information": my_information, "my-experience": my_experience})
+        print(f"Visited {result.visited}, stopped at {result.stopped_at}")
+        print(page.pacer.summary(time.perf_counter() - started))
+        page.trace.write(ok=result.completed, error="" if result.completed else f"stopped at {result.stopped_at}")
+        if not result.completed:
+            return
+
+    mark_applied(job_url, status=FILLED)  # Stops before submitting
     print("=== Workflow Complete ===")
 
 
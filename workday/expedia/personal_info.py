@@ -13,6 +13,9 @@ import asyncio
 import os
 from playwright.async_api import async_playwright
 from workday.expedia.utils import clear_chip_field_by_input_id
+from common.motion import wait_until_settled
+from common.refill import fields_to_fill
+from common.workday import save_and_continue
 
 
 async def fill_job_application_info(
@@ -29,6 +32,8 @@ async def fill_job_application_info(
     state: str = "",
     postal_code: str = "",
     phone_extension: str = "",
+    diff: bool = True,
+    save: bool = True,
 ) -> None:
     """
     Fill out the "My Information" step of the Expedia job application form.
@@ -55,113 +60,143 @@ async def fill_job_application_info(
         state: State/Province of residence (optional)
         postal_code: Postal code (optional)
         phone_extension: Phone extension number (optional)
+        diff: Read all fields first and only write the ones that differ (prefilled
+            by resume autofill or an earlier attempt); False rewrites every field
+        save: Click Save and Continue at the end; False when a step router saves
     """
 
     # Wait for page to load
     await page.wait_for_timeout(1000)
 
+    fields = {
+        "how_did_you_hear_about_us": ("#source--source", how_did_you_hear_about_us),
+        "country": ("#country--country", country),
+        "first_name": ("#name--legalName--firstName", first_name),
+        "last_name": ("#name--legalName--lastName", last_name),
+        "address_line_1": ('input[placeholder="Address Line 1"]', address_line_1),
+        "city": ('input[placeholder="City"]', city),
+        "state": ('button[id*="state"]', state),
+        "postal_code": ('input[placeholder="Postal Code"]', postal_code),
+        "phone_device_type": ("#phoneNumber--phoneType", phone_device_type),
+        "country_phone_code": ("#phoneNumber--countryPhoneCode", country_phone_code),
+        "phone_number": ("#phoneNumber--phoneNumber", phone_number),
+        "phone_extension": ("#phoneNumber--phoneExtension", phone_extension),
+    }
+    if diff:
+        todo = await fields_to_fill(page, fields)
+    else:
+        todo = {name for name, (_, value) in fields.items() if value}
+
     # Step 1: Fill "How Did You Hear About Us?" dropdown
-    # Open the dropdown
-    await page.click("#source--source")
-    await page.wait_for_timeout(500)
+    if "how_did_you_hear_about_us" in todo:
+        # Open the dropdown
+        await page.click("#source--source")
+        await wait_until_settled(page)
 
-    # Click the option matching the selected value (use role="option" to avoid matching the button)
-    await page.get_by_role("option", name=how_did_you_hear_about_us, exact=True).click()
-    await page.wait_for_timeout(500)
+        # Click the option matching the selected value (use role="option" to avoid matching the button)
+        await page.get_by_role("option", name=how_did_you_hear_about_us, exact=True).click()
+        await page.wait_for_timeout(500)
 
     # Step 2: Fill "Country" dropdown
-    # Open the dropdown
-    await page.click("#country--country")
-    await page.wait_for_timeout(500)
+    if "country" in todo:
+        # Open the dropdown
+        await page.click("#country--country")
+        await wait_until_settled(page)
 
-    # Click the option matching the selected country (use role="option" to avoid matching the button)
-    await page.get_by_role("option", name=country, exact=True).click()
-    await page.wait_for_timeout(500)
+        # Click the option matching the selected country (use role="option" to avoid matching the button)
+        await page.get_by_role("option", name=country, exact=True).click()
+        await page.wait_for_timeout(500)
 
     # Step 3: Fill "First Name" text input
-    first_name_input = page.locator("#name--legalName--firstName")
-    await first_name_input.click()
-    # Select all existing text and replace
-    await page.keyboard.press("Control+A")
-    await first_name_input.fill(first_name)
-    await page.wait_for_timeout(300)
+    if "first_name" in todo:
+        first_name_input = page.locator("#name--legalName--firstName")
+        await first_name_input.click()
+        # Select all existing text and replace
+        await page.keyboard.press("Control+A")
+        await first_name_input.fill(first_name)
+        await page.wait_for_timeout(300)
 
     # Step 4: Fill "Last Name" text input
-    last_name_input = page.locator("#name--legalName--lastName")
-    await last_name_input.click()
-    # Select all existing text and replace
-    await page.keyboard.press("Control+A")
-    await last_name_input.fill(last_name)
-    await page.wait_for_timeout(300)
+    if "last_name" in todo:
+        last_name_input = page.locator("#name--legalName--lastName")
+        await last_name_input.click()
+        # Select all existing text and replace
+        await page.keyboard.press("Control+A")
+        await last_name_input.fill(last_name)
+        await page.wait_for_timeout(300)
 
     # Step 5: Fill "Address Line 1" if provided
-    if address_line_1:
+    if "address_line_1" in todo:
         await page.fill('input[placeholder="Address Line 1"]', address_line_1)
         await page.wait_for_timeout(300)
 
     # Step 6: Fill "City" if provided
-    if city:
+    if "city" in todo:
         await page.fill('input[placeholder="City"]', city)
         await page.wait_for_timeout(300)
 
     # Step 7: Fill "State" dropdown if provided
-    if state:
+    if "state" in todo:
         await page.click('button[id*="state"][id*="state"]')
-        await page.wait_for_timeout(500)
+        await wait_until_settled(page)
         await page.get_by_role("option", name=state, exact=True).click()
         await page.wait_for_timeout(500)
 
     # Step 8: Fill "Postal Code" if provided
-    if postal_code:
+    if "postal_code" in todo:
         await page.fill('input[placeholder="Postal Code"]', postal_code)
         await page.wait_for_timeout(300)
 
     # Step 9: Fill "Phone Device Type" dropdown
-    await page.click("#phoneNumber--phoneType")
-    await page.wait_for_timeout(500)
+    if "phone_device_type" in todo:
+        await page.click("#phoneNumber--phoneType")
+        await wait_until_settled(page)
 
-    # Click the phone type option (use role="option" to avoid matching the button)
-    await page.get_by_role("option", name=phone_device_type, exact=True).click()
-    await page.wait_for_timeout(500)
+        # Click the phone type option (use role="option" to avoid matching the button)
+        await page.get_by_role("option", name=phone_device_type, exact=True).click()
+        await page.wait_for_timeout(500)
 
 
-    await clear_chip_field_by_input_id(page, "phoneNumber--countryPhoneCode")
-    await page.wait_for_timeout(300)
     # Step 10: Handle "Country Phone Code" searchable dropdown
-    # Click on the country code input/dropdown (use input xpath for reliability)
-    country_code_input = page.locator("#phoneNumber--countryPhoneCode")
-    await country_code_input.wait_for(state="visible", timeout=5000)
-    await country_code_input.click()
-    await page.wait_for_timeout(500)
-
-    # Type to search for the country code
-    search_term = country_phone_code.split("(")[0].strip().lower()
-    await country_code_input.fill(search_term)
-    await page.keyboard.press("Enter")
-    await page.wait_for_timeout(500)
-
-    # # Click the matching option (use filter with has_text for flexibility)
-    # dropdown_option = page.locator("div[role='option']").filter(has_text=country_phone_code).first
-    # await dropdown_option.click()
-    # await page.wait_for_timeout(500)
+    if "country_phone_code" in todo:
+        await clear_chip_field_by_input_id(page, "phoneNumber--countryPhoneCode")
+        await page.wait_for_timeout(300)
+        # Click on the country code input/dropdown (use input xpath for reliability)
+        country_code_input = page.locator("#phoneNumber--countryPhoneCode")
+        await country_code_input.wait_for(state="visible", timeout=5000)
+        await country_code_input.click()
+        await wait_until_settled(page)
+
+        # Type to search for the country code
+        search_term = country_phone_code.split("(")[0].strip().lower()
+        await country_code_input.fill(search_term)
+        await page.keyboard.press("Enter")
+        await page.wait_for_timeout(500)
+
+        # # Click the matching option (use filter with has_text for flexibility)
+        # dropdown_option = page.locator("div[role='option']").filter(has_text=country_phone_code).first
+        # await dropdown_option.click()
+        # await page.wait_for_timeout(500)
 
     # Step 11: Fill "Phone Number" text input
-    phone_input = page.locator("#phoneNumber--phoneNumber")
-    await phone_input.click()
-    # Select all existing text and replace
-    await page.keyboard.press("Control+A")
-    await phone_input.fill(phone_number)
-    await page.wait_for_timeout(300)
+    if "phone_number" in todo:
+        phone_input = page.locator("#phoneNumber--phoneNumber")
+        await phone_input.click()
+        # Select all existing text and replace
+        await page.keyboard.press("Control+A")
+        await phone_input.fill(phone_number)
+        await page.wait_for_timeout(300)
 
     # Step 12: Fill "Phone Extension" if provided
-    if phone_extension:
+    if "phone_extension" in todo:
         phone_extension_input = page.locator("#phoneNumber--phoneExtension")
         await phone_extension_input.fill(phone_extension)
         await page.wait_for_timeout(300)
 
-    # Step 13: Submit the form by clicking "Save and Continue" button
-    await page.click('button:has-text("Save and Continue")')
-    await page.wait_for_timeout(1500)
+    # Step 13: Submit the form by clicking "Save and Continue"; waits for the save
+    # response and the next step, raising WorkdaySaveError on validation errors
+    if save:
+        await save_and_continue(page)
 
 
 if __name__ == "__main__":
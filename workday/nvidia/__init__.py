@@ -15,11 +15,12 @@ from .add_education import (
 )
 from .add_url import add_urls
 from .add_skills import add_skills
-from .nvidia import nvidia_application_workflow
+from .nvidia import apply_nvidia, nvidia_application_workflow
 from .personal_info import fill_personal_info
 from .how_you_heard import how_you_heard_about_us
 
 __all__ = [
+    "apply_nvidia",
     "nvidia_application_workflow",
     "open_job_application_url",
     "upload_resume",
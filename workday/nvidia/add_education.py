@@ -4,7 +4,13 @@ Playwright automation script for filling job application with education details.
 This script automates the process of adding education information to a Workday job application form.
 """
 
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
 from playwright.async_api import Page
+from common.motion import wait_until_settled
+from common.option_sets import record_open_options
 
 
 async def click_add_education(page: Page) -> None:
@@ -95,7 +101,8 @@ async def fill_education(
     # Click on Degree dropdown button and select
     degree_button = get_field(page.get_by_role("button", name="Degree Select One Required"))
     await degree_button.click()
-    await page.wait_for_timeout(500)
+    await wait_until_settled(page)
+    await record_open_options(page, "degree")
     await page.get_by_role("option", name=degree).click()
     await page.wait_for_timeout(500)
 
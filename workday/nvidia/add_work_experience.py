@@ -58,6 +58,7 @@ async def fill_work_experience(
     end_month: int = 12,
     end_year: int = 2023,
     role_description: str = "Developed and maintained software applications.",
+    currently_work_here: bool = False,
 ) -> None:
     """
     Fill work experience entry by index (0-based).
@@ -73,6 +74,7 @@ async def fill_work_experience(
         end_month: The ending month (1-12)
         end_year: The ending year
         role_description: The role description/summary
+        currently_work_here: Tick "I currently work here" instead of entering an end date
     """
     # Helper to get element by index (-1 means last)
     def get_field(selector: str):
@@ -98,12 +100,17 @@ async def fill_work_experience(
     await page.keyboard.type(str(start_year))   # Type year
     await page.wait_for_timeout(300)
 
-    # Fill in End Date - click the display element first to reveal input
-    end_month_display = get_field("div[id^='workExperience-'][id$='--endDate-dateSectionMonth-display']")
-    await end_month_display.click()
-    await page.keyboard.type(str(end_month))  # Type month, focus auto-moves to year
-    await page.keyboard.type(str(end_year))   # Type year
-    await page.wait_for_timeout(300)
+    if currently_work_here:
+        # A current job has no end date; Workday hides the End Date field once this is ticked
+        await get_field('[id$="--currentlyWorkHere"]').check()
+        await page.wait_for_timeout(300)
+    else:
+        # Fill in End Date - click the display element first to reveal input
+        end_month_display = get_field("div[id^='workExperience-'][id$='--endDate-dateSectionMonth-display']")
+        await end_month_display.click()
+        await page.keyboard.type(str(end_month))  # Type month, focus auto-moves to year
+        await page.keyboard.type(str(end_year))   # Type year
+        await page.wait_for_timeout(300)
 
     # Scroll down to see Role Description field
     await page.evaluate("window.scrollBy(0, 300)")
@@ -10,6 +10,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
 from playwright.async_api import Page
+from common.motion import wait_until_settled
+from common.option_sets import record_open_options
 from workday.nvidia.utils import clear_chip_field_by_input_id
 
 
@@ -25,7 +27,7 @@ async def how_you_heard_about_us(
     Args:
         page: Playwright Page object from the workflow
         how_heard: Response for "How did you hear about us?" field
-                   Options: "Event/Conference", "Associations", "Job Board", etc.
+                   e.g. "Event/Conference", "Associations", "Job Board"
         event_conference: The event/conference name to select
                          Options: "GTC 2025", "SIGGRAPH", "NeurIPS 2025", etc.
         previous_employee: Whether previously worked at NVIDIA (True/False)
@@ -54,7 +56,8 @@ async def how_you_heard_about_us(
     await source_input.scroll_into_view_if_needed()
     await page.wait_for_timeout(300)
     await source_input.click()
-    await page.wait_for_timeout(300)
+    await wait_until_settled(page)
+    await record_open_options(page, "how_heard")  # Learn the full list once per tenant
     await source_input.fill(how_heard)
     await page.wait_for_timeout(500)
 
@@ -11,11 +11,13 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
 import asyncio
-from playwright.async_api import async_playwright
+import time
+import json
+import os
+from playwright.async_api import Page, async_playwright
 from workday.nvidia import (
     upload_resume,
     fill_phone_number,
-    save_and_continue,
     click_add_work_experience,
     click_add_another_work_experience,
     fill_work_experience,
@@ -26,153 +28,247 @@ from workday.nvidia import (
 )
 from workday.nvidia.personal_info import fill_personal_info
 from workday.nvidia.how_you_heard import how_you_heard_about_us
+from workday.steps import WorkdayResult, run_workday
+from common.applied_jobs import FILLED, already_applied, mark_applied
+from common.option_sets import validate_answers
+from common.failure_capture import capture_failures
+from common.deadline import bounded, enforce_deadline
+from common.job_urls import same_posting
+from common.lifecycle import browser_page
+from common.motion import suppress_motion
+from common.pacing import paced
+from common.run_trace import traced
+from common.profile import SAMPLE_PROFILE, Profile, kwargs_for
+from common.resume_parser import parse_resume, predict_autofill, profile_from_resume
+
+DEFAULT_WORK_EXPERIENCES = [
+    {
+        "job_title": "Software Engineer",
+        "company_name": "NVIDIA",
+        "start_month": 1,
+        "start_year": 2024,
+        "end_month": 1,
+        "end_year": 2025,
+    },
+    {
+        "job_title": "Intern",
+        "company_name": "Meta",
+        "start_month": 1,
+        "start_year": 2020,
+        "end_month": 1,
+        "end_year": 2023,
+    },
+]
+
+DEFAULT_EDUCATIONS = [
+    {
+        "school_name": "Stanford University",
+        "degree": "PhD",
+        "field_of_study": "Computer Science",
+        "gpa": "3.8",
+        "start_year": 2020,
+        "end_year": 2024,
+    },
+    {
+        "school_name": "MIT",
+        "degree": "PhD",
+        "field_of_study": "Computer Science",
+        "gpa": "3.8",
+        "start_year": 2000,
+        "end_year": 2005,
+    },
+]
 
 CDP_URL = "http://localhost:9222"
+NVIDIA_JOB_URL = "https://nvidia.wd5.myworkdayjobs.com/en-US/NVIDIAExternalCareerSite/job/US,-CA,-Santa-Clara/Senior-ASIC-Test-Timing-Engineer_JR2005476?source=Eightfold"
 
 
-async def nvidia_application_workflow(
-    resume_path: str = "resume.pdf",
-    job_url: str = "https://nvidia.wd5.myworkdayjobs.com/en-US/NVIDIAExternalCareerSite/job/US,-CA,-Santa-Clara/Senior-ASIC-Test-Timing-Engineer_JR2005476?source=Eightfold",
+async def apply_nvidia(
+    page: Page,
+    job_url: str = NVIDIA_JOB_URL,
     first_name: str = "John",
-    last_name: str = "Doe"
-) -> None:
+    last_name: str = "Doe",
+    how_heard: dict | None = None,
+    phone: dict | None = None,
+    work_experiences: list[dict] = DEFAULT_WORK_EXPERIENCES,
+    educations: list[dict] = DEFAULT_EDUCATIONS,
+    linkedin_url: str = "https://www.linkedin.com/in/johndoe",
+    github_url: str = "https://github.com/johndoe",
+) -> WorkdayResult:
     """
-    Run the complete NVIDIA job application workflow.
+    Open the posting, click Apply and fill the application on a given page.
 
     Args:
-        resume_path: Path to the resume file
+        page: Playwright page object (may already be on the posting)
         job_url: The job posting URL
         first_name: Applicant's first name
         last_name: Applicant's last name
-        has_preferred_name: Whether to check the preferred name checkbox
-    """
-    print("=== Starting NVIDIA Application Workflow ===\n")
+        how_heard: Arguments for how_you_heard_about_us; None uses its defaults
+        phone: Arguments for fill_phone_number; None uses its defaults
+        work_experiences: Arguments for fill_work_experience, one dict per entry
+        educations: Arguments for fill_education, one dict per entry
+        linkedin_url: LinkedIn profile URL
+        github_url: GitHub profile URL
 
-    # Connect to browser - all steps share the same page
-    async with async_playwright() as p:
-        browser = await p.chromium.connect_over_cdp(CDP_URL)
-        ctx = browser.contexts[0]
-        page = await ctx.new_page()
+    Returns:
+        WorkdayResult of the step router; not `completed` if it stopped before the review step
+    """
+    how_heard, phone = how_heard or {}, phone or {}
 
-        # Navigate to job posting URL first
+    # Navigate to job posting URL first, unless the page is already on it
+    if not same_posting(page.url, job_url):
         print(f"Navigating to job posting: {job_url}")
         await page.goto(job_url, wait_until="load")
         await page.wait_for_timeout(1500)
-        await page.set_viewport_size({"width": 1508, "height": 859})
-
-        # Click the Apply button
-        print("Clicking Apply button...")
-        apply_button = page.locator('xpath=//div[@id="mainContent"]/div/div[1]/div[1]/div[1]/div/div/div/div/div/a')
-        await apply_button.click()
-        await page.wait_for_timeout(1000)
-
-        # # Step 1: Upload resume
-        # print("Step 1: Uploading resume...")
-        # await upload_resume(
-        #     page=page,
-        #     resume_path=resume_path,
-        # )
-        print("Resume upload complete.\n")
-
-        # Step 2: Fill "How you heard about us"
-        print("Step 2: Filling 'How you heard about us'...")
-        await how_you_heard_about_us(
-            page=page,
-            how_heard="Event/Conference",
-            event_conference="GTC 2025",
-            previous_employee=False,
-        )
-        print("How you heard about us complete.\n")
+    await page.set_viewport_size({"width": 1508, "height": 859})
 
-        # Step 3: Fill personal information
-        print("Step 3: Filling personal information...")
+    # Click the Apply button
+    print("Clicking Apply button...")
+    apply_button = page.locator('xpath=//div[@id="mainContent"]/div/div[1]/div[1]/div[1]/div/div/div/div/div/a')
+    await apply_button.click()
+    await page.wait_for_timeout(1000)
+
+    # # Step 1: Upload resume
+    # print("Step 1: Uploading resume...")
+    # await upload_resume(
+    #     page=page,
+    #     resume_path=resume_path,
+    # )
+    print("Resume upload complete.\n")
+
+    # How you heard, legal name and phone all live on the My Information step
+    async def my_information(page):
+        print("Filling 'How you heard about us'...")
+        await how_you_heard_about_us(page=page, **how_heard)
+        print("Filling personal information...")
         await fill_personal_info(
             page=page,
             first_name=first_name,
             last_name=last_name
         )
-        
-        await fill_phone_number(
-            page=page,
-            phone_device_type="Home",
-            country_phone_code="+1",
-            phone_number="6504443333",
-        )
-        
-        await save_and_continue(
-            page=page,
-        )
+        await fill_phone_number(page=page, **phone)
         print("Personal info complete.\n")
-        
 
-        # First work experience: click "Add" then fill
-        await click_add_work_experience(page)
-        await fill_work_experience(
-            page=page,
-            index=0,
-            job_title="Software Engineer",
-            company_name="NVIDIA",
-            start_month=1,
-            start_year=2024,
-            end_month=1,
-            end_year=2025,
-        )
-        print("Work experience 1 complete.\n")
+    async def my_experience(page):
+        # Work experience: click "Add" for the first entry, "Add Another" for the rest
+        for i, work_experience in enumerate(work_experiences):
+            if i == 0:
+                await click_add_work_experience(page)
+            else:
+                await click_add_another_work_experience(page)
+            await fill_work_experience(
+                page=page,
+                index=0 if i == 0 else -1,
+                **kwargs_for(fill_work_experience, work_experience),
+            )
+            print(f"Work experience {i + 1} complete.\n")
 
-        # Second work experience: click "Add Another" then fill
-        await click_add_another_work_experience(page)
-        await fill_work_experience(
-            page=page,
-            index=-1,
-            job_title="Intern",
-            company_name="Meta",
-            start_month=1,
-            start_year=2020,
-            end_month=1,
-            end_year=2023,
-        )
-        print("Work experience 2 complete.\n")
-        
-        # First education: click "Add" then fill
-        await click_add_education(page)
-        await fill_education(
-            page=page,
-            index=-1,  # Fill the newly added entry
-            school_name="Stanford University",
-            degree="PhD",
-            field_of_study="Computer Science",
-            gpa="3.8",
-            start_year=2020,
-            end_year=2024,
-        )
-        print("Education complete.\n")
+        # Education: click "Add" for the first entry, "Add Another" for the rest
+        for i, education in enumerate(educations):
+            if i == 0:
+                await click_add_education(page)
+            else:
+                await click_add_another_education(page)
+            await fill_education(page=page, **education)  # index=-1: the newly added entry
+            print(f"Education {i + 1} complete.\n")
 
-        # Second education: click "Add Another" then fill
-        await click_add_another_education(page)
-        await fill_education(
-            page=page,
-            index=-1,  # Fill the newly added entry
-            school_name="MIT",
-            degree="PhD",
-            field_of_study="Computer Science",
-            gpa="3.8",
-            start_year=2000,
-            end_year=2005,
-        )
-        print("Education 2 complete.\n")
-        
         await add_urls(
             page=page,
-            linkedin_url="https://www.linkedin.com/in/johndoe",
-            github_url="https://github.com/johndoe",
+            linkedin_url=linkedin_url,
+            github_url=github_url,
         )
         print("URLs complete.\n")
-        
-        await save_and_continue(
-            page=page,
-        )
-        
 
+    # Route on the detected step (the router saves each one); steps without a
+    # handler, such as tenant-specific questions, are traced and stop the run
+    return await run_workday(page, {"my-information": my_information, "my-experience": my_experience})
+
+
+async def nvidia_application_workflow(
+    resume_path: str = "resume.pdf",
+    job_url: str = NVIDIA_JOB_URL,
+    first_name: str = "John",
+    last_name: str = "Doe",
+    profile: Profile | None = None,
+    profile_from_resume_file: bool = False,
+) -> None:
+    """
+    Run the complete NVIDIA job application workflow.
+
+    Args:
+        resume_path: Path to the resume file
+        job_url: The job posting URL
+        first_name: Applicant's first name
+        last_name: Applicant's last name
+        has_preferred_name: Whether to check the preferred name checkbox
+        profile: Applicant profile; when given, its Workday projection supplies the
+            name, phone, work experience, education and URLs
+        profile_from_resume_file: Build the profile from the parsed resume (on top of
+            the sample profile) when no profile is given
+    """
+    if already_applied(job_url):
+        return
+
+    phone = {"phone_device_type": "Home", "country_phone_code": "United States of America (+1)", "phone_number": "6504443333"}
+    work_experiences, educations = DEFAULT_WORK_EXPERIENCES, DEFAULT_EDUCATIONS
+    linkedin_url, github_url = "https://www.linkedin.com/in/johndoe", "https://github.com/johndoe"
+    if profile is None and profile_from_resume_file:
+        profile = profile_from_resume(resume_path, base=json.loads(SAMPLE_PROFILE.read_text()))
+    if profile is not None and os.path.isfile(resume_path):
+        try:
+            print(predict_autofill(parse_resume(resume_path), profile).summary())
+        except (RuntimeError, ValueError) as e:  # pypdf missing, unsupported format
+            print(f"Skipping autofill prediction: {e}")
+
+    if profile is not None:
+        workday = profile.projection("workday")
+        first_name, last_name = workday["first_name"], workday["last_name"]
+        phone = {**phone, **profile.arguments(fill_phone_number, "workday")}
+        work_experiences, educations = workday["work_experiences"], workday["educations"]
+        linkedin_url, github_url = workday["linkedin_url"], workday["github_url"]
+
+    # Check dropdown answers against known option sets before opening a browser
+    how_heard = validate_answers(
+        job_url,
+        how_you_heard_about_us,
+        how_heard="Event/Conference",
+        event_conference="GTC 2025",
+        previous_employee=False,
+    )
+    phone = validate_answers(job_url, fill_phone_number, **phone)
+    educations = [
+        validate_answers(job_url, fill_education, index=-1, **kwargs_for(fill_education, education))
+        for education in educations
+    ]
+
+    print("=== Starting NVIDIA Application Workflow ===\n")
+
+    # Connect to browser - all steps share the same page
+    async with async_playwright() as p, browser_page(p, CDP_URL) as page:
+        page = traced(paced(bounded(page, "workday"), "workday"), "workday", job_url)
+        started = time.perf_counter()
+        await suppress_motion(page)  # Popups open without animating
+
+        async with capture_failures(page, "nvidia"), enforce_deadline(page):
+            result = await apply_nvidia(
+                page,
+                job_url=job_url,
+                first_name=first_name,
+                last_name=last_name,
+                how_heard=how_heard,
+                phone=phone,
+                work_experiences=work_experiences,
+                educations=educations,
+                linkedin_url=linkedin_url,
+                github_url=github_url,
+            )
+        print(f"Visited {result.visited}, stopped at {result.stopped_at}")
+        print(page.pacer.summary(time.perf_counter() - started))
+        page.trace.write(ok=result.completed, error="" if result.completed else f"stopped at {result.stopped_at}")
+        if not result.completed:
+            return
+
+    mark_applied(job_url, status=FILLED)  # Stops before submitting
     print("=== Workflow Complete ===")
 
 
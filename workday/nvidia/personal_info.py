@@ -4,13 +4,19 @@ Playwright Python automation script for Workday job application form filling.
 This script automates filling out a Workday job application form with personal information.
 """
 
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
 from playwright.async_api import Page
+from common.refill import fields_to_fill
 
 
 async def fill_personal_info(
     page: Page,
     first_name: str = "John",
     last_name: str = "Doe",
+    diff: bool = True,
 ) -> None:
     """
     Fill out a Workday job application form with personal information.
@@ -19,18 +25,28 @@ async def fill_personal_info(
         page: Playwright Page object from the workflow
         first_name: The applicant's first name. Defaults to "John".
         last_name: The applicant's last name. Defaults to "Doe".
+        diff: Only write fields whose current value differs (e.g., after resume
+            autofill or a retry); False rewrites both fields
     """
+    fields = {
+        "first_name": ('input[id="name--legalName--firstName"]', first_name),
+        "last_name": ('input[id="name--legalName--lastName"]', last_name),
+    }
+    todo = await fields_to_fill(page, fields) if diff else set(fields)
+
     # Fill in First Name field
-    first_name_input = page.locator('input[id="name--legalName--firstName"]')
-    await first_name_input.click()
-    await first_name_input.fill(first_name)
-    await page.wait_for_timeout(500)
+    if "first_name" in todo:
+        first_name_input = page.locator(fields["first_name"][0])
+        await first_name_input.click()
+        await first_name_input.fill(first_name)
+        await page.wait_for_timeout(500)
 
     # Fill in Last Name field
-    last_name_input = page.locator('input[id="name--legalName--lastName"]')
-    await last_name_input.click()
-    await last_name_input.fill(last_name)
-    await page.wait_for_timeout(500)
+    if "last_name" in todo:
+        last_name_input = page.locator(fields["last_name"][0])
+        await last_name_input.click()
+        await last_name_input.fill(last_name)
+        await page.wait_for_timeout(500)
 
     # Scroll to the preferred name checkbox
     await page.wait_for_timeout(300)
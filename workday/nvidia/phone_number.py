@@ -5,14 +5,20 @@ This script automates filling out the phone contact information section
 of a Workday job application.
 """
 
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
 from playwright.async_api import Page
+from common.motion import wait_until_settled
+from common.option_sets import record_open_options
 from .utils import clear_chip_field_by_input_id
 
 
 async def fill_phone_number(
     page: Page,
     phone_device_type: str = "Home",
-    country_phone_code: str = "+1",
+    country_phone_code: str = "United States of America (+1)",
     phone_number: str = "3334445555",
 ) -> None:
     """
@@ -20,16 +26,18 @@ async def fill_phone_number(
 
     Args:
         page: Playwright Page object from the workflow
-        phone_device_type: Type of phone device (default: "Home").
-                          Options: "Home", "Home Cellular"
-        country_phone_code: Country phone code prefix (default: "+1").
+        phone_device_type: Type of phone device, as labelled in the picker (default: "Home")
+        country_phone_code: Country phone code option as shown in the picker
+                            (default: "United States of America (+1)"); a bare
+                            prefix such as "+44" picks the first option ending in "(+44)"
         phone_number: The phone number to enter (default: "3334445555")
     """
     # Step 1: Select Phone Device Type
     print("Selecting phone device type...")
     phone_type_button = page.locator('xpath=//button[@id="phoneNumber--phoneType"]')
     await phone_type_button.click()
-    await page.wait_for_timeout(500)
+    await wait_until_settled(page)
+    await record_open_options(page, "phone_device_type")  # Learn the full list once per tenant
 
     # Find and click the matching device type option
     device_option = page.locator(f'//li/div[text()="{phone_device_type}"]').first
@@ -46,16 +54,20 @@ async def fill_phone_number(
     # Click on the country code input
     country_code_input = page.locator("//input[@id='phoneNumber--countryPhoneCode']")
     await country_code_input.click()
-    await page.wait_for_timeout(500)
+    await wait_until_settled(page)
 
-    # Type "united" to filter options and press Enter to search
-    await country_code_input.fill("united")
+    # Search by country name when the option label is known, else by the prefix itself
+    if "(" in country_phone_code:
+        search, option_text = country_phone_code.split(" (")[0], country_phone_code
+    else:
+        search, option_text = country_phone_code, f"({country_phone_code})"
+    await country_code_input.fill(search)
     await page.keyboard.press("Enter")
     await page.wait_for_timeout(500)
 
     # Step 3: Select from Country Dropdown
     print("Selecting country from dropdown...")
-    dropdown_option = page.locator("//div[@role='option']").filter(has_text="United States of America (+1)").first
+    dropdown_option = page.locator("//div[@role='option']").filter(has_text=option_text).first
     await dropdown_option.click()
     print("Country code selected.")
     await page.wait_for_timeout(500)
@@ -2,32 +2,30 @@
 Save and Continue button click automation for Workday job application.
 """
 
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
 from playwright.async_api import Page
+from common.workday import save_and_continue as save_step
 
 
-async def save_and_continue(page: Page) -> None:
+async def save_and_continue(page: Page) -> str:
     """
     Click the 'Save and Continue' button to proceed to the next step.
 
+    Waits for the save response and the next step's heading instead of fixed
+    sleeps; Playwright scrolls the button into view itself.
+
     Args:
         page: Playwright Page object from the workflow
-    """
-    # Scroll down to see the Save and Continue button
-    await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-    await page.wait_for_timeout(500)
-
-    # Find the "Save and Continue" button
-    save_button = page.get_by_role("button", name="Save and Continue")
 
-    # Wait for the button to be visible
-    await save_button.wait_for(state="visible", timeout=3000)
-    await save_button.click()
-
-    # Wait for the form submission and navigation
-    await page.wait_for_timeout(1000)
-
-    # Scroll back to the top of the page
-    await page.evaluate("window.scrollTo(0, 0)")
-    await page.wait_for_timeout(500)
+    Returns:
+        Heading of the next step
 
+    Raises:
+        WorkdaySaveError: If Workday rejected the step with validation errors
+    """
+    next_step = await save_step(page)
     print("Successfully clicked 'Save and Continue' button.")
+    return next_step
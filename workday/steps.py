@@ -0,0 +1,153 @@
+"""
+Workday application step detector and router.
+
+Tenants order the application flow differently and add their own steps
+(application questions, voluntary disclosures, self-identify). Instead of
+assuming a fixed sequence, the router reads the progress bar and the page's
+data-automation-id markers in one call, dispatches the matching handler,
+saves the step, and traces any step it does not recognise or has no handler
+for, so a run stops at the right place instead of stalling on a selector
+from another page.
+"""
+
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Awaitable, Callable
+
+from playwright.async_api import Page
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.run_trace import trace_step
+from common.step_trace import record_unknown_step
+from common.workday import FieldError, WorkdaySaveError, save_and_continue
+
+Handler = Callable[[Page], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class WorkdayStep:
+    """A Workday application step and how to recognise it."""
+
+    name: str
+    marker: str = ""  # data-automation-id of the step's page container
+    headings: tuple[str, ...] = ()  # Lower-case progress bar labels used by tenants
+
+
+# Markers are checked before headings: tenants rename progress bar labels
+WORKDAY_STEPS = (
+    WorkdayStep("sign-in", marker="signInContent", headings=("sign in", "create account")),
+    WorkdayStep("autofill", marker="applyFlowAutoFillPage", headings=("autofill with resume", "quick apply")),
+    WorkdayStep("my-information", marker="applyFlowMyInfoPage", headings=("my information",)),
+    WorkdayStep("my-experience", marker="applyFlowMyExpPage", headings=("my experience",)),
+    WorkdayStep("application-questions", marker="applyFlowPrimaryQuestionsPage", headings=("application questions",)),
+    WorkdayStep("voluntary-disclosures", marker="applyFlowVoluntaryDisclosuresPage", headings=("voluntary disclosures",)),
+    WorkdayStep("self-identify", marker="applyFlowSelfIdentifyPage", headings=("self identify", "self-identify")),
+    WorkdayStep("review", marker="applyFlowReviewPage", headings=("review",)),
+)
+
+# The flow stops (without submitting) when one of these is reached
+STOP_STEPS = ("review",)
+
+# One evaluate returns the active progress bar label, step position and present markers
+DETECT_JS = """(markers) => {
+    const active = document.querySelector('[data-automation-id="progressBarActiveStep"]');
+    const steps = [...document.querySelectorAll('[data-automation-id^="progressBar"] li, [data-automation-id="progressBarStep"]')];
+    return {
+        path: location.pathname,
+        heading: active ? active.innerText.trim() : '',
+        position: active ? steps.findIndex(step => step.contains(active)) + 1 : 0,
+        total: steps.length,
+        present: markers.filter(marker => document.querySelector(`[data-automation-id="${marker}"]`)),
+    };
+}"""
+
+MARKERS = [step.marker for step in WORKDAY_STEPS if step.marker]
+
+
+@dataclass
+class WorkdayResult:
+    """Outcome of a router run."""
+
+    visited: list[str] = field(default_factory=list)
+    stopped_at: str | None = None
+    trace_path: str | None = None
+    errors: list[FieldError] = field(default_factory=list)
+
+    @property
+    def completed(self) -> bool:
+        return self.stopped_at in STOP_STEPS
+
+
+async def detect_step(page: Page) -> tuple[WorkdayStep | None, dict]:
+    """
+    Detect the current Workday application step in one call.
+
+    Args:
+        page: Playwright page object inside a Workday application
+
+    Returns:
+        Tuple of (matching step or None, raw detection data)
+    """
+    detected = await page.evaluate(DETECT_JS, MARKERS)
+    for step in WORKDAY_STEPS:
+        if step.marker and step.marker in detected["present"]:
+            return step, detected
+    heading = detected["heading"].casefold()
+    for step in WORKDAY_STEPS:
+        if any(label in heading for label in step.headings):
+            return step, detected
+    return None, detected
+
+
+async def run_workday(page: Page, handlers: dict[str, Handler], max_steps: int = 12) -> WorkdayResult:
+    """
+    Drive a Workday application step by step until the review page.
+
+    Each handler fills its step's fields; the router then saves the step and
+    waits for the next one (see common.workday.save_and_continue).
+
+    Args:
+        page: Playwright page object on the first application step
+        handlers: Map of step name (e.g., "my-information") to an async handler
+        max_steps: Safety cap on the number of steps to walk through
+
+    Returns:
+        WorkdayResult with the visited steps, where the run stopped and any
+        validation errors from a rejected save
+    """
+    result = WorkdayResult()
+
+    for _ in range(max_steps):
+        step, detected = await detect_step(page)
+
+        if step is None:
+            result.trace_path = await record_unknown_step("workday", page, "unknown step", detected)
+            result.stopped_at = "unknown"
+            return result
+
+        print(f"Workday step: {step.name} ({detected['position']}/{detected['total']})")
+        if step.name in STOP_STEPS:
+            result.stopped_at = step.name
+            return result
+
+        handler = handlers.get(step.name)
+        if handler is None:
+            result.trace_path = await record_unknown_step("workday", page, f"no handler for {step.name}", detected)
+            result.stopped_at = step.name
+            return result
+
+        with trace_step(page, step.name):
+            await handler(page)
+            result.visited.append(step.name)
+            try:
+                await save_and_continue(page)
+            except WorkdaySaveError as error:
+                result.trace_path = await record_unknown_step("workday", page, f"save rejected on {step.name}", detected)
+                result.stopped_at = step.name
+                result.errors = error.errors
+                print(error)
+                return result
+
+    result.stopped_at = "max-steps"
+    return result